@@ -1,12 +1,16 @@
 from ninja.security import HttpBearer
 
-from core.apps.customers.models import Customer
+from core.apps.customers.exceptions.tokens import TokenException
+from core.apps.customers.services.tokens import BaseTokenService
+from core.project.ioc_containers import get_ioc_container
 
 
 class TokenAuth(HttpBearer):
     def authenticate(self, request, token: str):
+        ioc_container = get_ioc_container()
+        service = ioc_container.resolve(BaseTokenService)
+
         try:
-            customer = Customer.objects.get(token=token)
-            return customer.to_entity()
-        except Customer.DoesNotExist:
+            return service.get_customer(access_token=token)
+        except TokenException:
             return None
@@ -0,0 +1,49 @@
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+
+from core.api.metrics import RESPONSE_CACHE_LOOKUPS
+
+
+class ResponseCache:
+    """
+    Rendered responses of customer read endpoints, stored under their ETags.
+
+    The ETag covers the customer, the customer's data version and the path with its filters
+    and pagination, so a write makes every response cached for the customer unreachable without
+    deleting or scanning keys. Unreachable entries age out of the size-bounded `responses` cache.
+
+    Data versions are read from the shared default cache, so the `responses` cache itself may be
+    local to each worker: a worker that missed a write made through another one builds the new
+    ETag and never reaches its own older entries. Hits, misses and skipped responses are counted
+    in the `response_cache_lookups_total` metric.
+    """
+    CACHE_ALIAS = 'responses'
+
+    def __init__(self, max_item_size: Optional[int] = None, cache_alias: str = CACHE_ALIAS):
+        self.max_item_size = max_item_size if max_item_size is not None else settings.RESPONSE_CACHE_MAX_ITEM_BYTES
+        self.cache_alias = cache_alias
+
+    def _get_key(self, etag: str) -> str:
+        return 'responses:' + etag.strip('"')
+
+    async def get(self, etag: str) -> Optional[HttpResponse]:
+        entry = await caches[self.cache_alias].aget(self._get_key(etag))
+        if entry is None:
+            RESPONSE_CACHE_LOOKUPS.labels(self.cache_alias, 'miss').inc()
+            return None
+
+        RESPONSE_CACHE_LOOKUPS.labels(self.cache_alias, 'hit').inc()
+        content_type, content = entry
+
+        return HttpResponse(content, content_type=content_type)
+
+    async def set(self, etag: str, response: HttpResponse) -> None:
+        # Large pages would push many small ones out of the bounded cache.
+        if len(response.content) > self.max_item_size:
+            RESPONSE_CACHE_LOOKUPS.labels(self.cache_alias, 'skipped').inc()
+            return
+
+        await caches[self.cache_alias].aset(self._get_key(etag), (response['Content-Type'], response.content))
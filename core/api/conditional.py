@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from hashlib import blake2b
+from typing import Any, Optional
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+from core.api.caching import ResponseCache
+from core.apps.budgets.services.catalogs import CurrencyCatalog
+from core.apps.budgets.services.rates import ExchangeRateCatalog
+from core.apps.customers.services.versions import BaseAsyncDataVersionService
+from core.project.ioc_containers import get_ioc_container
+
+
+@dataclass(frozen=True)
+class Validators:
+    """
+    ETag and Last-Modified of a response, known before the response itself is built.
+
+    The ETag is authoritative: Last-Modified has a one second resolution and only answers
+    clients that do not send If-None-Match.
+    """
+    etag: str
+    last_modified: Optional[int] = None
+    is_public: bool = False
+
+    def get_not_modified_response(self, request: HttpRequest) -> Optional[HttpResponseBase]:
+        response = get_conditional_response(request, etag=self.etag, last_modified=self.last_modified)
+
+        return self.apply(response) if response is not None else None
+
+    def apply(self, response: HttpResponseBase) -> HttpResponseBase:
+        response['ETag'] = self.etag
+        if self.last_modified is not None:
+            response['Last-Modified'] = http_date(self.last_modified)
+
+        if self.is_public:
+            patch_cache_control(response, public=True, max_age=settings.CURRENCY_CACHE_MAX_AGE)
+        else:
+            # Clients keep the response but revalidate it on every use, shared caches never store it.
+            patch_cache_control(response, private=True, no_cache=True)
+            patch_vary_headers(response, ('Authorization',))
+
+        return response
+
+
+def _build_etag(*parts: Any) -> str:
+    return quote_etag(blake2b(repr(parts).encode(), digest_size=16).hexdigest())
+
+
+async def get_customer_validators(request: HttpRequest, *scope: Any) -> Validators:
+    """
+    Validators of a response built only from the data of the authenticated customer,
+    derived from the customer's data version without querying the database.
+
+    `scope` takes anything else the response depends on, e.g. the current day.
+    """
+    service = get_ioc_container().resolve(BaseAsyncDataVersionService)
+    version = await service.get_version(request.auth.id)
+
+    return Validators(
+        etag=_build_etag(request.auth.id, version.tag, request.get_full_path(), *scope),
+        last_modified=version.modified_at,
+    )
+
+
+async def get_currency_validators(request: HttpRequest) -> Validators:
+    """
+    Validators of a response built from the currency catalog, the same for every customer.
+    """
+    catalog = get_ioc_container().resolve(CurrencyCatalog)
+    await catalog.aget_snapshot()
+
+    return Validators(
+        etag=_build_etag(catalog.version, request.get_full_path()),
+        is_public=True,
+    )
+
+
+async def get_catalog_versions() -> tuple[Optional[str], Optional[str]]:
+    """
+    Versions of the currency and exchange rate catalogs, checked first, as a validator scope of
+    responses computed from them. Rates loaded for all customers move both the customer versions
+    and the catalog version, and a worker may see the first before its catalog reloads; with the
+    catalog version in the ETag, a response computed from the previous rates is never cached
+    under the ETag of the new ones.
+    """
+    ioc_container = get_ioc_container()
+    currency_catalog = ioc_container.resolve(CurrencyCatalog)
+    exchange_rate_catalog = ioc_container.resolve(ExchangeRateCatalog)
+    await currency_catalog.aget_snapshot()
+    await exchange_rate_catalog.aget_snapshot()
+
+    return currency_catalog.version, exchange_rate_catalog.version
+
+
+async def get_cached_response(request: HttpRequest, validators: Validators) -> Optional[HttpResponseBase]:
+    """
+    Return 304 when the client holds the current response, the cached response when there is one.
+    """
+    not_modified = validators.get_not_modified_response(request)
+    if not_modified is not None:
+        return not_modified
+
+    response = await get_ioc_container().resolve(ResponseCache).get(validators.etag)
+
+    return validators.apply(response) if response is not None else None
+
+
+async def cache_response(validators: Validators, response: HttpResponse) -> HttpResponseBase:
+    await get_ioc_container().resolve(ResponseCache).set(validators.etag, response)
+
+    return validators.apply(response)
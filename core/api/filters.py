@@ -1,12 +1,72 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.db.models import Q
 from ninja import Schema
+from pydantic import field_validator
+
+
+@dataclass(frozen=True)
+class PaginationCursor:
+    """
+    Opaque keyset position of the last row on a page ordered by (-created_at, -id).
+    """
+    created_at: datetime
+    id: int
+
+    def encode(self) -> str:
+        payload = json.dumps([self.created_at.isoformat(), self.id], separators=(',', ':'))
+        return urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, token: str) -> 'PaginationCursor':
+        try:
+            created_at, row_id = json.loads(urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+            return cls(created_at=datetime.fromisoformat(created_at), id=int(row_id))
+        except (ValueError, TypeError) as exception:
+            raise ValueError('Invalid pagination cursor') from exception
+
+    def to_query(self) -> Q:
+        # Equivalent of (created_at, id) < (cursor.created_at, cursor.id); the leading
+        # created_at bound keeps the predicate usable as an index range condition.
+        return Q(created_at__lte=self.created_at) & (
+            Q(created_at__lt=self.created_at) | Q(id__lt=self.id)
+        )
+
+
+def get_next_cursor(items: list, limit: int, has_more: bool | None = None) -> str | None:
+    if not items or len(items) < limit or has_more is False:
+        return None
+
+    last_item = items[-1]
+    if isinstance(last_item, dict):
+        return PaginationCursor(created_at=last_item['created_at'], id=last_item['id']).encode()
+
+    return PaginationCursor(created_at=last_item.created_at, id=last_item.id).encode()
 
 
 class PaginationOut(Schema):
     offset: int
     limit: int
-    total: int
+    total: int | None = None
+    has_more: bool | None = None
+    next_cursor: str | None = None
 
 
 class PaginationIn(Schema):
     offset: int = 0
     limit: int = 20
+    cursor: str | None = None
+    has_more: bool = False
+
+    @field_validator('cursor')
+    @classmethod
+    def validate_cursor(cls, value: str | None) -> str | None:
+        if value is not None:
+            PaginationCursor.decode(value)
+        return value
+
+    def get_cursor(self) -> PaginationCursor | None:
+        return PaginationCursor.decode(self.cursor) if self.cursor is not None else None
@@ -0,0 +1,266 @@
+import os
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import monotonic, perf_counter
+from typing import Any, Callable, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.crypto import constant_time_compare
+from ninja.operation import Operation
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+from prometheus_client.exposition import CONTENT_TYPE_LATEST
+
+from core.apps.common.databases import get_connection_pool_stats
+
+LABELS = ('operation', 'method', 'status')
+# Requests that resolve to no URL share one label value, whatever their path.
+UNMATCHED_OPERATION = 'unmatched'
+KNOWN_METHODS = frozenset({'GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'})
+# Seconds between updates of the connection pool gauges of a worker.
+POOL_METRICS_INTERVAL = 1.0
+
+REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds',
+    'Time from the request reaching the middleware to the response leaving it.',
+    LABELS,
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0),
+)
+REQUEST_QUERIES = Histogram(
+    'http_request_db_queries',
+    'SQL queries run while handling a request.',
+    LABELS,
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+REQUEST_DB_SECONDS = Counter(
+    'http_request_db_seconds',
+    'Time spent in SQL queries while handling requests.',
+    LABELS,
+)
+RESPONSE_SIZE = Histogram(
+    'http_response_size_bytes',
+    'Size of response bodies, streamed responses are left out.',
+    LABELS,
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+)
+RESPONSE_CACHE_LOOKUPS = Counter(
+    'response_cache_lookups',
+    'Lookups and stores of the server-side response cache, by cache alias and outcome: hit, miss, or skipped '
+    'for responses too large to store.',
+    ('cache', 'outcome'),
+)
+THROTTLED_REQUESTS = Counter(
+    'api_throttled_requests',
+    'Requests rejected by rate limits, by throttle scope.',
+    ('scope',),
+)
+
+# Pools belong to worker processes, each worker exports its own series with a pid label.
+POOL_CONNECTIONS = Gauge(
+    'db_pool_connections',
+    'Connections held by the database connection pool of a worker, by state.',
+    ('alias', 'state'),
+    multiprocess_mode='liveall',
+)
+POOL_MAX_CONNECTIONS = Gauge(
+    'db_pool_max_connections',
+    'Connections the database connection pool of a worker may open.',
+    ('alias',),
+    multiprocess_mode='liveall',
+)
+POOL_WAITING_REQUESTS = Gauge(
+    'db_pool_waiting_requests',
+    'Requests waiting for a connection from the pool of a worker.',
+    ('alias',),
+    multiprocess_mode='liveall',
+)
+POOL_REQUESTS = Gauge(
+    'db_pool_requests',
+    'Connections handed out by the pool of a worker since it was created.',
+    ('alias',),
+    multiprocess_mode='liveall',
+)
+POOL_WAIT_SECONDS = Gauge(
+    'db_pool_wait_seconds',
+    'Time requests waited for a connection from the pool of a worker since it was created.',
+    ('alias',),
+    multiprocess_mode='liveall',
+)
+POOL_ERRORS = Gauge(
+    'db_pool_errors',
+    'Requests for a connection the pool of a worker failed since it was created.',
+    ('alias',),
+    multiprocess_mode='liveall',
+)
+
+
+def update_pool_metrics() -> None:
+    for stats in get_connection_pool_stats():
+        POOL_CONNECTIONS.labels(stats.alias, 'in_use').set(stats.in_use)
+        POOL_CONNECTIONS.labels(stats.alias, 'idle').set(stats.idle)
+        POOL_MAX_CONNECTIONS.labels(stats.alias).set(stats.max_size)
+        POOL_WAITING_REQUESTS.labels(stats.alias).set(stats.waiting)
+        POOL_REQUESTS.labels(stats.alias).set(stats.requests)
+        POOL_WAIT_SECONDS.labels(stats.alias).set(stats.wait_ms / 1000)
+        POOL_ERRORS.labels(stats.alias).set(stats.errors)
+
+
+@dataclass
+class RequestDatabaseStats:
+    queries: int = 0
+    seconds: float = 0.0
+
+
+_operation_ids: dict[Operation, str] = {}
+_database_stats: ContextVar[Optional[RequestDatabaseStats]] = ContextVar('request_database_stats', default=None)
+
+
+def record_query(execute: Callable, sql: str, params: Any, many: bool, context: dict) -> Any:
+    """
+    Database execute wrapper adding the query to the stats of the current request, if any.
+
+    Queries of async handlers run in executor threads, which inherit the request's context.
+    """
+    stats = _database_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+
+    started_at = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.queries += 1
+        stats.seconds += perf_counter() - started_at
+
+
+def install_query_recorder(connection: BaseDatabaseWrapper) -> None:
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+@receiver(connection_created)
+def install_query_recorder_on_connect(sender, connection: BaseDatabaseWrapper, **kwargs) -> None:
+    install_query_recorder(connection)
+
+
+def _get_operation_id(operation: Operation) -> str:
+    operation_id = _operation_ids.get(operation)
+    if operation_id is None:
+        operation_id = operation.operation_id or operation.api.get_openapi_operation_id(operation)
+        _operation_ids[operation] = operation_id
+
+    return operation_id
+
+
+def _get_operation(request: HttpRequest) -> str:
+    """
+    The OpenAPI operation ID of the django-ninja operation handling the request, the view name outside the API.
+    """
+    match = request.resolver_match
+    if match is None:
+        return UNMATCHED_OPERATION
+
+    # django-ninja routes one view per path to the operation of the request method.
+    path_view = getattr(match.func, '__self__', None)
+    for operation in getattr(path_view, 'operations', ()):
+        if request.method in operation.methods:
+            return _get_operation_id(operation)
+
+    return match.view_name or UNMATCHED_OPERATION
+
+
+class MetricsMiddleware:
+    """
+    Records duration, SQL queries and time, and response size of every request, labelled by
+    operation, method and status class.
+
+    Labels only take values from the URL configuration, so their number stays bounded.
+    Durations of streamed responses end when streaming starts.
+
+    A scrape reaches one worker only, so every worker also refreshes its connection pool gauges
+    after its requests, at most every POOL_METRICS_INTERVAL seconds.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable):
+        self.get_response = get_response
+        self.pool_metrics_updated_at = float('-inf')
+        # Connections opened before the middleware was loaded missed connection_created.
+        for connection in connections.all(initialized_only=True):
+            install_query_recorder(connection)
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def _observe(
+        self, request: HttpRequest, response: HttpResponseBase, started_at: float, stats: RequestDatabaseStats
+    ) -> None:
+        # Unknown methods fall into one label value like unresolved paths.
+        method = request.method if request.method in KNOWN_METHODS else 'other'
+        labels = (_get_operation(request), method, f'{response.status_code // 100}xx')
+
+        REQUEST_DURATION.labels(*labels).observe(perf_counter() - started_at)
+        REQUEST_QUERIES.labels(*labels).observe(stats.queries)
+        REQUEST_DB_SECONDS.labels(*labels).inc(stats.seconds)
+        if not response.streaming:
+            RESPONSE_SIZE.labels(*labels).observe(len(response.content))
+
+        if monotonic() - self.pool_metrics_updated_at >= POOL_METRICS_INTERVAL:
+            self.pool_metrics_updated_at = monotonic()
+            update_pool_metrics()
+
+    def __call__(self, request: HttpRequest):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        stats = RequestDatabaseStats()
+        token = _database_stats.set(stats)
+        started_at = perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _database_stats.reset(token)
+
+        self._observe(request, response, started_at, stats)
+        return response
+
+    async def __acall__(self, request: HttpRequest):
+        stats = RequestDatabaseStats()
+        token = _database_stats.set(stats)
+        started_at = perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _database_stats.reset(token)
+
+        self._observe(request, response, started_at, stats)
+        return response
+
+
+def get_registry() -> CollectorRegistry:
+    """
+    The registry of this process, or of all worker processes when they share PROMETHEUS_MULTIPROC_DIR.
+    """
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    if settings.METRICS_TOKEN and not constant_time_compare(
+        request.headers.get('Authorization', ''), f'Bearer {settings.METRICS_TOKEN}'
+    ):
+        return HttpResponse(status=401)
+
+    update_pool_metrics()
+    return HttpResponse(generate_latest(get_registry()), content_type=CONTENT_TYPE_LATEST)
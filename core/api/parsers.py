@@ -0,0 +1,132 @@
+import codecs
+import json
+import re
+from typing import Any, Iterator, Protocol
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+NDJSON_CONTENT_TYPES = ('application/x-ndjson', 'application/ndjson', 'application/jsonl', 'application/x-jsonlines')
+# Largest single item kept in memory while it is decoded, in characters (NDJSON: bytes per line).
+MAX_ITEM_SIZE = 64 * 1024
+
+
+class PayloadError(ValueError):
+    pass
+
+
+class ReadableStream(Protocol):
+    def read(self, size: int = ...) -> bytes:
+        ...
+
+    def readline(self, size: int = ...) -> bytes:
+        ...
+
+    def __iter__(self) -> Iterator[bytes]:
+        ...
+
+
+def iter_ndjson(stream: ReadableStream, max_item_size: int = MAX_ITEM_SIZE) -> Iterator[Any]:
+    """
+    Yield one decoded value per non-empty line, reading the stream line by line.
+    """
+    lines = iter(lambda: stream.readline(max_item_size + 1), b'')
+    for line_number, line in enumerate(lines, start=1):
+        if len(line) > max_item_size and not line.endswith(b'\n'):
+            raise PayloadError(f'Line {line_number} is longer than {max_item_size} bytes.')
+        if not line.strip():
+            continue
+
+        try:
+            yield json.loads(line)
+        except ValueError as exception:
+            raise PayloadError(f'Malformed JSON on line {line_number}.') from exception
+
+
+def iter_json_array(
+        stream: ReadableStream,
+        chunk_size: int = 64 * 1024,
+        max_item_size: int = MAX_ITEM_SIZE
+) -> Iterator[Any]:
+    """
+    Yield the items of a top level JSON array while reading the stream in chunks,
+    so only the current chunk and the item being decoded are held in memory.
+
+    An item that does not decode within max_item_size characters is rejected rather than
+    buffering the rest of the stream in search of its end.
+    """
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    json_decoder = json.JSONDecoder()
+    buffer, position, eof = '', 0, False
+
+    def read_more() -> bool:
+        nonlocal buffer, position, eof
+        if eof:
+            return False
+
+        chunk = stream.read(chunk_size)
+        eof = not chunk
+        try:
+            buffer = buffer[position:] + text_decoder.decode(chunk, final=eof)
+        except UnicodeDecodeError as exception:
+            raise PayloadError('Payload is not valid UTF-8.') from exception
+        position = 0
+        return not eof
+
+    def peek() -> str:
+        nonlocal position
+        while True:
+            position = WHITESPACE.match(buffer, position).end()
+            if position < len(buffer):
+                return buffer[position]
+            if not read_more():
+                raise PayloadError('Unexpected end of JSON array.')
+
+    if peek() != '[':
+        raise PayloadError('Expected a JSON array.')
+    position += 1
+
+    if peek() == ']':
+        position += 1
+    else:
+        while True:
+            peek()
+            while True:
+                try:
+                    item, end = json_decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError as exception:
+                    if len(buffer) - position > max_item_size:
+                        raise PayloadError(
+                            f'Malformed JSON array: item not complete within {max_item_size} characters.'
+                        ) from exception
+                    if not read_more():
+                        raise PayloadError(f'Malformed JSON array: {exception.msg}.') from exception
+                    continue
+
+                # A value ending exactly at the end of the buffer may be a truncated number.
+                if end == len(buffer) and read_more():
+                    continue
+                break
+
+            position = end
+            yield item
+
+            separator = peek()
+            position += 1
+            if separator == ']':
+                break
+            if separator != ',':
+                raise PayloadError('Expected "," or "]" in JSON array.')
+
+    while True:
+        position = WHITESPACE.match(buffer, position).end()
+        if position < len(buffer):
+            raise PayloadError('Unexpected data after JSON array.')
+        if not read_more():
+            return
+
+
+def iter_payload_items(stream: ReadableStream, content_type: str) -> Iterator[Any]:
+    if content_type in NDJSON_CONTENT_TYPES:
+        return iter_ndjson(stream)
+
+    return iter_json_array(stream)
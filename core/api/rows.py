@@ -0,0 +1,106 @@
+import dataclasses
+import types
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Mapping, Optional, Union, get_args, get_origin, get_type_hints
+
+from django.http import HttpRequest, HttpResponse
+from ninja import NinjaAPI
+from pydantic import BaseModel
+
+
+@dataclass(frozen=True)
+class RowSerializer:
+    """
+    Builds the dict a response schema would dump straight from a flat ``values()`` row.
+
+    Keys follow the field order of the schema and of its nested entity dataclasses, so the rendered
+    JSON is identical to the one of the validated schema. Values are trusted as they come
+    from the database, nothing is validated or coerced.
+    """
+    fields: tuple[tuple[str, Union[str, 'RowSerializer']], ...]
+    null_lookup: Optional[str] = None
+
+    def get_lookups(self, exclude: tuple[str, ...] = ()) -> list[str]:
+        lookups = []
+
+        for name, field in self.fields:
+            if name in exclude:
+                continue
+
+            if isinstance(field, RowSerializer):
+                lookups.extend(field.get_lookups())
+            else:
+                lookups.append(field)
+
+        return lookups
+
+    def build(self, row: Mapping[str, Any], **known: Any) -> Optional[dict]:
+        """
+        Build the item of a row, ``known`` items (e.g. the parent budget of budget operations)
+        are placed as is instead of being read from the row.
+        """
+        if self.null_lookup is not None and row[self.null_lookup] is None:
+            return None
+
+        item = {}
+        for name, field in self.fields:
+            if name in known:
+                item[name] = known[name]
+            elif isinstance(field, RowSerializer):
+                item[name] = field.build(row)
+            else:
+                item[name] = row[field]
+
+        return item
+
+
+def _get_nested_type(annotation: Any) -> Optional[type]:
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else None
+
+    if dataclasses.is_dataclass(annotation) or (isinstance(annotation, type) and issubclass(annotation, BaseModel)):
+        return annotation
+
+    return None
+
+
+def _get_annotations(cls: type) -> dict[str, Any]:
+    if issubclass(cls, BaseModel):
+        return {name: field.annotation for name, field in cls.model_fields.items()}
+
+    type_hints = get_type_hints(cls)
+    return {field.name: type_hints[field.name] for field in dataclasses.fields(cls)}
+
+
+def _compile(cls: type, prefix: str = '') -> RowSerializer:
+    fields = []
+
+    for name, annotation in _get_annotations(cls).items():
+        nested_type = _get_nested_type(annotation)
+
+        if nested_type is None:
+            fields.append((name, f'{prefix}{name}'))
+        else:
+            fields.append((name, _compile(nested_type, f'{prefix}{name}__')))
+
+    return RowSerializer(fields=tuple(fields), null_lookup=f'{prefix}id' if prefix else None)
+
+
+@lru_cache
+def compile_row_serializer(cls: type) -> RowSerializer:
+    """
+    Compile once per schema: nested entities become ``__`` lookups of the related model,
+    which works as long as entity field names follow the model field names.
+    A nested entity whose id is null, i.e. an unset relation, is built as None.
+    """
+    return _compile(cls)
+
+
+def render_api_response(api: NinjaAPI, request: HttpRequest, data: Any, status: int = 200) -> HttpResponse:
+    """
+    Render already dumped data in the ``ApiResponse`` envelope with the renderer of the api,
+    skipping response schema validation.
+    """
+    return api.create_response(request, {'data': data, 'meta': {}, 'errors': []}, status=status)
@@ -20,6 +20,10 @@ class ListPaginatedResponse(Schema, Generic[TListItem]):
     pagination: PaginationOut
 
 
+class ListResponse(Schema, Generic[TListItem]):
+    items: list[TListItem]
+
+
 class DetailResponse(Schema, Generic[TDetailItem]):
     item: TDetailItem
 
@@ -0,0 +1,158 @@
+import hashlib
+import json
+import math
+import re
+from functools import wraps
+from time import time
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest
+from ninja.errors import Throttled
+from ninja.throttling import BaseThrottle
+
+from core.api.metrics import THROTTLED_REQUESTS
+
+RATE_PATTERN = re.compile(r'^(\d+)/(\d*)([smhd])$')
+PERIOD_SECONDS = {'s': 1, 'm': 60, 'h': 60 * 60, 'd': 24 * 60 * 60}
+
+TAsyncHandler = TypeVar('TAsyncHandler', bound=Callable[..., Awaitable[Any]])
+
+# ninja's client address resolution, honouring NINJA_NUM_PROXIES.
+_get_client_ident = BaseThrottle().get_ident
+
+
+def parse_rate(rate: str) -> tuple[int, int]:
+    """
+    Parse "<requests>/<period>" rates such as "5/h" or "30/10m" into requests and seconds.
+    """
+    match = RATE_PATTERN.match(rate)
+    if match is None:
+        raise ValueError(f'Invalid throttle rate "{rate}", expected e.g. "5/h" or "30/10m".')
+
+    requests, multiplier, period = match.groups()
+    return int(requests), int(multiplier or 1) * PERIOD_SECONDS[period]
+
+
+class TokenBucketThrottle:
+    """
+    Token bucket kept in the shared cache as the time the bucket is full again (GCRA).
+
+    The bucket holds as many tokens as the rate allows per period and refills evenly.
+    A request moves the stored time one token ahead with an atomic `incr` and is rejected,
+    moving it back, when that puts the time more than a full bucket ahead of now. An idle bucket
+    is reset to now; concurrent requests resetting the same bucket may each be let in.
+    Rates come from the ``API_THROTTLE_RATES`` setting by scope.
+
+    Instances are shared by all requests of a handler and keep no per-request state.
+    Apply them with the `throttle` decorator, not ninja's `throttle=` argument: ninja checks
+    throttles synchronously, on the event loop of async handlers.
+    """
+
+    def __init__(self, scope: str, rate: Optional[str] = None):
+        self.scope = scope
+        requests, period = parse_rate(rate or settings.API_THROTTLE_RATES[scope])
+        self.interval = period * 1000 // requests
+        self.capacity = self.interval * requests
+
+    def get_bucket_ident(self, request: HttpRequest) -> Optional[str]:
+        """
+        Identify the bucket of the request, None leaves the request unthrottled.
+        """
+        raise NotImplementedError('.get_bucket_ident() must be overridden')
+
+    def _get_cache_key(self, ident: str) -> str:
+        return f'throttle:{self.scope}:{hashlib.md5(ident.encode()).hexdigest()}'
+
+    def take_token(self, request: HttpRequest) -> Optional[float]:
+        """
+        Take a token from the request's bucket. Return None when the request is allowed,
+        otherwise the seconds until a token is available.
+        """
+        ident = self.get_bucket_ident(request)
+        if ident is None:
+            return None
+
+        key = self._get_cache_key(ident)
+        now = int(time() * 1000)
+
+        # Only the synchronous `incr` is atomic on every backend, async `aincr` defaults to a get and a set.
+        try:
+            full_at = cache.incr(key, self.interval)
+        except ValueError:
+            full_at = None
+
+        if full_at is None or full_at - self.interval < now:
+            cache.set(key, now + self.interval, timeout=math.ceil(self.interval / 1000))
+            return None
+
+        if full_at - now > self.capacity:
+            cache.decr(key, self.interval)
+            THROTTLED_REQUESTS.labels(self.scope).inc()
+            return (full_at - now - self.capacity) / 1000
+
+        cache.touch(key, timeout=math.ceil((full_at - now) / 1000))
+        return None
+
+
+def _take_tokens(throttles: tuple[TokenBucketThrottle, ...], request: HttpRequest) -> Optional[float]:
+    waits = [wait for wait in (throttle.take_token(request) for throttle in throttles) if wait is not None]
+    return max(waits, default=None)
+
+
+def throttle(*throttles: TokenBucketThrottle) -> Callable[[TAsyncHandler], TAsyncHandler]:
+    """
+    Check throttles before an async handler runs, after authentication and without database queries.
+
+    Cache calls run in one hop to the sync thread, so network caches do not block the event loop and the
+    database cache can be used. A rejected request raises `Throttled` with the longest wait of its buckets,
+    rendered by the API's exception handler.
+    """
+    def decorator(handler: TAsyncHandler) -> TAsyncHandler:
+        @wraps(handler)
+        async def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+            wait = await sync_to_async(_take_tokens)(throttles, request)
+            if wait is not None:
+                raise Throttled(wait=wait)
+
+            return await handler(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class IPThrottle(TokenBucketThrottle):
+    """
+    One bucket per client address, see ``NINJA_NUM_PROXIES`` for requests behind proxies.
+    """
+
+    def get_bucket_ident(self, request: HttpRequest) -> Optional[str]:
+        return _get_client_ident(request)
+
+
+class PhoneThrottle(TokenBucketThrottle):
+    """
+    One bucket per phone number of the JSON body, read before the body is validated.
+    """
+
+    def get_bucket_ident(self, request: HttpRequest) -> Optional[str]:
+        try:
+            phone = json.loads(request.body).get('phone')
+        except (ValueError, AttributeError):
+            return None
+
+        digits = ''.join(char for char in str(phone) if char.isdigit())
+        return digits or None
+
+
+class CustomerThrottle(TokenBucketThrottle):
+    """
+    One bucket per authenticated customer.
+    """
+
+    def get_bucket_ident(self, request: HttpRequest) -> Optional[str]:
+        customer = getattr(request, 'auth', None)
+        return str(customer.id) if customer is not None else None
@@ -1,15 +1,28 @@
-from django.http import HttpRequest
+import math
+
+from django.http import HttpRequest, HttpResponse
 from django.urls import path
 from ninja import NinjaAPI
+from ninja.errors import Throttled
 
+from core.api.renderers import get_api_renderer
 from core.api.schemas import PingResponseSchema
 from core.api.v1.urls import router as v1_router
 
-api = NinjaAPI()
+api = NinjaAPI(renderer=get_api_renderer())
+
+
+@api.exception_handler(Throttled)
+def throttled_handler(request: HttpRequest, exception: Throttled) -> HttpResponse:
+    response = api.create_response(request, {'detail': exception.message}, status=exception.status_code)
+    if exception.wait is not None:
+        response['Retry-After'] = str(math.ceil(exception.wait))
+
+    return response
 
 
 @api.get('/ping', response=PingResponseSchema)
-def ping(request: HttpRequest) -> PingResponseSchema:
+async def ping(request: HttpRequest) -> PingResponseSchema:
     return PingResponseSchema(result=True)
 
 
@@ -0,0 +1,173 @@
+import csv
+import io
+import json
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+
+EXPORT_COLUMNS = (
+    'id',
+    'created_at',
+    'updated_at',
+    'title',
+    'operation_type',
+    'amount',
+    'related_budget_id',
+    'budget_title',
+    'currency',
+    'related_category_id',
+    'category_name',
+)
+
+
+class BaseOperationExporter(ABC):
+    content_type: str
+    extension: str
+    rows_per_chunk = 1000
+
+    @abstractmethod
+    def stream(self, rows: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+        ...
+
+
+class CSVOperationExporter(BaseOperationExporter):
+    content_type = 'text/csv'
+    extension = 'csv'
+
+    async def stream(self, rows: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+        buffered_rows = 0
+
+        async for row in rows:
+            writer.writerow([
+                value.isoformat() if hasattr(value, 'isoformat') else value
+                for value in (row[column] for column in EXPORT_COLUMNS)
+            ])
+            buffered_rows += 1
+
+            if buffered_rows >= self.rows_per_chunk:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+                buffered_rows = 0
+
+        yield buffer.getvalue().encode()
+
+
+class NDJSONOperationExporter(BaseOperationExporter):
+    content_type = 'application/x-ndjson'
+    extension = 'ndjson'
+
+    async def stream(self, rows: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+        encoder = DjangoJSONEncoder()
+        lines = []
+
+        async for row in rows:
+            lines.append(encoder.encode({column: row[column] for column in EXPORT_COLUMNS}))
+
+            if len(lines) >= self.rows_per_chunk:
+                yield ('\n'.join(lines) + '\n').encode()
+                lines.clear()
+
+        if lines:
+            yield ('\n'.join(lines) + '\n').encode()
+
+
+class _DrainableSink(io.RawIOBase):
+    """
+    Write-only file object collecting bytes until they are drained into the response.
+    """
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ParquetOperationExporter(BaseOperationExporter):
+    content_type = 'application/vnd.apache.parquet'
+    extension = 'parquet'
+    rows_per_chunk = 50_000
+
+    def _get_schema(self):
+        import pyarrow as pa
+
+        timestamp = pa.timestamp('us', tz='UTC')
+        return pa.schema([
+            ('id', pa.int64()),
+            ('created_at', timestamp),
+            ('updated_at', timestamp),
+            ('title', pa.string()),
+            ('operation_type', pa.string()),
+            ('amount', pa.decimal128(11, 2)),
+            ('related_budget_id', pa.int64()),
+            ('budget_title', pa.string()),
+            ('currency', pa.string()),
+            ('related_category_id', pa.int64()),
+            ('category_name', pa.string()),
+        ])
+
+    def _write_row_group(self, writer, schema, row_group: list[dict]) -> None:
+        import pyarrow as pa
+
+        writer.write_table(pa.Table.from_pylist(row_group, schema=schema))
+
+    async def stream(self, rows: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+        import pyarrow.parquet as pq
+
+        schema = self._get_schema()
+        sink = _DrainableSink()
+        writer = pq.ParquetWriter(sink, schema)
+        # Encoding and compressing a row group takes CPU time, it runs in a thread of its own so the event loop keeps
+        # serving other requests, and so do database queries of the sync thread.
+        write_row_group = sync_to_async(self._write_row_group, thread_sensitive=False)
+        close_writer = sync_to_async(writer.close, thread_sensitive=False)
+        row_group = []
+
+        async for row in rows:
+            row_group.append(row)
+
+            if len(row_group) >= self.rows_per_chunk:
+                await write_row_group(writer, schema, row_group)
+                row_group = []
+                yield sink.drain()
+
+        if row_group:
+            await write_row_group(writer, schema, row_group)
+        await close_writer()
+        yield sink.drain()
+
+
+def is_parquet_available() -> bool:
+    try:
+        import pyarrow.parquet  # noqa
+    except ImportError:
+        return False
+
+    return True
+
+
+OPERATION_EXPORTERS: dict[str, type[BaseOperationExporter]] = {
+    'csv': CSVOperationExporter,
+    'ndjson': NDJSONOperationExporter,
+    'parquet': ParquetOperationExporter,
+}
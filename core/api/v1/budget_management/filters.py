@@ -1,4 +1,9 @@
+from datetime import date, datetime
+from typing import Literal
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
 from ninja import Schema
+from pydantic import field_validator
 
 
 class CurrencyFilters(Schema):
@@ -15,3 +20,30 @@ class CategoryFilters(Schema):
 
 class OperationFilters(Schema):
     search: str | None = None
+
+
+class OperationExportFilters(Schema):
+    format: Literal['csv', 'ndjson', 'parquet'] = 'csv'
+    budget_id: int | None = None
+
+
+class ReportFilters(Schema):
+    budget_id: int | None = None
+    date_from: datetime | None = None
+    date_to: datetime | None = None
+    timezone: str = 'UTC'
+
+    @field_validator('timezone')
+    @classmethod
+    def validate_timezone(cls, value: str) -> str:
+        try:
+            ZoneInfo(value)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f'Unknown timezone "{value}"')
+        return value
+
+
+class ConsolidationFilters(Schema):
+    currency: str
+    date_from: date | None = None
+    date_to: date | None = None
@@ -1,69 +1,123 @@
-from django.http import HttpRequest
+from typing import Iterator
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.utils import timezone
 from ninja import Router, Query
+from ninja.errors import HttpError
+from pydantic import ValidationError
 
 from core.api.auth import TokenAuth
-from core.api.filters import PaginationIn
-from core.api.schemas import ApiResponse, ListPaginatedResponse, DetailResponse, PaginationOut
-from core.api.v1.budget_management.filters import CurrencyFilters, BudgetFilters, CategoryFilters, OperationFilters
+from core.api.conditional import (
+    cache_response, get_cached_response, get_catalog_versions, get_currency_validators, get_customer_validators
+)
+from core.api.filters import PaginationIn, get_next_cursor
+from core.api.parsers import PayloadError, iter_payload_items
+from core.api.rows import compile_row_serializer, render_api_response
+from core.api.schemas import ApiResponse, ListPaginatedResponse, ListResponse, DetailResponse, PaginationOut
+from core.api.throttling import CustomerThrottle, throttle
+from core.api.v1.budget_management.exporters import OPERATION_EXPORTERS, is_parquet_available
+from core.api.v1.budget_management.filters import (
+    CurrencyFilters, BudgetFilters, CategoryFilters, OperationFilters, OperationExportFilters, ReportFilters,
+    ConsolidationFilters
+)
 
 from core.api.v1.budget_management.schemas.budgets import (
     CurrencySchema, BudgetSchema, CreateBudgetSchema, UpdateBudgetSchema, DeleteBudgetSchema, BudgetOperationSchema
 )
 from core.api.v1.budget_management.schemas.operations import (
     CategorySchema, OperationSchema, CreateOperationSchema, UpdateOperationSchema, DeleteOperationSchema,
-    CreateCategorySchema, DeleteCategorySchema, UpdateCategorySchema
+    CreateCategorySchema, DeleteCategorySchema, UpdateCategorySchema, BulkCreateOperationsSchema
 )
+from core.api.v1.budget_management.schemas.reports import (
+    OperationTotalsSchema, CategoryTotalsSchema, PeriodTotalsSchema, ConsolidatedTotalsSchema
+)
+from core.apps.budgets.entities.budgets import Budget as BudgetEntity
+from core.apps.budgets.entities.operations import NewOperation, Operation as OperationEntity
+from core.apps.common.exceptions import ServiceException
 from core.project.ioc_containers import get_ioc_container
 
-from core.apps.budgets.services.budgets import BaseCurrencyService, BaseBudgetService
-from core.apps.budgets.services.operations import BaseCategoryService, BaseOperationService
+from core.apps.budgets.services.budgets import BaseAsyncCurrencyService, BaseAsyncBudgetService
+from core.apps.budgets.services.consolidation import BaseAsyncConsolidationService
+from core.apps.budgets.services.operations import BaseAsyncCategoryService, BaseAsyncOperationService
+from core.apps.budgets.services.reports import BaseAsyncReportService, ReportPeriod
 
 router = Router(tags=['Budget managing'])
 
+WRITE_THROTTLE = CustomerThrottle('writes')
+
+# List endpoints render values() rows directly, the response models below only document them.
+BUDGET_ROWS = compile_row_serializer(BudgetSchema)
+CATEGORY_ROWS = compile_row_serializer(CategorySchema)
+OPERATION_ROWS = compile_row_serializer(OperationSchema)
+BUDGET_OPERATION_BUDGET_ROWS = compile_row_serializer(BudgetEntity)
+BUDGET_OPERATION_ROWS = compile_row_serializer(OperationEntity)
+
 
 @router.get('currencies', response=ApiResponse[ListPaginatedResponse[CurrencySchema]], auth=TokenAuth())
-def get_currency_list_handler(
+async def get_currency_list_handler(
         request: HttpRequest,
         filters: Query[CurrencyFilters],
-        pagination_in: Query[PaginationIn]
+        pagination_in: Query[PaginationIn],
+        response: HttpResponse
 ) -> ApiResponse[ListPaginatedResponse[CurrencySchema]]:
 
+    validators = await get_currency_validators(request)
+    not_modified = validators.get_not_modified_response(request)
+    if not_modified is not None:
+        return not_modified
+
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseCurrencyService)
+    service = ioc_container.resolve(BaseAsyncCurrencyService)
+
+    currency_page = await service.get_currency_list(filters=filters, pagination=pagination_in)
+    items = [CurrencySchema.from_entity(entity=obj) for obj in currency_page.items]
+    pagination_out = PaginationOut(
+        offset=pagination_in.offset,
+        limit=pagination_in.limit,
+        total=currency_page.total,
+        has_more=currency_page.has_more
+    )
 
-    currency_list = service.get_currency_list(filters=filters, pagination=pagination_in)
-    currency_count = service.get_currency_count(filters=filters)
-    items = [CurrencySchema.from_entity(entity=obj) for obj in currency_list]
-    pagination_out = PaginationOut(offset=pagination_in.limit, limit=pagination_in.limit, total=currency_count)
+    validators.apply(response)
 
     return ApiResponse(data=ListPaginatedResponse(items=items, pagination=pagination_out))
 
 
 @router.get('currencies/{short_name}', response=ApiResponse[DetailResponse[CurrencySchema]], auth=TokenAuth())
-def get_currency_handler(
+async def get_currency_handler(
         request: HttpRequest,
-        short_name: str
+        short_name: str,
+        response: HttpResponse
 ) -> ApiResponse[DetailResponse[CurrencySchema]]:
 
+    validators = await get_currency_validators(request)
+    not_modified = validators.get_not_modified_response(request)
+    if not_modified is not None:
+        return not_modified
+
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseCurrencyService)
+    service = ioc_container.resolve(BaseAsyncCurrencyService)
 
-    currency = service.get_currency_by_short_name(short_name=short_name)
+    currency = await service.get_currency_by_short_name(short_name=short_name)
     item = CurrencySchema.from_entity(currency)
 
+    validators.apply(response)
+
     return ApiResponse(data=DetailResponse(item=item))
 
 
 @router.post('budgets', response=ApiResponse[DetailResponse[BudgetSchema]], auth=TokenAuth())
-def create_budget_handler(
+@throttle(WRITE_THROTTLE)
+async def create_budget_handler(
         request: HttpRequest,
         schema: CreateBudgetSchema
 ) -> ApiResponse[DetailResponse[BudgetSchema]]:
 
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseBudgetService)
+    service = ioc_container.resolve(BaseAsyncBudgetService)
 
-    budget = service.create_budget(
+    budget = await service.create_budget(
         title=schema.title,
         initial_amount=schema.initial_amount,
         related_currency_short_name=schema.related_currency_short_name,
@@ -75,80 +129,122 @@ def create_budget_handler(
 
 
 @router.get('budgets', response=ApiResponse[ListPaginatedResponse[BudgetSchema]], auth=TokenAuth())
-def get_budget_list_handler(
+async def get_budget_list_handler(
         request: HttpRequest,
         filters: Query[BudgetFilters],
         pagination_in: Query[PaginationIn]
-) -> ApiResponse[ListPaginatedResponse[BudgetSchema]]:
+) -> HttpResponse:
+
+    validators = await get_customer_validators(request)
+    cached = await get_cached_response(request, validators)
+    if cached is not None:
+        return cached
 
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseBudgetService)
+    service = ioc_container.resolve(BaseAsyncBudgetService)
 
-    budget_list = service.get_budget_list(filters=filters, pagination=pagination_in, related_customer=request.auth)
-    budget_count = service.get_budget_count(filters=filters, related_customer=request.auth)
-    items = [BudgetSchema.from_entity(entity=obj) for obj in budget_list]
-    pagination_out = PaginationOut(offset=pagination_in.limit, limit=pagination_in.limit, total=budget_count)
+    budget_page = await service.get_budget_row_list(
+        filters=filters,
+        pagination=pagination_in,
+        related_customer=request.auth,
+        fields=BUDGET_ROWS.get_lookups()
+    )
+    items = [BUDGET_ROWS.build(row) for row in budget_page.items]
+    pagination_out = PaginationOut(
+        offset=pagination_in.offset,
+        limit=pagination_in.limit,
+        total=budget_page.total,
+        has_more=budget_page.has_more
+    )
 
-    return ApiResponse(data=ListPaginatedResponse(items=items, pagination=pagination_out))
+    response = render_api_response(router.api, request, {'items': items, 'pagination': pagination_out.model_dump()})
+
+    return await cache_response(validators, response)
 
 
 @router.get('budgets/{budget_id}', response=ApiResponse[DetailResponse[BudgetSchema]], auth=TokenAuth())
-def get_budget_handler(
+async def get_budget_handler(
         request: HttpRequest,
         budget_id: int
-) -> ApiResponse[DetailResponse[BudgetSchema]]:
+) -> HttpResponse:
+
+    validators = await get_customer_validators(request)
+    cached = await get_cached_response(request, validators)
+    if cached is not None:
+        return cached
 
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseBudgetService)
+    service = ioc_container.resolve(BaseAsyncBudgetService)
 
-    budget = service.get_budget_by_id(budget_id=budget_id, related_customer=request.auth)
+    budget = await service.get_budget_by_id(budget_id=budget_id, related_customer=request.auth)
     item = BudgetSchema.from_entity(budget)
 
-    return ApiResponse(data=DetailResponse(item=item))
+    response = render_api_response(router.api, request, DetailResponse(item=item).model_dump())
+
+    return await cache_response(validators, response)
 
 
 @router.get('budgets/{budget_id}/operations', response=ApiResponse[ListPaginatedResponse[BudgetOperationSchema]], auth=TokenAuth())
-def get_budget_operation_list_handler(
+async def get_budget_operation_list_handler(
         request: HttpRequest,
         filters: Query[BudgetFilters],
         pagination_in: Query[PaginationIn],
         budget_id: int
-) -> ApiResponse[ListPaginatedResponse[BudgetOperationSchema]]:
+) -> HttpResponse:
+
+    validators = await get_customer_validators(request)
+    cached = await get_cached_response(request, validators)
+    if cached is not None:
+        return cached
+
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseBudgetService)
+    service = ioc_container.resolve(BaseAsyncBudgetService)
 
-    budget, budget_operation_list = service.get_budget_operation_list(
+    budget_row, budget_operation_page = await service.get_budget_operation_row_list(
         filters=filters,
         pagination=pagination_in,
         budget_id=budget_id,
-        related_customer=request.auth
+        related_customer=request.auth,
+        budget_fields=BUDGET_OPERATION_BUDGET_ROWS.get_lookups(),
+        operation_fields=BUDGET_OPERATION_ROWS.get_lookups(exclude=('related_budget',))
     )
-    budget_operation_count = service.get_budget_operation_count(
-        filters=filters,
-        budget_id=budget_id,
-        related_customer=request.auth
+    budget = BUDGET_OPERATION_BUDGET_ROWS.build(budget_row)
+    pagination_out = PaginationOut(
+        offset=pagination_in.offset,
+        limit=pagination_in.limit,
+        total=budget_operation_page.total,
+        has_more=budget_operation_page.has_more,
+        next_cursor=get_next_cursor(budget_operation_page.items, pagination_in.limit, budget_operation_page.has_more)
     )
-    pagination_out = PaginationOut(offset=pagination_in.limit, limit=pagination_in.limit, total=budget_operation_count)
 
     items = [{
         "related_budget": budget,
-        "related_operations": budget_operation_list
+        "related_operations": [
+            BUDGET_OPERATION_ROWS.build(row, related_budget=budget) for row in budget_operation_page.items
+        ]
     }]
 
-    return ApiResponse(data=ListPaginatedResponse(items=items, pagination=pagination_out))
+    response = render_api_response(router.api, request, {'items': items, 'pagination': pagination_out.model_dump()})
+
+    return await cache_response(validators, response)
 
 
-@router.put('budgets/{budget_id}', response=ApiResponse[DetailResponse[BudgetSchema]], auth=TokenAuth())
-def update_budget_handler(
+@router.put(
+    'budgets/{budget_id}',
+    response=ApiResponse[DetailResponse[BudgetSchema]],
+    auth=TokenAuth(),
+)
+@throttle(WRITE_THROTTLE)
+async def update_budget_handler(
         request: HttpRequest,
         budget_id: int,
         schema: UpdateBudgetSchema
 ) -> ApiResponse[DetailResponse[BudgetSchema]]:
 
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseBudgetService)
+    service = ioc_container.resolve(BaseAsyncBudgetService)
 
-    updated_budget = service.update_budget(
+    updated_budget = await service.update_budget(
         budget_id=budget_id,
         title=schema.title,
         initial_amount=schema.initial_amount,
@@ -159,30 +255,40 @@ def update_budget_handler(
     return ApiResponse(data=DetailResponse(item=item))
 
 
-@router.delete('budgets/{budget_id}', response=ApiResponse[DeleteBudgetSchema], auth=TokenAuth())
-def delete_budget_handler(
+@router.delete(
+    'budgets/{budget_id}',
+    response=ApiResponse[DeleteBudgetSchema],
+    auth=TokenAuth(),
+)
+@throttle(WRITE_THROTTLE)
+async def delete_budget_handler(
         request: HttpRequest,
         budget_id: int
 ) -> ApiResponse[DeleteBudgetSchema]:
 
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseBudgetService)
+    service = ioc_container.resolve(BaseAsyncBudgetService)
 
-    service.delete_budget(budget_id=budget_id, related_customer=request.auth)
+    await service.delete_budget(budget_id=budget_id, related_customer=request.auth)
 
     return ApiResponse(data=DeleteBudgetSchema(message='Budget deleted successfully.'))
 
 
-@router.post('categories', response=ApiResponse[DetailResponse[CategorySchema]], auth=TokenAuth())
-def create_category_handler(
+@router.post(
+    'categories',
+    response=ApiResponse[DetailResponse[CategorySchema]],
+    auth=TokenAuth(),
+)
+@throttle(WRITE_THROTTLE)
+async def create_category_handler(
         request: HttpRequest,
         schema: CreateCategorySchema
 ) -> ApiResponse[DetailResponse[CategorySchema]]:
 
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseCategoryService)
+    service = ioc_container.resolve(BaseAsyncCategoryService)
 
-    category = service.create_category(
+    category = await service.create_category(
         name=schema.name,
         related_customer=request.auth
     )
@@ -192,49 +298,77 @@ def create_category_handler(
 
 
 @router.get('categories', response=ApiResponse[ListPaginatedResponse[CategorySchema]], auth=TokenAuth())
-def get_category_list_handler(
+async def get_category_list_handler(
         request: HttpRequest,
         filters: Query[CategoryFilters],
         pagination_in: Query[PaginationIn]
-) -> ApiResponse[ListPaginatedResponse[CategorySchema]]:
+) -> HttpResponse:
+
+    validators = await get_customer_validators(request)
+    cached = await get_cached_response(request, validators)
+    if cached is not None:
+        return cached
 
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseCategoryService)
+    service = ioc_container.resolve(BaseAsyncCategoryService)
+
+    category_page = await service.get_category_row_list(
+        filters=filters,
+        pagination=pagination_in,
+        related_customer=request.auth,
+        fields=CATEGORY_ROWS.get_lookups()
+    )
+    items = [CATEGORY_ROWS.build(row) for row in category_page.items]
+    pagination_out = PaginationOut(
+        offset=pagination_in.offset,
+        limit=pagination_in.limit,
+        total=category_page.total,
+        has_more=category_page.has_more
+    )
 
-    category_list = service.get_category_list(filters=filters, pagination=pagination_in, related_customer=request.auth)
-    category_count = service.get_category_count(filters=filters, related_customer=request.auth)
-    items = [CategorySchema.from_entity(entity=obj) for obj in category_list]
-    pagination_out = PaginationOut(offset=pagination_in.limit, limit=pagination_in.limit, total=category_count)
+    response = render_api_response(router.api, request, {'items': items, 'pagination': pagination_out.model_dump()})
 
-    return ApiResponse(data=ListPaginatedResponse(items=items, pagination=pagination_out))
+    return await cache_response(validators, response)
 
 
 @router.get('categories/{category_id}', response=ApiResponse[DetailResponse[CategorySchema]], auth=TokenAuth())
-def get_category_handler(
+async def get_category_handler(
         request: HttpRequest,
         category_id: int
-) -> ApiResponse[DetailResponse[CategorySchema]]:
+) -> HttpResponse:
+
+    validators = await get_customer_validators(request)
+    cached = await get_cached_response(request, validators)
+    if cached is not None:
+        return cached
 
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseCategoryService)
+    service = ioc_container.resolve(BaseAsyncCategoryService)
 
-    category = service.get_category_by_id(category_id=category_id, related_customer=request.auth)
+    category = await service.get_category_by_id(category_id=category_id, related_customer=request.auth)
     item = CategorySchema.from_entity(category)
 
-    return ApiResponse(data=DetailResponse(item=item))
+    response = render_api_response(router.api, request, DetailResponse(item=item).model_dump())
+
+    return await cache_response(validators, response)
 
 
-@router.put('categories/{category_id}', response=ApiResponse[DetailResponse[CategorySchema]], auth=TokenAuth())
-def update_category_handler(
+@router.put(
+    'categories/{category_id}',
+    response=ApiResponse[DetailResponse[CategorySchema]],
+    auth=TokenAuth(),
+)
+@throttle(WRITE_THROTTLE)
+async def update_category_handler(
         request: HttpRequest,
         category_id: int,
         schema: UpdateCategorySchema
 ) -> ApiResponse[DetailResponse[CategorySchema]]:
 
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseCategoryService)
+    service = ioc_container.resolve(BaseAsyncCategoryService)
 
-    updated_category = service.update_category(
+    updated_category = await service.update_category(
         category_id=category_id,
         name=schema.name,
         related_customer=request.auth
@@ -244,30 +378,40 @@ def update_category_handler(
     return ApiResponse(data=DetailResponse(item=item))
 
 
-@router.delete('categories/{category_id}', response=ApiResponse[DeleteCategorySchema], auth=TokenAuth())
-def delete_category_handler(
+@router.delete(
+    'categories/{category_id}',
+    response=ApiResponse[DeleteCategorySchema],
+    auth=TokenAuth(),
+)
+@throttle(WRITE_THROTTLE)
+async def delete_category_handler(
         request: HttpRequest,
         category_id: int
 ) -> ApiResponse[DeleteCategorySchema]:
 
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseCategoryService)
+    service = ioc_container.resolve(BaseAsyncCategoryService)
 
-    service.delete_category(category_id=category_id, related_customer=request.auth)
+    await service.delete_category(category_id=category_id, related_customer=request.auth)
 
     return ApiResponse(data=DeleteCategorySchema(message='Category deleted successfully.'))
 
 
-@router.post('operations', response=ApiResponse[DetailResponse[OperationSchema]], auth=TokenAuth())
-def create_operation_handler(
+@router.post(
+    'operations',
+    response=ApiResponse[DetailResponse[OperationSchema]],
+    auth=TokenAuth(),
+)
+@throttle(WRITE_THROTTLE)
+async def create_operation_handler(
         request: HttpRequest,
         schema: CreateOperationSchema
 ) -> ApiResponse[DetailResponse[OperationSchema]]:
 
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseOperationService)
+    service = ioc_container.resolve(BaseAsyncOperationService)
 
-    operation = service.create_operation(
+    operation = await service.create_operation(
         title=schema.title,
         operation_type=schema.operation_type,
         amount=schema.amount,
@@ -280,50 +424,172 @@ def create_operation_handler(
     return ApiResponse(data=DetailResponse(item=item))
 
 
+def _iter_new_operations(request: HttpRequest) -> Iterator[NewOperation]:
+    for index, payload in enumerate(iter_payload_items(request, request.content_type)):
+        try:
+            schema = CreateOperationSchema.model_validate(payload)
+        except ValidationError as exception:
+            error = exception.errors()[0]
+            location = '.'.join(map(str, error['loc']))
+            raise PayloadError(f'Invalid operation at index {index}: {location}: {error["msg"]}.')
+
+        yield NewOperation(
+            title=schema.title,
+            operation_type=schema.operation_type,
+            amount=schema.amount,
+            related_budget_id=schema.related_budget_id,
+            related_category_id=schema.related_category_id,
+        )
+
+
+@router.post(
+    'operations/bulk',
+    response=ApiResponse[BulkCreateOperationsSchema],
+    auth=TokenAuth(),
+    openapi_extra={
+        'requestBody': {
+            'description': 'JSON array or NDJSON (application/x-ndjson) stream of operations to create.',
+            'content': {
+                'application/json': {'schema': {'type': 'array', 'items': CreateOperationSchema.json_schema()}},
+                'application/x-ndjson': {'schema': CreateOperationSchema.json_schema()},
+            },
+        },
+    },
+)
+@throttle(WRITE_THROTTLE)
+async def bulk_create_operations_handler(
+        request: HttpRequest,
+) -> ApiResponse[BulkCreateOperationsSchema]:
+
+    ioc_container = get_ioc_container()
+    service = ioc_container.resolve(BaseAsyncOperationService)
+
+    try:
+        created = await service.bulk_create_operations(
+            operations=_iter_new_operations(request),
+            related_customer=request.auth
+        )
+    except PayloadError as exception:
+        raise HttpError(
+            status_code=400,
+            message=str(exception)
+        )
+    except ServiceException as exception:
+        raise HttpError(
+            status_code=400,
+            message=exception.message
+        )
+
+    return ApiResponse(data=BulkCreateOperationsSchema(created=created))
+
+
 @router.get('operations', response=ApiResponse[ListPaginatedResponse[OperationSchema]], auth=TokenAuth())
-def get_operation_list_handler(
+async def get_operation_list_handler(
         request: HttpRequest,
         filters: Query[OperationFilters],
         pagination_in: Query[PaginationIn]
-) -> ApiResponse[ListPaginatedResponse[OperationSchema]]:
+) -> HttpResponse:
+
+    validators = await get_customer_validators(request)
+    cached = await get_cached_response(request, validators)
+    if cached is not None:
+        return cached
 
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseOperationService)
+    service = ioc_container.resolve(BaseAsyncOperationService)
+
+    operation_page = await service.get_operation_row_list(
+        filters=filters,
+        pagination=pagination_in,
+        related_customer=request.auth,
+        fields=OPERATION_ROWS.get_lookups()
+    )
+    items = [OPERATION_ROWS.build(row) for row in operation_page.items]
+    pagination_out = PaginationOut(
+        offset=pagination_in.offset,
+        limit=pagination_in.limit,
+        total=operation_page.total,
+        has_more=operation_page.has_more,
+        next_cursor=get_next_cursor(operation_page.items, pagination_in.limit, operation_page.has_more)
+    )
 
-    operation_list = service.get_operation_list(filters=filters, pagination=pagination_in, related_customer=request.auth)
-    operation_count = service.get_operation_count(filters=filters, related_customer=request.auth)
-    items = [OperationSchema.from_entity(entity=obj) for obj in operation_list]
-    pagination_out = PaginationOut(offset=pagination_in.limit, limit=pagination_in.limit, total=operation_count)
+    response = render_api_response(router.api, request, {'items': items, 'pagination': pagination_out.model_dump()})
 
-    return ApiResponse(data=ListPaginatedResponse(items=items, pagination=pagination_out))
+    return await cache_response(validators, response)
+
+
+@router.get('operations/export', auth=TokenAuth())
+async def export_operations_handler(
+        request: HttpRequest,
+        filters: Query[OperationFilters],
+        export_filters: Query[OperationExportFilters]
+) -> StreamingHttpResponse:
+
+    ioc_container = get_ioc_container()
+    service = ioc_container.resolve(BaseAsyncOperationService)
+    budget_service = ioc_container.resolve(BaseAsyncBudgetService)
+
+    # pyarrow is optional, it has no wheels for the Alpine image.
+    if export_filters.format == 'parquet' and not is_parquet_available():
+        raise HttpError(status_code=501, message='Parquet export is not available on this server.')
+
+    if export_filters.budget_id is not None:
+        try:
+            await budget_service.get_budget_by_id(budget_id=export_filters.budget_id, related_customer=request.auth)
+        except ObjectDoesNotExist:
+            raise HttpError(status_code=404, message='Budget not found.')
+
+    exporter = OPERATION_EXPORTERS[export_filters.format]()
+    rows = service.iter_operation_rows(
+        filters=filters,
+        related_customer=request.auth,
+        budget_id=export_filters.budget_id
+    )
+
+    response = StreamingHttpResponse(exporter.stream(rows), content_type=exporter.content_type)
+    response['Content-Disposition'] = f'attachment; filename="operations.{exporter.extension}"'
+
+    return response
 
 
 @router.get('operations/{operation_id}', response=ApiResponse[DetailResponse[OperationSchema]], auth=TokenAuth())
-def get_operation_handler(
+async def get_operation_handler(
         request: HttpRequest,
         operation_id: int
-) -> ApiResponse[DetailResponse[OperationSchema]]:
+) -> HttpResponse:
+
+    validators = await get_customer_validators(request)
+    cached = await get_cached_response(request, validators)
+    if cached is not None:
+        return cached
 
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseOperationService)
+    service = ioc_container.resolve(BaseAsyncOperationService)
 
-    operation = service.get_operation_by_id(operation_id=operation_id, related_customer=request.auth)
+    operation = await service.get_operation_by_id(operation_id=operation_id, related_customer=request.auth)
     item = OperationSchema.from_entity(operation)
 
-    return ApiResponse(data=DetailResponse(item=item))
+    response = render_api_response(router.api, request, DetailResponse(item=item).model_dump())
 
+    return await cache_response(validators, response)
 
-@router.put('operations/{operation_id}', response=ApiResponse[DetailResponse[OperationSchema]], auth=TokenAuth())
-def update_operation_handler(
+
+@router.put(
+    'operations/{operation_id}',
+    response=ApiResponse[DetailResponse[OperationSchema]],
+    auth=TokenAuth(),
+)
+@throttle(WRITE_THROTTLE)
+async def update_operation_handler(
         request: HttpRequest,
         operation_id: int,
         schema: UpdateOperationSchema
 ) -> ApiResponse[DetailResponse[OperationSchema]]:
 
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseOperationService)
+    service = ioc_container.resolve(BaseAsyncOperationService)
 
-    updated_operation = service.update_operation(
+    updated_operation = await service.update_operation(
         operation_id=operation_id,
         title=schema.title,
         operation_type=schema.operation_type,
@@ -336,15 +602,131 @@ def update_operation_handler(
     return ApiResponse(data=DetailResponse(item=item))
 
 
-@router.delete('operations/{operation_id}', response=ApiResponse[DeleteOperationSchema], auth=TokenAuth())
-def delete_operation_handler(
+@router.delete(
+    'operations/{operation_id}',
+    response=ApiResponse[DeleteOperationSchema],
+    auth=TokenAuth(),
+)
+@throttle(WRITE_THROTTLE)
+async def delete_operation_handler(
         request: HttpRequest,
         operation_id: int
 ) -> ApiResponse[DeleteOperationSchema]:
 
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseOperationService)
+    service = ioc_container.resolve(BaseAsyncOperationService)
 
-    service.delete_operation(operation_id=operation_id, related_customer=request.auth)
+    await service.delete_operation(operation_id=operation_id, related_customer=request.auth)
 
     return ApiResponse(data=DeleteOperationSchema(message='Operation deleted successfully.'))
+
+
+@router.get('reports/types', response=ApiResponse[ListResponse[OperationTotalsSchema]], auth=TokenAuth())
+async def get_operation_type_report_handler(
+        request: HttpRequest,
+        filters: Query[OperationFilters],
+        report_filters: Query[ReportFilters]
+) -> HttpResponse:
+
+    validators = await get_customer_validators(request)
+    cached = await get_cached_response(request, validators)
+    if cached is not None:
+        return cached
+
+    ioc_container = get_ioc_container()
+    service = ioc_container.resolve(BaseAsyncReportService)
+
+    report = await service.get_operation_type_report(
+        filters=filters,
+        report_filters=report_filters,
+        related_customer=request.auth
+    )
+    items = [OperationTotalsSchema.from_entity(entity=obj) for obj in report]
+
+    response = render_api_response(router.api, request, ListResponse(items=items).model_dump())
+
+    return await cache_response(validators, response)
+
+
+@router.get('reports/categories', response=ApiResponse[ListResponse[CategoryTotalsSchema]], auth=TokenAuth())
+async def get_category_report_handler(
+        request: HttpRequest,
+        filters: Query[OperationFilters],
+        report_filters: Query[ReportFilters]
+) -> HttpResponse:
+
+    validators = await get_customer_validators(request)
+    cached = await get_cached_response(request, validators)
+    if cached is not None:
+        return cached
+
+    ioc_container = get_ioc_container()
+    service = ioc_container.resolve(BaseAsyncReportService)
+
+    report = await service.get_category_report(
+        filters=filters,
+        report_filters=report_filters,
+        related_customer=request.auth
+    )
+    items = [CategoryTotalsSchema.from_entity(entity=obj) for obj in report]
+
+    response = render_api_response(router.api, request, ListResponse(items=items).model_dump())
+
+    return await cache_response(validators, response)
+
+
+@router.get('reports/periods', response=ApiResponse[ListResponse[PeriodTotalsSchema]], auth=TokenAuth())
+async def get_period_report_handler(
+        request: HttpRequest,
+        filters: Query[OperationFilters],
+        report_filters: Query[ReportFilters],
+        period: ReportPeriod = 'month'
+) -> HttpResponse:
+
+    validators = await get_customer_validators(request)
+    cached = await get_cached_response(request, validators)
+    if cached is not None:
+        return cached
+
+    ioc_container = get_ioc_container()
+    service = ioc_container.resolve(BaseAsyncReportService)
+
+    report = await service.get_period_report(
+        filters=filters,
+        report_filters=report_filters,
+        period=period,
+        related_customer=request.auth
+    )
+    items = [PeriodTotalsSchema.from_entity(entity=obj) for obj in report]
+
+    response = render_api_response(router.api, request, ListResponse(items=items).model_dump())
+
+    return await cache_response(validators, response)
+
+
+@router.get('reports/consolidated', response=ApiResponse[DetailResponse[ConsolidatedTotalsSchema]], auth=TokenAuth())
+async def get_consolidated_totals_handler(
+        request: HttpRequest,
+        filters: Query[ConsolidationFilters]
+) -> HttpResponse:
+
+    validators = await get_customer_validators(request, timezone.localdate(), *await get_catalog_versions())
+    cached = await get_cached_response(request, validators)
+    if cached is not None:
+        return cached
+
+    ioc_container = get_ioc_container()
+    service = ioc_container.resolve(BaseAsyncConsolidationService)
+
+    try:
+        totals = await service.get_consolidated_totals(filters=filters, related_customer=request.auth)
+    except ObjectDoesNotExist:
+        raise HttpError(status_code=404, message='Currency not found.')
+    except ServiceException as exception:
+        raise HttpError(status_code=400, message=exception.message)
+
+    item = ConsolidatedTotalsSchema.from_entity(totals)
+
+    response = render_api_response(router.api, request, DetailResponse(item=item).model_dump())
+
+    return await cache_response(validators, response)
@@ -37,6 +37,9 @@ class BudgetSchema(Schema):
     updated_at: Optional[datetime] = None
     title: str
     initial_amount: Decimal
+    current_balance: Decimal
+    add_operations_count: int
+    sub_operations_count: int
     related_currency: CurrencyEntity
     related_customer: CustomerEntity
 
@@ -48,6 +51,9 @@ class BudgetSchema(Schema):
             updated_at=entity.updated_at,
             title=entity.title,
             initial_amount=entity.initial_amount,
+            current_balance=entity.current_balance,
+            add_operations_count=entity.add_operations_count,
+            sub_operations_count=entity.sub_operations_count,
             related_currency=entity.related_currency,
             related_customer=entity.related_customer
         )
@@ -47,6 +47,10 @@ class CreateOperationSchema(Schema):
     related_budget_id: int
 
 
+class BulkCreateOperationsSchema(Schema):
+    created: int
+
+
 class OperationSchema(Schema):
     id: int
     created_at: datetime
@@ -0,0 +1,84 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+
+from ninja import Schema
+
+from core.apps.budgets.entities.reports import (
+    OperationTotals as OperationTotalsEntity,
+    CategoryTotals as CategoryTotalsEntity,
+    PeriodTotals as PeriodTotalsEntity,
+    ConsolidatedTotals as ConsolidatedTotalsEntity,
+)
+
+
+class OperationTotalsSchema(Schema):
+    operation_type: str
+    currency: Optional[str] = None
+    total_amount: Decimal
+    operations_count: int
+    average_amount: Decimal
+
+    @staticmethod
+    def from_entity(entity: OperationTotalsEntity) -> 'OperationTotalsSchema':
+        return OperationTotalsSchema(
+            operation_type=entity.operation_type,
+            currency=entity.currency,
+            total_amount=entity.total_amount,
+            operations_count=entity.operations_count,
+            average_amount=entity.average_amount,
+        )
+
+
+class CategoryTotalsSchema(OperationTotalsSchema):
+    category_id: Optional[int] = None
+    category_name: Optional[str] = None
+
+    @staticmethod
+    def from_entity(entity: CategoryTotalsEntity) -> 'CategoryTotalsSchema':
+        return CategoryTotalsSchema(
+            category_id=entity.category_id,
+            category_name=entity.category_name,
+            operation_type=entity.operation_type,
+            currency=entity.currency,
+            total_amount=entity.total_amount,
+            operations_count=entity.operations_count,
+            average_amount=entity.average_amount,
+        )
+
+
+class PeriodTotalsSchema(OperationTotalsSchema):
+    period_start: datetime
+
+    @staticmethod
+    def from_entity(entity: PeriodTotalsEntity) -> 'PeriodTotalsSchema':
+        return PeriodTotalsSchema(
+            period_start=entity.period_start,
+            operation_type=entity.operation_type,
+            currency=entity.currency,
+            total_amount=entity.total_amount,
+            operations_count=entity.operations_count,
+            average_amount=entity.average_amount,
+        )
+
+
+class ConsolidatedTotalsSchema(Schema):
+    currency: str
+    balance: Decimal
+    add_total: Decimal
+    sub_total: Decimal
+    budgets_count: int
+    operations_count: int
+    rates_as_of: date
+
+    @staticmethod
+    def from_entity(entity: ConsolidatedTotalsEntity) -> 'ConsolidatedTotalsSchema':
+        return ConsolidatedTotalsSchema(
+            currency=entity.currency,
+            balance=entity.balance,
+            add_total=entity.add_total,
+            sub_total=entity.sub_total,
+            budgets_count=entity.budgets_count,
+            operations_count=entity.operations_count,
+            rates_as_of=entity.rates_as_of,
+        )
@@ -1,29 +1,37 @@
-from django.http import HttpRequest
+from django.http import HttpRequest, HttpResponse
 from ninja import Router
 from ninja.errors import HttpError
 
 from core.api.auth import TokenAuth
+from core.api.conditional import cache_response, get_cached_response, get_customer_validators
+from core.api.rows import render_api_response
 from core.api.schemas import ApiResponse, DetailResponse
+from core.api.throttling import CustomerThrottle, IPThrottle, PhoneThrottle, throttle
 from core.api.v1.customers.schemas.customers import AuthInSchema, AuthOutSchema, TokenOutSchema, TokenInSchema, \
-    CustomerSchema, UpdateCustomerSchema
+    CustomerSchema, UpdateCustomerSchema, RefreshTokenInSchema, LogoutOutSchema
 from core.apps.common.exceptions import ServiceException
-from core.apps.customers.services.auth import BaseAuthService
-from core.apps.customers.services.customers import BaseCustomerService
+from core.apps.customers.services.auth import BaseAsyncAuthService
+from core.apps.customers.services.customers import BaseAsyncCustomerService
 from core.project.ioc_containers import get_ioc_container
 
 router = Router(tags=['Customers'])
 
+# Throttles run before the handler, after body validation, so rejected requests never reach the database.
+AUTH_THROTTLES = [PhoneThrottle('auth_phone'), IPThrottle('auth_ip')]
+CONFIRM_THROTTLES = [PhoneThrottle('confirm_phone'), IPThrottle('confirm_ip')]
+
 
 @router.post('auth', response=ApiResponse[AuthOutSchema], operation_id='authorize')
-def auth_handler(
+@throttle(*AUTH_THROTTLES)
+async def auth_handler(
         request: HttpRequest,
         schema: AuthInSchema
 ) -> ApiResponse[AuthOutSchema]:
 
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseAuthService)
+    service = ioc_container.resolve(BaseAsyncAuthService)
 
-    service.authorize(phone=schema.phone, username=schema.username)
+    await service.authorize(phone=schema.phone, username=schema.username)
 
     return ApiResponse(data=AuthOutSchema(
         message=f'Code is sent to {schema.phone}.'
@@ -31,49 +39,95 @@ def auth_handler(
 
 
 @router.post('confirm', response=ApiResponse[TokenOutSchema], operation_id='confirm_code')
-def get_token_handler(
+@throttle(*CONFIRM_THROTTLES)
+async def get_token_handler(
         request: HttpRequest,
         schema: TokenInSchema
 ) -> ApiResponse[TokenOutSchema]:
 
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseAuthService)
+    service = ioc_container.resolve(BaseAsyncAuthService)
 
     try:
-        token = service.confirm(code=schema.code, phone=schema.phone)
+        tokens = await service.confirm(code=schema.code, phone=schema.phone)
     except ServiceException as exception:
         raise HttpError(
             status_code=400,
             message=exception.message
         )
 
-    return ApiResponse(data=TokenOutSchema(token=token))
+    return ApiResponse(data=TokenOutSchema.from_entity(tokens))
 
 
-@router.get('profile', response=ApiResponse[DetailResponse[CustomerSchema]], auth=TokenAuth())
-def get_customer_handler(
+@router.post('refresh', response=ApiResponse[TokenOutSchema], operation_id='refresh_token')
+async def refresh_token_handler(
         request: HttpRequest,
-) -> ApiResponse[DetailResponse[CustomerSchema]]:
+        schema: RefreshTokenInSchema
+) -> ApiResponse[TokenOutSchema]:
+
+    ioc_container = get_ioc_container()
+    service = ioc_container.resolve(BaseAsyncAuthService)
+
+    try:
+        tokens = await service.refresh(refresh_token=schema.refresh_token)
+    except ServiceException as exception:
+        raise HttpError(
+            status_code=401,
+            message=exception.message
+        )
+
+    return ApiResponse(data=TokenOutSchema.from_entity(tokens))
+
+
+@router.post('logout', response=ApiResponse[LogoutOutSchema], auth=TokenAuth(), operation_id='logout')
+async def logout_handler(
+        request: HttpRequest,
+) -> ApiResponse[LogoutOutSchema]:
 
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseCustomerService)
+    service = ioc_container.resolve(BaseAsyncAuthService)
+
+    await service.logout(customer=request.auth)
 
-    customer = service.get(phone=request.auth.phone)
+    return ApiResponse(data=LogoutOutSchema(message='Refresh tokens revoked successfully.'))
+
+
+@router.get('profile', response=ApiResponse[DetailResponse[CustomerSchema]], auth=TokenAuth())
+async def get_customer_handler(
+        request: HttpRequest
+) -> HttpResponse:
+
+    validators = await get_customer_validators(request)
+    cached = await get_cached_response(request, validators)
+    if cached is not None:
+        return cached
+
+    ioc_container = get_ioc_container()
+    service = ioc_container.resolve(BaseAsyncCustomerService)
+
+    customer = await service.get(phone=request.auth.phone)
     item = CustomerSchema.from_entity(customer)
 
-    return ApiResponse(data=DetailResponse(item=item))
+    response = render_api_response(router.api, request, DetailResponse(item=item).model_dump())
+
+    return await cache_response(validators, response)
 
 
-@router.put('profile', response=ApiResponse[DetailResponse[CustomerSchema]], auth=TokenAuth())
-def update_budget_handler(
+@router.put(
+    'profile',
+    response=ApiResponse[DetailResponse[CustomerSchema]],
+    auth=TokenAuth(),
+)
+@throttle(CustomerThrottle('writes'))
+async def update_budget_handler(
         request: HttpRequest,
         schema: UpdateCustomerSchema
 ) -> ApiResponse[DetailResponse[CustomerSchema]]:
 
     ioc_container = get_ioc_container()
-    service = ioc_container.resolve(BaseCustomerService)
+    service = ioc_container.resolve(BaseAsyncCustomerService)
 
-    updated_customer = service.update_username(
+    updated_customer = await service.update_username(
         username=schema.username,
         customer=request.auth
     )
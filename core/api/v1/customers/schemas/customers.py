@@ -4,6 +4,7 @@ from typing import Optional
 from ninja import Schema
 
 from core.apps.customers.entities.customers import Customer as CustomerEntity
+from core.apps.customers.entities.tokens import TokenPair
 
 
 class AuthInSchema(Schema):
@@ -22,6 +23,24 @@ class TokenInSchema(Schema):
 
 class TokenOutSchema(Schema):
     token: str
+    refresh_token: str
+    expires_in: int
+
+    @staticmethod
+    def from_entity(entity: TokenPair) -> 'TokenOutSchema':
+        return TokenOutSchema(
+            token=entity.access_token,
+            refresh_token=entity.refresh_token,
+            expires_in=entity.expires_in,
+        )
+
+
+class RefreshTokenInSchema(Schema):
+    refresh_token: str
+
+
+class LogoutOutSchema(Schema):
+    message: str
 
 
 class CustomerSchema(Schema):
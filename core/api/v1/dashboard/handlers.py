@@ -0,0 +1,35 @@
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+from ninja import Router
+
+from core.api.auth import TokenAuth
+from core.api.conditional import cache_response, get_cached_response, get_customer_validators
+from core.api.rows import render_api_response
+from core.api.schemas import ApiResponse, DetailResponse
+from core.api.v1.dashboard.schemas.dashboard import DashboardSchema
+from core.apps.budgets.services.dashboard import BaseAsyncDashboardService
+from core.project.ioc_containers import get_ioc_container
+
+router = Router(tags=['Dashboard'])
+
+
+@router.get('', response=ApiResponse[DetailResponse[DashboardSchema]], auth=TokenAuth())
+async def get_dashboard_handler(
+        request: HttpRequest
+) -> HttpResponse:
+
+    # Top categories cover the last days, the same data gives another dashboard tomorrow.
+    validators = await get_customer_validators(request, timezone.localdate())
+    cached = await get_cached_response(request, validators)
+    if cached is not None:
+        return cached
+
+    ioc_container = get_ioc_container()
+    service = ioc_container.resolve(BaseAsyncDashboardService)
+
+    dashboard = await service.get_dashboard(related_customer=request.auth)
+    item = DashboardSchema.from_entity(dashboard)
+
+    response = render_api_response(router.api, request, DetailResponse(item=item).model_dump())
+
+    return await cache_response(validators, response)
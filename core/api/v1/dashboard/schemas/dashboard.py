@@ -0,0 +1,23 @@
+
+from ninja import Schema
+
+from core.apps.budgets.entities.dashboard import (
+    Dashboard as DashboardEntity,
+    DashboardBudget as DashboardBudgetEntity,
+    DashboardCategory as DashboardCategoryEntity,
+    DashboardOperation as DashboardOperationEntity,
+)
+
+
+class DashboardSchema(Schema):
+    budgets: list[DashboardBudgetEntity]
+    top_categories: list[DashboardCategoryEntity]
+    recent_operations: list[DashboardOperationEntity]
+
+    @staticmethod
+    def from_entity(entity: DashboardEntity) -> 'DashboardSchema':
+        return DashboardSchema(
+            budgets=entity.budgets,
+            top_categories=entity.top_categories,
+            recent_operations=entity.recent_operations,
+        )
@@ -1,23 +1,98 @@
 from django.contrib import admin
+from django.db import transaction
 
-from core.apps.budgets.models import Currency, Budget, Category, Operation
+from core.apps.budgets.models import Currency, Budget, Category, Operation, BudgetDailySummary, ExchangeRate
+from core.apps.budgets.services.catalogs import CurrencyCatalog
+from core.apps.budgets.services.rates import ExchangeRateCatalog
+from core.apps.customers.admin import CustomerDataAdminMixin
+from core.project.ioc_containers import get_ioc_container
+
+
+class ReadOnlyAdminMixin:
+    """
+    Rows maintained by the services together with other rows, the admin only shows them.
+    """
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
 
 
 @admin.register(Currency)
-class CurrencyAdmin(admin.ModelAdmin):
+class CurrencyAdmin(CustomerDataAdminMixin, admin.ModelAdmin):
     list_display = ('id', 'short_name', 'symbol', 'name',)
 
+    def _invalidate_currency_catalog(self) -> None:
+        transaction.on_commit(get_ioc_container().resolve(CurrencyCatalog).invalidate)
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        self._invalidate_currency_catalog()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        self._invalidate_currency_catalog()
+
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        self._invalidate_currency_catalog()
+
 
 @admin.register(Budget)
-class BudgetAdmin(admin.ModelAdmin):
-    list_display = ('id', 'title', 'initial_amount', 'related_currency', 'related_customer',)
+class BudgetAdmin(CustomerDataAdminMixin, admin.ModelAdmin):
+    list_display = ('id', 'title', 'initial_amount', 'current_balance', 'related_currency', 'related_customer',)
+    # The balance and counters follow the budget's operations, the initial amount only changes through the API,
+    # which shifts the balance along with it.
+    derived_fields = ('current_balance', 'add_operations_count', 'sub_operations_count')
+
+    def get_readonly_fields(self, request, obj=None):
+        if obj is None:
+            return self.derived_fields
+
+        return ('initial_amount', *self.derived_fields)
+
+    def save_model(self, request, obj, form, change):
+        if not change:
+            obj.current_balance = obj.initial_amount
+        super().save_model(request, obj, form, change)
 
 
 @admin.register(Category)
-class CategoryAdmin(admin.ModelAdmin):
+class CategoryAdmin(CustomerDataAdminMixin, admin.ModelAdmin):
     list_display = ('id', 'name', 'related_customer',)
 
 
 @admin.register(Operation)
-class OperationAdmin(admin.ModelAdmin):
+class OperationAdmin(ReadOnlyAdminMixin, admin.ModelAdmin):
     list_display = ('id', 'operation_type', 'amount', 'title', 'related_budget', 'related_category',)
+
+
+@admin.register(BudgetDailySummary)
+class BudgetDailySummaryAdmin(ReadOnlyAdminMixin, admin.ModelAdmin):
+    list_display = ('id', 'day', 'operation_type', 'total_amount', 'operations_count', 'related_budget', 'related_category',)
+
+
+@admin.register(ExchangeRate)
+class ExchangeRateAdmin(CustomerDataAdminMixin, admin.ModelAdmin):
+    list_display = ('id', 'day', 'related_currency', 'rate',)
+    list_filter = ('related_currency',)
+
+    def _invalidate_exchange_rate_catalog(self) -> None:
+        transaction.on_commit(get_ioc_container().resolve(ExchangeRateCatalog).invalidate)
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        self._invalidate_exchange_rate_catalog()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        self._invalidate_exchange_rate_catalog()
+
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        self._invalidate_exchange_rate_catalog()
@@ -20,5 +20,8 @@ class Budget:
     updated_at: datetime
     title: str
     initial_amount: Decimal
+    current_balance: Decimal
+    add_operations_count: int
+    sub_operations_count: int
     related_currency: Currency
     related_customer: Customer
@@ -0,0 +1,42 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+
+@dataclass
+class DashboardBudget:
+    id: int
+    title: str
+    currency: Optional[str]
+    current_balance: Decimal
+    operations_count: int
+    last_activity_at: datetime
+
+
+@dataclass
+class DashboardCategory:
+    id: int
+    name: str
+    operations_count: int
+
+
+@dataclass
+class DashboardOperation:
+    id: int
+    created_at: datetime
+    title: str
+    operation_type: str
+    amount: Decimal
+    budget_id: int
+    budget_title: str
+    currency: Optional[str]
+    category_id: Optional[int]
+    category_name: Optional[str]
+
+
+@dataclass
+class Dashboard:
+    budgets: list[DashboardBudget] = field(default_factory=list)
+    top_categories: list[DashboardCategory] = field(default_factory=list)
+    recent_operations: list[DashboardOperation] = field(default_factory=list)
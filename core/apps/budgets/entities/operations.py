@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from typing import Optional
 
 from core.apps.budgets.entities.budgets import Budget
 from core.apps.customers.entities.customers import Customer
@@ -25,3 +26,12 @@ class Operation:
     title: str
     related_budget: Budget
     related_category: Category
+
+
+@dataclass
+class NewOperation:
+    title: str
+    operation_type: str
+    amount: Decimal
+    related_budget_id: int
+    related_category_id: Optional[int]
@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+
+
+@dataclass
+class OperationTotals:
+    operation_type: str
+    currency: Optional[str]
+    total_amount: Decimal
+    operations_count: int
+    average_amount: Decimal
+
+
+@dataclass
+class CategoryTotals(OperationTotals):
+    category_id: Optional[int]
+    category_name: Optional[str]
+
+
+@dataclass
+class PeriodTotals(OperationTotals):
+    period_start: datetime
+
+
+@dataclass
+class ConsolidatedTotals:
+    currency: str
+    balance: Decimal
+    add_total: Decimal
+    sub_total: Decimal
+    budgets_count: int
+    operations_count: int
+    rates_as_of: date
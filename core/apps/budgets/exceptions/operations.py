@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+
+from core.apps.common.exceptions import ServiceException
+
+
+@dataclass(eq=False)
+class OperationException(ServiceException):
+    @property
+    def message(self):
+        return 'Operation exception occurred.'
+
+
+@dataclass(eq=False)
+class InvalidOperationTypeException(OperationException):
+    operation_type: str
+
+    @property
+    def message(self):
+        return f'Unknown operation type "{self.operation_type}".'
+
+
+@dataclass(eq=False)
+class BudgetsNotFoundException(OperationException):
+    budget_ids: list[int]
+
+    @property
+    def message(self):
+        return f'Budgets not found: {", ".join(map(str, self.budget_ids))}.'
+
+
+@dataclass(eq=False)
+class CategoriesNotFoundException(OperationException):
+    category_ids: list[int]
+
+    @property
+    def message(self):
+        return f'Categories not found: {", ".join(map(str, self.category_ids))}.'
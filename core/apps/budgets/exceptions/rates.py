@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from datetime import date
+
+from core.apps.common.exceptions import ServiceException
+
+
+@dataclass(eq=False)
+class ExchangeRateException(ServiceException):
+    @property
+    def message(self):
+        return 'Exchange rate exception occurred.'
+
+
+@dataclass(eq=False)
+class ExchangeRateNotFoundException(ExchangeRateException):
+    currency: str
+    day: date
+
+    @property
+    def message(self):
+        return f'No exchange rate of "{self.currency}" on {self.day.isoformat()}.'
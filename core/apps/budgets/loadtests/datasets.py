@@ -0,0 +1,59 @@
+from typing import NamedTuple
+
+# Seeded customers get phones of an unassigned country code, load tests find them by it.
+LOAD_PHONE_PREFIX = '999'
+# Customers created while load testing sign-in, separate from the seeded ones.
+LOAD_SIGN_IN_PHONE_PREFIX = '998'
+
+LOAD_CURRENCIES = [
+    ('US dollar', 'USD', '$', 1.0),
+    ('Euro', 'EUR', '€', 1.08),
+    ('Ukrainian hryvnia', 'UAH', '₴', 0.025),
+    ('Polish zloty', 'PLN', 'zł', 0.25),
+]
+
+
+class CategoryProfile(NamedTuple):
+    # Share of a customer's categorized operations, relative to the other categories.
+    weight: float
+    # Median amount and spread, the standard deviation of the amount's logarithm.
+    median: float
+    sigma: float
+    is_income: bool = False
+
+
+CATEGORY_PROFILES = {
+    'Groceries': CategoryProfile(30, 35, 0.6),
+    'Restaurants': CategoryProfile(15, 40, 0.6),
+    'Transport': CategoryProfile(20, 15, 0.7),
+    'Entertainment': CategoryProfile(8, 30, 0.8),
+    'Health': CategoryProfile(5, 60, 1.0),
+    'Gifts': CategoryProfile(4, 50, 0.9),
+    'Utilities': CategoryProfile(4, 120, 0.4),
+    'Travel': CategoryProfile(2, 400, 0.9),
+    'Rent': CategoryProfile(2, 900, 0.25),
+    'Salary': CategoryProfile(3, 2500, 0.35, is_income=True),
+}
+# Operations without a category: mostly small purchases, some transfers in.
+UNCATEGORIZED_EXPENSE = CategoryProfile(0, 25, 1.1)
+UNCATEGORIZED_INCOME = CategoryProfile(0, 200, 0.9, is_income=True)
+UNCATEGORIZED_INCOME_SHARE = 0.1
+CATEGORIZED_SHARE = 0.8
+
+# Relative volume of operations by weekday from Monday, and by hour of the day.
+WEEKDAY_WEIGHTS = (0.9, 0.9, 0.95, 1.0, 1.2, 1.4, 0.8)
+HOUR_WEIGHTS = (
+    0.2, 0.1, 0.05, 0.05, 0.05, 0.1, 0.3, 0.7, 1.0, 1.1, 1.2, 1.4,
+    1.6, 1.5, 1.3, 1.3, 1.4, 1.7, 2.0, 1.9, 1.6, 1.2, 0.8, 0.4,
+)
+# Spending peaks around this day of the year (Christmas) by this much, and dips half a year later.
+SEASON_PEAK_DAY = 355
+SEASON_AMPLITUDE = 0.25
+# Operations per day grow by this much from the first to the last generated day.
+VOLUME_GROWTH = 1.0
+# Shape of the Pareto distribution of activity between customers, about 80% of operations belong to 20% of them.
+CUSTOMER_ACTIVITY_ALPHA = 1.16
+
+
+def get_load_phone(index: int, prefix: str = LOAD_PHONE_PREFIX) -> str:
+    return f'{prefix}{index:09d}'
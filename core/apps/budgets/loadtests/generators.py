@@ -0,0 +1,274 @@
+"""
+Synthetic load test data as rows in the text format of PostgreSQL COPY.
+
+Rows only depend on the seed, sizes, first day, chunk size and the ids they are given, never on the number of
+processes generating them. Nothing here touches Django, so process pool workers do not need the project set up.
+"""
+import math
+import random
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from itertools import accumulate
+from typing import Any, Iterable, Optional
+
+from core.apps.budgets.loadtests.datasets import (
+    CATEGORIZED_SHARE, CATEGORY_PROFILES, CUSTOMER_ACTIVITY_ALPHA, HOUR_WEIGHTS, SEASON_AMPLITUDE, SEASON_PEAK_DAY,
+    UNCATEGORIZED_EXPENSE, UNCATEGORIZED_INCOME, UNCATEGORIZED_INCOME_SHARE, VOLUME_GROWTH, WEEKDAY_WEIGHTS,
+    CategoryProfile, get_load_phone
+)
+
+COPY_NULL = '\\N'
+MAX_AMOUNT = 999_999.99
+# Keeps a few extremely active customers from taking over the whole dataset.
+MAX_CUSTOMER_ACTIVITY = 1000.0
+
+CUSTOMER_COLUMNS = ('id', 'username', 'phone', 'token_version', 'created_at', 'updated_at')
+BUDGET_COLUMNS = (
+    'id', 'title', 'initial_amount', 'current_balance', 'add_operations_count', 'sub_operations_count',
+    'related_currency_id', 'related_customer_id', 'created_at', 'updated_at',
+)
+CATEGORY_COLUMNS = ('id', 'name', 'related_customer_id', 'created_at', 'updated_at')
+OPERATION_COLUMNS = (
+    'title', 'operation_type', 'amount', 'related_budget_id', 'related_category_id', 'created_at', 'updated_at',
+)
+
+# Category names by falling share, a customer with n categories gets the n most common ones.
+CATEGORY_NAMES_BY_WEIGHT = sorted(CATEGORY_PROFILES, key=lambda name: -CATEGORY_PROFILES[name].weight)
+HOUR_CUM_WEIGHTS = list(accumulate(HOUR_WEIGHTS))
+
+
+def format_copy_value(value: Any) -> str:
+    """
+    Values are generated and never contain tabs, newlines or backslashes, so they need no escaping.
+    Datetimes are written as naive UTC, the storage format of SQLite and the session time zone Django sets on
+    PostgreSQL.
+    """
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S.%f')
+
+    return str(value)
+
+
+def format_copy_rows(rows: Iterable[tuple]) -> str:
+    return ''.join('\t'.join(map(format_copy_value, row)) + '\n' for row in rows)
+
+
+def parse_copy_rows(buffer: str) -> list[tuple[Optional[str], ...]]:
+    return [
+        tuple(None if value == COPY_NULL else value for value in line.split('\t'))
+        for line in buffer.splitlines()
+    ]
+
+
+def get_season_factor(day: date) -> float:
+    return 1 + SEASON_AMPLITUDE * math.cos(2 * math.pi * (day.timetuple().tm_yday - SEASON_PEAK_DAY) / 365.25)
+
+
+def get_day_weights(first_day: date, days: int) -> list[float]:
+    """
+    Relative volume of operations on each day: seasonal, higher on weekends and growing over the period.
+    """
+    weights = []
+    for index in range(days):
+        day = first_day + timedelta(days=index)
+        growth = 1 + VOLUME_GROWTH * index / max(days - 1, 1)
+        weights.append(get_season_factor(day) * WEEKDAY_WEIGHTS[day.weekday()] * growth)
+
+    return weights
+
+
+def split_count(total: int, weights: list[float]) -> list[int]:
+    """
+    Split a total proportionally to weights, giving the rounding remainder to the largest fractions.
+    """
+    weight_sum = sum(weights)
+    shares = [total * weight / weight_sum for weight in weights]
+    counts = [int(share) for share in shares]
+
+    by_fraction = sorted(range(len(shares)), key=lambda index: counts[index] - shares[index])
+    for index in by_fraction[:total - sum(counts)]:
+        counts[index] += 1
+
+    return counts
+
+
+def get_customer_activities(rng: random.Random, count: int) -> list[float]:
+    return [min(rng.paretovariate(CUSTOMER_ACTIVITY_ALPHA), MAX_CUSTOMER_ACTIVITY) for _ in range(count)]
+
+
+@dataclass(frozen=True)
+class OperationChunk:
+    index: int
+    # Operations to generate per day, as (day index, count) in day order.
+    segments: tuple[tuple[int, int], ...]
+
+    @property
+    def size(self) -> int:
+        return sum(count for _, count in self.segments)
+
+
+def plan_operation_chunks(day_counts: list[int], chunk_size: int) -> list[OperationChunk]:
+    """
+    Cut the days into chunks of about chunk_size operations. Chunks are written in order and rows in a chunk are
+    sorted by time, so ids and physical order grow with creation time as in a table filled by real traffic.
+    """
+    chunks, segments, size = [], [], 0
+
+    for day_index, count in enumerate(day_counts):
+        while count:
+            taken = min(count, chunk_size - size)
+            segments.append((day_index, taken))
+            size += taken
+            count -= taken
+
+            if size == chunk_size:
+                chunks.append(OperationChunk(index=len(chunks), segments=tuple(segments)))
+                segments, size = [], 0
+
+    if segments:
+        chunks.append(OperationChunk(index=len(chunks), segments=tuple(segments)))
+
+    return chunks
+
+
+@dataclass
+class OperationPlan:
+    """
+    Everything chunk workers share: budgets with their weights and the categories of their customers.
+    """
+    seed: int
+    first_day: date
+    budget_ids: list[int] = field(default_factory=list)
+    budget_cum_weights: list[float] = field(default_factory=list)
+    # Per budget, the categories of its customer as (ids, names, cumulative weights).
+    budget_categories: list[tuple[list[int], list[str], list[float]]] = field(default_factory=list)
+
+
+_operation_plan: Optional[OperationPlan] = None
+
+
+def init_operation_worker(plan: OperationPlan) -> None:
+    """
+    Process pool initializer, sends the plan once per process instead of with every chunk.
+    """
+    global _operation_plan
+    _operation_plan = plan
+
+
+def _get_amount(rng: random.Random, profile: CategoryProfile, season: float) -> str:
+    amount = rng.lognormvariate(math.log(profile.median), profile.sigma)
+    if not profile.is_income:
+        amount *= season
+
+    return f'{min(max(amount, 0.01), MAX_AMOUNT):.2f}'
+
+
+def generate_operation_chunk(chunk: OperationChunk) -> str:
+    plan = _operation_plan
+    rng = random.Random(f'{plan.seed}:operations:{chunk.index}')
+    budget_indexes = range(len(plan.budget_ids))
+    lines = []
+
+    for day_index, count in chunk.segments:
+        day = plan.first_day + timedelta(days=day_index)
+        day_prefix = f'{day.isoformat()} '
+        season = get_season_factor(day)
+
+        budgets = rng.choices(budget_indexes, cum_weights=plan.budget_cum_weights, k=count)
+        hours = rng.choices(range(24), cum_weights=HOUR_CUM_WEIGHTS, k=count)
+        seconds = sorted(hour * 3600 + rng.randrange(3600) for hour in hours)
+
+        for budget_index, second in zip(budgets, seconds):
+            category_ids, category_names, category_cum_weights = plan.budget_categories[budget_index]
+            if category_ids and rng.random() < CATEGORIZED_SHARE:
+                category = rng.choices(range(len(category_ids)), cum_weights=category_cum_weights)[0]
+                category_id, title = category_ids[category], category_names[category]
+                profile = CATEGORY_PROFILES[title]
+            else:
+                category_id = COPY_NULL
+                profile = UNCATEGORIZED_INCOME if rng.random() < UNCATEGORIZED_INCOME_SHARE else UNCATEGORIZED_EXPENSE
+                title = 'Income' if profile.is_income else 'Expense'
+
+            created_at = (
+                f'{day_prefix}{second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d}'
+                f'.{rng.randrange(1_000_000):06d}'
+            )
+            lines.append(
+                f'{title}\t{"ADD" if profile.is_income else "SUB"}\t{_get_amount(rng, profile, season)}\t'
+                f'{plan.budget_ids[budget_index]}\t{category_id}\t{created_at}\t{created_at}\n'
+            )
+
+    return ''.join(lines)
+
+
+@dataclass
+class CustomerRows:
+    """
+    Customers, budgets and categories, generated in the parent process from ids reserved up front.
+    """
+    customers: list[tuple] = field(default_factory=list)
+    budgets: list[tuple] = field(default_factory=list)
+    categories: list[tuple] = field(default_factory=list)
+    plan: Optional[OperationPlan] = None
+
+
+def generate_customer_rows(
+        seed: int,
+        customers: int,
+        budgets: int,
+        categories: int,
+        currency_ids: list[int],
+        first_ids: tuple[int, int, int],
+        first_day: date
+) -> CustomerRows:
+    """
+    Budgets and categories go to customers in proportion to their Pareto distributed activity, and a customer's
+    activity is split between their budgets, so a few customers own most budgets and most operations.
+    """
+    rng = random.Random(f'{seed}:customers')
+    first_customer_id, first_budget_id, first_category_id = first_ids
+    created_at = datetime.combine(first_day, datetime.min.time())
+    rows = CustomerRows(plan=OperationPlan(seed=seed, first_day=first_day))
+
+    activities = get_customer_activities(rng, customers)
+    customer_cum_weights = list(accumulate(activities))
+    for index in range(customers):
+        rows.customers.append(
+            (first_customer_id + index, f'load-{index}', get_load_phone(index), 0, created_at, created_at)
+        )
+
+    customer_categories: dict[int, tuple[list[int], list[str], list[float]]] = {}
+    owners = rng.choices(range(customers), cum_weights=customer_cum_weights, k=categories) if customers else []
+    for index, owner in enumerate(owners):
+        category_id = first_category_id + index
+        ids, names, cum_weights = customer_categories.setdefault(owner, ([], [], []))
+        name = CATEGORY_NAMES_BY_WEIGHT[len(ids) % len(CATEGORY_NAMES_BY_WEIGHT)]
+
+        ids.append(category_id)
+        names.append(name)
+        cum_weights.append((cum_weights[-1] if cum_weights else 0) + CATEGORY_PROFILES[name].weight)
+        rows.categories.append((category_id, name, first_customer_id + owner, created_at, created_at))
+
+    owners = rng.choices(range(customers), cum_weights=customer_cum_weights, k=budgets) if customers else []
+    budget_shares = [rng.lognormvariate(0, 0.5) for _ in owners]
+    customer_shares: dict[int, float] = {}
+    for owner, share in zip(owners, budget_shares):
+        customer_shares[owner] = customer_shares.get(owner, 0) + share
+
+    weight_sum = 0.0
+    for index, (owner, share) in enumerate(zip(owners, budget_shares)):
+        budget_id = first_budget_id + index
+        rows.budgets.append((
+            budget_id, f'Budget {index}', Decimal(rng.randrange(0, 1_000_000)), Decimal(0), 0, 0,
+            rng.choice(currency_ids), first_customer_id + owner, created_at, created_at,
+        ))
+
+        weight_sum += activities[owner] * share / customer_shares[owner]
+        rows.plan.budget_ids.append(budget_id)
+        rows.plan.budget_cum_weights.append(weight_sum)
+        rows.plan.budget_categories.append(customer_categories.get(owner, ([], [], [])))
+
+    return rows
@@ -0,0 +1,200 @@
+import json
+import random
+import threading
+import warnings
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from statistics import fmean, quantiles
+from time import perf_counter
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from core.apps.budgets.loadtests.scenarios import LoadFixtures, LoadRequest, Scenario
+
+
+class LoadClient:
+    """
+    One keep-alive HTTP connection to the server under test, reopened after errors.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 30.0):
+        url = urlsplit(base_url)
+        self.connection_class = HTTPSConnection if url.scheme == 'https' else HTTPConnection
+        self.netloc = url.netloc
+        self.timeout = timeout
+        self.connection: Optional[HTTPConnection] = None
+
+    def send(self, request: LoadRequest) -> tuple[int, bytes]:
+        headers = {'Accept': 'application/json'}
+        body = None
+        if request.token is not None:
+            headers['Authorization'] = f'Bearer {request.token}'
+        if request.body is not None:
+            headers['Content-Type'] = 'application/json'
+            body = json.dumps(request.body).encode()
+
+        if self.connection is None:
+            self.connection = self.connection_class(self.netloc, timeout=self.timeout)
+
+        try:
+            self.connection.request(request.method, request.path, body=body, headers=headers)
+            response = self.connection.getresponse()
+            return response.status, response.read()
+        except (OSError, HTTPException):
+            self.connection.close()
+            self.connection = None
+            raise
+
+    def send_json(self, request: LoadRequest) -> tuple[int, Any]:
+        status, content = self.send(request)
+        try:
+            return status, json.loads(content)
+        except ValueError:
+            return status, None
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    method: str
+    route: str
+    seconds: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    queries: Optional[int] = None
+
+    @property
+    def requests(self) -> int:
+        return sum(self.statuses.values())
+
+    @property
+    def failures(self) -> int:
+        return sum(count for status, count in self.statuses.items() if not str(status).startswith('2'))
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.seconds if self.seconds else 0.0
+
+    def get_latency_ms(self) -> dict[str, float]:
+        if not self.latencies:
+            return {}
+
+        latencies = [latency * 1000 for latency in self.latencies]
+        percentiles = quantiles(latencies, n=100, method='inclusive') if len(latencies) > 1 else latencies * 99
+
+        return {
+            'mean': round(fmean(latencies), 3),
+            'p50': round(percentiles[49], 3),
+            'p95': round(percentiles[94], 3),
+            'p99': round(percentiles[98], 3),
+            'max': round(max(latencies), 3),
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'method': self.method,
+            'route': self.route,
+            'requests': self.requests,
+            'failures': self.failures,
+            'statuses': {str(status): count for status, count in sorted(self.statuses.items(), key=str)},
+            'seconds': round(self.seconds, 3),
+            'throughput': round(self.throughput, 2),
+            'latency_ms': self.get_latency_ms(),
+            'queries_per_request': self.queries,
+        }
+
+
+def count_queries(request: LoadRequest) -> int:
+    """
+    Replay a request in this process and count its SQL queries, caches of the server do not apply here.
+    """
+    headers = {'HTTP_AUTHORIZATION': f'Bearer {request.token}'} if request.token is not None else {}
+    data = json.dumps(request.body) if request.body is not None else ''
+
+    with override_settings(ALLOWED_HOSTS=['*']), CaptureQueriesContext(connection) as context:
+        response = Client().generic(
+            request.method, request.path, data=data, content_type='application/json', **headers
+        )
+        if response.streaming:
+            with warnings.catch_warnings():
+                # Exports stream asynchronously, the test client consumes them synchronously.
+                warnings.simplefilter('ignore')
+                b''.join(response)
+
+    return len(context.captured_queries)
+
+
+class LoadRunner:
+    """
+    Runs scenarios one after another, each as a fixed number of requests shared by concurrent clients.
+
+    Requests are built up front from a seeded generator, so runs with the same seed and dataset send the same
+    requests. Latency is measured per request from sending to reading the whole response.
+    """
+
+    def __init__(self, base_url: str, clients: int, requests: int, seed: int, timeout: float = 30.0):
+        self.base_url = base_url
+        self.clients = clients
+        self.requests = requests
+        self.seed = seed
+        self.timeout = timeout
+
+    def _send_untimed(self, request: LoadRequest) -> tuple[int, Any]:
+        return LoadClient(self.base_url, self.timeout).send_json(request)
+
+    def _build_requests(self, scenario: Scenario, fixtures: LoadFixtures) -> list[LoadRequest]:
+        rng = random.Random(f'{self.seed}:{scenario.name}')
+        # One more request than measured, replayed in-process to count queries.
+        if scenario.prepare is not None:
+            scenario.prepare(fixtures, rng, self.requests + 1, self._send_untimed)
+
+        requests = (scenario.build(fixtures, rng, index) for index in range(self.requests + 1))
+        return [request for request in requests if request is not None]
+
+    def run(self, scenario: Scenario, fixtures: LoadFixtures) -> ScenarioResult:
+        result = ScenarioResult(name=scenario.name, method=scenario.method, route=scenario.route)
+        requests = self._build_requests(scenario, fixtures)
+        if not requests:
+            return result
+
+        if scenario.count_queries:
+            result.queries = count_queries(requests.pop(0))
+        else:
+            requests.pop(0)
+
+        pending = iter(requests)
+        lock = threading.Lock()
+
+        def run_client() -> None:
+            client = LoadClient(self.base_url, self.timeout)
+            while True:
+                with lock:
+                    request = next(pending, None)
+                if request is None:
+                    return
+
+                started_at = perf_counter()
+                try:
+                    status, _ = client.send(request)
+                except (OSError, HTTPException) as exception:
+                    status = type(exception).__name__
+                latency = perf_counter() - started_at
+
+                with lock:
+                    result.statuses[status] += 1
+                    result.latencies.append(latency)
+
+        started_at = perf_counter()
+        with ThreadPoolExecutor(max_workers=self.clients) as executor:
+            for future in [executor.submit(run_client) for _ in range(self.clients)]:
+                future.result()
+        result.seconds = perf_counter() - started_at
+
+        return result
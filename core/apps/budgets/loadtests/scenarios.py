@@ -0,0 +1,356 @@
+import random
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Callable, Optional
+
+from django.db.models import Exists, OuterRef
+
+from core.apps.budgets.loadtests.datasets import LOAD_PHONE_PREFIX, LOAD_SIGN_IN_PHONE_PREFIX, get_load_phone
+from core.apps.budgets.models import (
+    Budget as BudgetModel, Category as CategoryModel, Currency as CurrencyModel, Operation as OperationModel
+)
+from core.apps.budgets.services.budgets import BaseBudgetService
+from core.apps.budgets.services.operations import BaseCategoryService, BaseOperationService
+from core.apps.customers.entities.customers import Customer
+from core.apps.customers.models import Customer as CustomerModel
+from core.apps.customers.services.codes import BaseCodeService
+from core.apps.customers.services.tokens import BaseTokenService
+from core.project.ioc_containers import get_ioc_container
+
+API_PREFIX = '/api/v1/'
+
+
+@dataclass(frozen=True)
+class LoadRequest:
+    method: str
+    path: str
+    body: Any = None
+    token: Optional[str] = None
+
+
+@dataclass
+class LoadCustomer:
+    entity: Customer
+    access_token: str
+    refresh_token: str
+    budget_ids: list[int]
+    category_ids: list[int]
+    operation_ids: list[int]
+
+
+@dataclass
+class LoadFixtures:
+    """
+    Seeded customers the scenarios act as, with ids of their objects.
+
+    `targets` holds what a request uses up, e.g. a budget to delete or a code to confirm, prepared per scenario.
+    """
+    customers: list[LoadCustomer]
+    currencies: list[str]
+    targets: dict[str, deque] = field(default_factory=lambda: defaultdict(deque))
+
+    def pick(self, rng: random.Random) -> LoadCustomer:
+        return rng.choice(self.customers)
+
+
+# Builds the request of the given index, None when the scenario has nothing left to send.
+Build = Callable[[LoadFixtures, random.Random, int], Optional[LoadRequest]]
+# Sends a request outside the measured run, returns the status and the decoded JSON body.
+Send = Callable[[LoadRequest], tuple[int, Any]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    method: str
+    route: str
+    build: Build
+    prepare: Optional[Callable[[LoadFixtures, random.Random, int, Send], None]] = None
+    # Requests that depend on state of the server process, e.g. codes in its cache, cannot be replayed in-process.
+    count_queries: bool = True
+
+
+def load_fixtures(customers: int) -> LoadFixtures:
+    """
+    Seeded customers having budgets, categories and operations, with fresh tokens.
+    """
+    token_service = get_ioc_container().resolve(BaseTokenService)
+    queryset = CustomerModel.objects.filter(
+        Exists(BudgetModel.objects.filter(related_customer_id=OuterRef('id'))),
+        Exists(CategoryModel.objects.filter(related_customer_id=OuterRef('id'))),
+        Exists(OperationModel.objects.filter(related_budget__related_customer_id=OuterRef('id'))),
+        phone__startswith=LOAD_PHONE_PREFIX,
+    ).order_by('id')[:customers]
+
+    load_customers = []
+    for customer in queryset:
+        entity = customer.to_entity()
+        tokens = token_service.issue_tokens(customer=entity, token_version=customer.token_version)
+        load_customers.append(LoadCustomer(
+            entity=entity,
+            access_token=tokens.access_token,
+            refresh_token=tokens.refresh_token,
+            budget_ids=list(BudgetModel.objects.filter(related_customer=customer).values_list('id', flat=True)),
+            category_ids=list(CategoryModel.objects.filter(related_customer=customer).values_list('id', flat=True)),
+            operation_ids=list(
+                OperationModel.objects.filter(related_budget__related_customer=customer)
+                .order_by('-id').values_list('id', flat=True)[:100]
+            ),
+        ))
+
+    return LoadFixtures(
+        customers=load_customers,
+        currencies=list(CurrencyModel.objects.order_by('id').values_list('short_name', flat=True)),
+    )
+
+
+def _get(path: str) -> Build:
+    """
+    Build GETs of a path formatted with ids of a random customer's budget, category and operation.
+    """
+    def build(fixtures: LoadFixtures, rng: random.Random, index: int) -> LoadRequest:
+        customer = fixtures.pick(rng)
+        return LoadRequest('GET', API_PREFIX + path.format(
+            budget_id=rng.choice(customer.budget_ids),
+            category_id=rng.choice(customer.category_ids),
+            operation_id=rng.choice(customer.operation_ids),
+            currency=rng.choice(fixtures.currencies),
+        ), token=customer.access_token)
+
+    return build
+
+
+def _pop_target(name: str, method: str, path: str) -> Build:
+    def build(fixtures: LoadFixtures, rng: random.Random, index: int) -> Optional[LoadRequest]:
+        try:
+            customer, target_id = fixtures.targets[name].popleft()
+        except IndexError:
+            return None
+
+        return LoadRequest(method, API_PREFIX + path.format(id=target_id), token=customer.access_token)
+
+    return build
+
+
+def _get_amount(rng: random.Random) -> str:
+    return str(Decimal(rng.lognormvariate(3.5, 1.2)).quantize(Decimal('0.01')))
+
+
+def _build_operation(customer: LoadCustomer, rng: random.Random, index: int) -> dict:
+    return {
+        'title': f'Load operation {index}',
+        'operation_type': 'SUB' if rng.random() < 0.7 else 'ADD',
+        'amount': _get_amount(rng),
+        'related_budget_id': rng.choice(customer.budget_ids),
+        'related_category_id': rng.choice(customer.category_ids),
+    }
+
+
+def build_budget_create(fixtures: LoadFixtures, rng: random.Random, index: int) -> LoadRequest:
+    customer = fixtures.pick(rng)
+    return LoadRequest('POST', API_PREFIX + 'management/budgets', {
+        'title': f'Load budget {index}',
+        'initial_amount': _get_amount(rng),
+        'related_currency_short_name': rng.choice(fixtures.currencies),
+    }, token=customer.access_token)
+
+
+def build_budget_update(fixtures: LoadFixtures, rng: random.Random, index: int) -> LoadRequest:
+    customer = fixtures.pick(rng)
+    budget_id = rng.choice(customer.budget_ids)
+    return LoadRequest(
+        'PUT', API_PREFIX + f'management/budgets/{budget_id}', {'title': f'Budget {index}'}, token=customer.access_token
+    )
+
+
+def build_category_create(fixtures: LoadFixtures, rng: random.Random, index: int) -> LoadRequest:
+    customer = fixtures.pick(rng)
+    return LoadRequest(
+        'POST', API_PREFIX + 'management/categories', {'name': f'Load category {index}'}, token=customer.access_token
+    )
+
+
+def build_category_update(fixtures: LoadFixtures, rng: random.Random, index: int) -> LoadRequest:
+    customer = fixtures.pick(rng)
+    category_id = rng.choice(customer.category_ids)
+    return LoadRequest(
+        'PUT', API_PREFIX + f'management/categories/{category_id}', {'name': f'Category {index}'},
+        token=customer.access_token
+    )
+
+
+def build_operation_create(fixtures: LoadFixtures, rng: random.Random, index: int) -> LoadRequest:
+    customer = fixtures.pick(rng)
+    return LoadRequest(
+        'POST', API_PREFIX + 'management/operations', _build_operation(customer, rng, index),
+        token=customer.access_token
+    )
+
+
+def build_operation_bulk(fixtures: LoadFixtures, rng: random.Random, index: int) -> LoadRequest:
+    customer = fixtures.pick(rng)
+    return LoadRequest('POST', API_PREFIX + 'management/operations/bulk', [
+        _build_operation(customer, rng, index * 100 + offset) for offset in range(100)
+    ], token=customer.access_token)
+
+
+def build_operation_update(fixtures: LoadFixtures, rng: random.Random, index: int) -> LoadRequest:
+    customer = fixtures.pick(rng)
+    operation_id = rng.choice(customer.operation_ids)
+    return LoadRequest(
+        'PUT', API_PREFIX + f'management/operations/{operation_id}', {'amount': _get_amount(rng)},
+        token=customer.access_token
+    )
+
+
+def prepare_budgets(fixtures: LoadFixtures, rng: random.Random, count: int, send: Send) -> None:
+    service = get_ioc_container().resolve(BaseBudgetService)
+    for index in range(count):
+        customer = fixtures.pick(rng)
+        budget = service.create_budget(
+            title=f'Budget to delete {index}',
+            initial_amount=None,
+            related_currency_short_name=rng.choice(fixtures.currencies),
+            related_customer=customer.entity,
+        )
+        fixtures.targets['budgets'].append((customer, budget.id))
+
+
+def prepare_categories(fixtures: LoadFixtures, rng: random.Random, count: int, send: Send) -> None:
+    service = get_ioc_container().resolve(BaseCategoryService)
+    for index in range(count):
+        customer = fixtures.pick(rng)
+        category = service.create_category(name=f'Category to delete {index}', related_customer=customer.entity)
+        fixtures.targets['categories'].append((customer, category.id))
+
+
+def prepare_operations(fixtures: LoadFixtures, rng: random.Random, count: int, send: Send) -> None:
+    service = get_ioc_container().resolve(BaseOperationService)
+    for index in range(count):
+        customer = fixtures.pick(rng)
+        operation = service.create_operation(
+            related_customer=customer.entity, **_build_operation(customer, rng, index) | {'amount': Decimal('0.01')}
+        )
+        fixtures.targets['operations'].append((customer, operation.id))
+
+
+def build_auth(fixtures: LoadFixtures, rng: random.Random, index: int) -> LoadRequest:
+    return LoadRequest('POST', API_PREFIX + 'customers/auth', {
+        'phone': get_load_phone(index, LOAD_SIGN_IN_PHONE_PREFIX),
+        'username': f'load-sign-in-{index}',
+    })
+
+
+def prepare_codes(fixtures: LoadFixtures, rng: random.Random, count: int, send: Send) -> None:
+    """
+    Request codes through the server and read them from the code service, which needs
+    the cache of the server (`CACHE_URL`).
+    """
+    code_service = get_ioc_container().resolve(BaseCodeService)
+    for index in range(count):
+        phone = get_load_phone(index, LOAD_SIGN_IN_PHONE_PREFIX)
+        status, _ = send(build_auth(fixtures, rng, index))
+        customer = CustomerModel.objects.filter(phone=phone).first()
+        code = code_service.get_code(customer=customer.to_entity()) if customer is not None else None
+        if status == 200 and code is not None:
+            fixtures.targets['codes'].append((phone, code))
+
+
+def build_confirm(fixtures: LoadFixtures, rng: random.Random, index: int) -> Optional[LoadRequest]:
+    try:
+        phone, code = fixtures.targets['codes'].popleft()
+    except IndexError:
+        return None
+
+    return LoadRequest('POST', API_PREFIX + 'customers/confirm', {'phone': phone, 'code': code})
+
+
+def build_refresh(fixtures: LoadFixtures, rng: random.Random, index: int) -> LoadRequest:
+    return LoadRequest('POST', API_PREFIX + 'customers/refresh', {'refresh_token': fixtures.pick(rng).refresh_token})
+
+
+def prepare_sessions(fixtures: LoadFixtures, rng: random.Random, count: int, send: Send) -> None:
+    """
+    Sign in customers of their own for logging out, which revokes the refresh tokens of the customer.
+    """
+    token_service = get_ioc_container().resolve(BaseTokenService)
+    for index in range(count):
+        customer, _ = CustomerModel.objects.get_or_create(
+            phone=get_load_phone(index, LOAD_SIGN_IN_PHONE_PREFIX), defaults={'username': f'load-sign-in-{index}'}
+        )
+        tokens = token_service.issue_tokens(customer=customer.to_entity(), token_version=customer.token_version)
+        fixtures.targets['sessions'].append(tokens.access_token)
+
+
+def build_logout(fixtures: LoadFixtures, rng: random.Random, index: int) -> Optional[LoadRequest]:
+    try:
+        token = fixtures.targets['sessions'].popleft()
+    except IndexError:
+        return None
+
+    return LoadRequest('POST', API_PREFIX + 'customers/logout', token=token)
+
+
+def build_profile_update(fixtures: LoadFixtures, rng: random.Random, index: int) -> LoadRequest:
+    customer = fixtures.pick(rng)
+    return LoadRequest(
+        'PUT', API_PREFIX + 'customers/profile', {'username': f'load-{customer.entity.id}'}, token=customer.access_token
+    )
+
+
+SCENARIOS = [
+    Scenario('currencies_list', 'GET', 'management/currencies', _get('management/currencies')),
+    Scenario('currency_detail', 'GET', 'management/currencies/{short_name}', _get('management/currencies/{currency}')),
+    Scenario('budgets_list', 'GET', 'management/budgets', _get('management/budgets')),
+    Scenario('budget_detail', 'GET', 'management/budgets/{budget_id}', _get('management/budgets/{budget_id}')),
+    Scenario(
+        'budget_operations', 'GET', 'management/budgets/{budget_id}/operations',
+        _get('management/budgets/{budget_id}/operations?limit=50')
+    ),
+    Scenario('budget_create', 'POST', 'management/budgets', build_budget_create),
+    Scenario('budget_update', 'PUT', 'management/budgets/{budget_id}', build_budget_update),
+    Scenario(
+        'budget_delete', 'DELETE', 'management/budgets/{budget_id}',
+        _pop_target('budgets', 'DELETE', 'management/budgets/{id}'), prepare_budgets
+    ),
+    Scenario('categories_list', 'GET', 'management/categories', _get('management/categories')),
+    Scenario(
+        'category_detail', 'GET', 'management/categories/{category_id}', _get('management/categories/{category_id}')
+    ),
+    Scenario('category_create', 'POST', 'management/categories', build_category_create),
+    Scenario('category_update', 'PUT', 'management/categories/{category_id}', build_category_update),
+    Scenario(
+        'category_delete', 'DELETE', 'management/categories/{category_id}',
+        _pop_target('categories', 'DELETE', 'management/categories/{id}'), prepare_categories
+    ),
+    Scenario('operations_list', 'GET', 'management/operations', _get('management/operations?limit=50')),
+    Scenario(
+        'operation_detail', 'GET', 'management/operations/{operation_id}', _get('management/operations/{operation_id}')
+    ),
+    Scenario(
+        'operations_export', 'GET', 'management/operations/export',
+        _get('management/operations/export?format=ndjson&budget_id={budget_id}')
+    ),
+    Scenario('operation_create', 'POST', 'management/operations', build_operation_create),
+    Scenario('operations_bulk', 'POST', 'management/operations/bulk', build_operation_bulk),
+    Scenario('operation_update', 'PUT', 'management/operations/{operation_id}', build_operation_update),
+    Scenario(
+        'operation_delete', 'DELETE', 'management/operations/{operation_id}',
+        _pop_target('operations', 'DELETE', 'management/operations/{id}'), prepare_operations
+    ),
+    Scenario('report_types', 'GET', 'management/reports/types', _get('management/reports/types')),
+    Scenario('report_categories', 'GET', 'management/reports/categories', _get('management/reports/categories')),
+    Scenario('report_periods', 'GET', 'management/reports/periods', _get('management/reports/periods?period=month')),
+    Scenario(
+        'report_consolidated', 'GET', 'management/reports/consolidated',
+        _get('management/reports/consolidated?currency={currency}')
+    ),
+    Scenario('dashboard', 'GET', 'dashboard', _get('dashboard')),
+    Scenario('profile', 'GET', 'customers/profile', _get('customers/profile')),
+    Scenario('profile_update', 'PUT', 'customers/profile', build_profile_update),
+    Scenario('auth', 'POST', 'customers/auth', build_auth),
+    Scenario('confirm', 'POST', 'customers/confirm', build_confirm, prepare_codes, count_queries=False),
+    Scenario('refresh', 'POST', 'customers/refresh', build_refresh),
+    Scenario('logout', 'POST', 'customers/logout', build_logout, prepare_sessions),
+]
@@ -0,0 +1,61 @@
+from django.db import connection
+from django.db.models import Max, Model
+
+from core.apps.budgets.loadtests.generators import parse_copy_rows
+
+
+def is_copy_available() -> bool:
+    return connection.vendor == 'postgresql'
+
+
+def reserve_ids(model: type[Model], count: int) -> int:
+    """
+    Move the id sequence of a model's table past count ids and return the first of them, so rows can be
+    generated with their ids before they are written.
+    """
+    if not count:
+        return 0
+
+    if not is_copy_available():
+        return (model.objects.aggregate(last_id=Max('id'))['last_id'] or 0) + 1
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT setval(pg_get_serial_sequence(%s, 'id'), nextval(pg_get_serial_sequence(%s, 'id')) + %s - 1)",
+            [model._meta.db_table, model._meta.db_table, count],
+        )
+        last_id = cursor.fetchone()[0]
+
+    return last_id - count + 1
+
+
+def copy_rows(model: type[Model], columns: tuple[str, ...], buffer: str) -> None:
+    """
+    Write rows in COPY text format with COPY FROM STDIN on PostgreSQL. Other backends insert them in one
+    executemany, enough for the small datasets of tests.
+    """
+    if not buffer:
+        return
+
+    table = connection.ops.quote_name(model._meta.db_table)
+    column_list = ', '.join(connection.ops.quote_name(column) for column in columns)
+
+    with connection.cursor() as cursor:
+        if is_copy_available():
+            with cursor.copy(f'COPY {table} ({column_list}) FROM STDIN') as copy:
+                copy.write(buffer)
+        else:
+            placeholders = ', '.join(['%s'] * len(columns))
+            cursor.executemany(f'INSERT INTO {table} ({column_list}) VALUES ({placeholders})', parse_copy_rows(buffer))
+
+
+def analyze(*models: type[Model]) -> None:
+    """
+    Refresh planner statistics after bulk loads, so queries against the new rows get realistic plans.
+    """
+    if not is_copy_available():
+        return
+
+    tables = ', '.join(connection.ops.quote_name(model._meta.db_table) for model in models)
+    with connection.cursor() as cursor:
+        cursor.execute(f'ANALYZE {tables}')
@@ -0,0 +1,81 @@
+from datetime import timedelta
+from decimal import Decimal
+from timeit import Timer
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from ninja.renderers import JSONRenderer
+
+from core.api.renderers import ORJSONRenderer
+
+
+def build_operation_page(items: int) -> dict:
+    """
+    An operations list response as the handler renders it, with nested budget, currency, customer and category.
+    """
+    now = timezone.now()
+    customer = {'id': 1, 'created_at': now, 'updated_at': now, 'username': 'customer', 'phone': '380000000000'}
+    budget = {
+        'id': 1,
+        'created_at': now,
+        'updated_at': now,
+        'title': 'Household',
+        'initial_amount': Decimal('15000.00'),
+        'current_balance': Decimal('8342.17'),
+        'add_operations_count': items // 2,
+        'sub_operations_count': items - items // 2,
+        'related_currency': {'id': 1, 'name': 'Ukrainian hryvnia', 'short_name': 'UAH', 'symbol': '₴'},
+        'related_customer': customer,
+    }
+    category = {'id': 1, 'created_at': now, 'updated_at': now, 'name': 'Groceries', 'related_customer': customer}
+    operations = [
+        {
+            'id': index,
+            'created_at': now - timedelta(minutes=index),
+            'updated_at': now - timedelta(minutes=index),
+            'title': f'Operation {index}',
+            'operation_type': 'ADD' if index % 2 else 'SUB',
+            'amount': Decimal(index * 37 % 100000) / 100,
+            'related_budget': budget,
+            'related_category': category if index % 3 else None,
+        }
+        for index in range(items)
+    ]
+
+    return {
+        'data': {
+            'items': operations,
+            'pagination': {'offset': 0, 'limit': items, 'total': items, 'has_more': None, 'next_cursor': None},
+        },
+        'meta': {},
+        'errors': [],
+    }
+
+
+class Command(BaseCommand):
+    help = 'Compare API renderers on operation list pages.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, action='append', dest='page_sizes', help='Operations per page.')
+        parser.add_argument('--repeat', type=int, default=200, help='Renders timed per renderer and page size.')
+
+    def handle(self, *args, **options):
+        renderers = {
+            'json': JSONRenderer(),
+            'orjson': ORJSONRenderer(datetime_precision='milliseconds'),
+            'orjson (microseconds)': ORJSONRenderer(datetime_precision='microseconds'),
+        }
+        repeat = options['repeat']
+
+        for page_size in options['page_sizes'] or [20, 100, 1000]:
+            page = build_operation_page(page_size)
+            baseline = None
+
+            for name, renderer in renderers.items():
+                timer = Timer(lambda: renderer.render(None, page, response_status=200))
+                seconds = min(timer.repeat(repeat=5, number=repeat)) / repeat
+                baseline = baseline or seconds
+
+                self.stdout.write(
+                    f'{page_size:>5} items  {name:<22} {seconds * 1000:8.3f} ms/page  {baseline / seconds:5.1f}x'
+                )
@@ -0,0 +1,67 @@
+import csv
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from typing import Iterator
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from core.apps.budgets.models import Currency as CurrencyModel, ExchangeRate as ExchangeRateModel
+from core.apps.budgets.services.operations import iter_batches
+from core.apps.budgets.services.rates import ExchangeRateCatalog, to_scaled_rate
+from core.apps.customers.services.versions import BaseDataVersionService
+from core.project.ioc_containers import get_ioc_container
+
+
+class Command(BaseCommand):
+    help = (
+        'Load exchange rates from a CSV file with "day,currency,rate" columns, the rate being the value '
+        'of one unit of the currency in EXCHANGE_RATE_BASE_CURRENCY. Existing rates of the same day are replaced.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV file to load.')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rates written per query.')
+
+    def _iter_rates(self, path: str, currency_ids: dict[str, int]) -> Iterator[ExchangeRateModel]:
+        with open(path, newline='') as file:
+            for line, row in enumerate(csv.DictReader(file), start=2):
+                try:
+                    rate = Decimal(row['rate'].strip())
+                    # Conversions divide by rates kept to the stored decimal places.
+                    if to_scaled_rate(rate) < 1:
+                        raise ValueError(rate)
+
+                    yield ExchangeRateModel(
+                        related_currency_id=currency_ids[row['currency'].strip().casefold()],
+                        day=date.fromisoformat(row['day'].strip()),
+                        rate=rate,
+                    )
+                except KeyError:
+                    raise CommandError(f'Line {line}: unknown currency "{row.get("currency")}".')
+                except (ValueError, InvalidOperation, AttributeError):
+                    raise CommandError(f'Line {line}: expected "day,currency,rate" with an ISO day and a positive decimal rate.')
+
+    def handle(self, *args, **options):
+        currency_ids = {
+            short_name.casefold(): currency_id
+            for currency_id, short_name in CurrencyModel.objects.values_list('id', 'short_name')
+        }
+        loaded = 0
+
+        with transaction.atomic():
+            for batch in iter_batches(self._iter_rates(options['path'], currency_ids), options['batch_size']):
+                # A row can only be upserted once per statement, the last rate of a day wins.
+                batch = list({(rate.related_currency_id, rate.day): rate for rate in batch}.values())
+                ExchangeRateModel.objects.bulk_create(
+                    batch,
+                    update_conflicts=True,
+                    unique_fields=['related_currency', 'day'],
+                    update_fields=['rate'],
+                )
+                loaded += len(batch)
+
+            transaction.on_commit(get_ioc_container().resolve(ExchangeRateCatalog).invalidate)
+            get_ioc_container().resolve(BaseDataVersionService).bump_all()
+
+        self.stdout.write(self.style.SUCCESS(f'{loaded} exchange rates loaded.'))
@@ -0,0 +1,98 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.apps.budgets.loadtests.runner import LoadRunner
+from core.apps.budgets.loadtests.scenarios import SCENARIOS, load_fixtures
+from core.apps.budgets.models import Budget as BudgetModel, Category as CategoryModel, Operation as OperationModel
+from core.apps.customers.models import Customer as CustomerModel
+
+
+class Command(BaseCommand):
+    help = (
+        'Drive every API route of a running server with concurrent clients and save throughput, latency '
+        'percentiles and SQL queries per request as JSON. Run against a database seeded with seed_load_data.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://localhost:8000', help='Server under test.')
+        parser.add_argument('--clients', type=int, default=16, help='Concurrent clients.')
+        parser.add_argument('--requests', type=int, default=500, help='Requests per scenario.')
+        parser.add_argument('--customers', type=int, default=100, help='Seeded customers the clients act as.')
+        parser.add_argument('--scenario', action='append', dest='scenarios', help='Scenario to run, all by default.')
+        parser.add_argument('--seed', type=int, default=0, help='Seed of the generated requests.')
+        parser.add_argument('--timeout', type=float, default=30.0, help='Seconds to wait for a response.')
+        parser.add_argument('--output', help='JSON file of the results, load-test-<time>.json by default.')
+        parser.add_argument('--compare', help='JSON results of an earlier run to compare with.')
+
+    def _write_comparison(self, results: list[dict], path: str) -> None:
+        baseline = {result['name']: result for result in json.loads(Path(path).read_text())['scenarios']}
+
+        self.stdout.write(f'\nCompared with {path}:')
+        for result in results:
+            previous = baseline.get(result['name'])
+            if not previous or not previous['throughput'] or not previous['latency_ms']:
+                continue
+
+            self.stdout.write(
+                f'{result["name"]:<22} throughput {result["throughput"] / previous["throughput"]:6.2f}x  '
+                f'p95 {result["latency_ms"]["p95"] / previous["latency_ms"]["p95"]:6.2f}x'
+            )
+
+    def handle(self, *args, **options):
+        scenarios = SCENARIOS
+        if options['scenarios']:
+            known = {scenario.name: scenario for scenario in SCENARIOS}
+            unknown = set(options['scenarios']) - set(known)
+            if unknown:
+                raise CommandError(f'Unknown scenarios: {", ".join(sorted(unknown))}.')
+            scenarios = [known[name] for name in options['scenarios']]
+
+        fixtures = load_fixtures(options['customers'])
+        if not fixtures.customers:
+            raise CommandError('No seeded customers with budgets, categories and operations, run seed_load_data first.')
+
+        runner = LoadRunner(
+            base_url=options['base_url'].rstrip('/'),
+            clients=options['clients'],
+            requests=options['requests'],
+            seed=options['seed'],
+            timeout=options['timeout'],
+        )
+        started_at = timezone.now()
+        results = []
+
+        for scenario in scenarios:
+            result = runner.run(scenario, fixtures)
+            results.append(result.to_dict())
+
+            latency = result.get_latency_ms()
+            queries = result.queries if result.queries is not None else '-'
+            self.stdout.write(
+                f'{result.name:<22} {result.throughput:8.1f} req/s  '
+                f'p50 {latency.get("p50", 0):8.1f} ms  p95 {latency.get("p95", 0):8.1f} ms  '
+                f'p99 {latency.get("p99", 0):8.1f} ms  queries {queries:>3}  failed {result.failures}/{result.requests}'
+            )
+
+        report = {
+            'started_at': started_at.isoformat(),
+            'base_url': options['base_url'],
+            'clients': options['clients'],
+            'requests_per_scenario': options['requests'],
+            'seed': options['seed'],
+            'dataset': {
+                'customers': CustomerModel.objects.count(),
+                'budgets': BudgetModel.objects.count(),
+                'categories': CategoryModel.objects.count(),
+                'operations': OperationModel.objects.count(),
+            },
+            'scenarios': results,
+        }
+        output = Path(options['output'] or f'load-test-{started_at:%Y%m%d-%H%M%S}.json')
+        output.write_text(json.dumps(report, indent=2))
+        self.stdout.write(self.style.SUCCESS(f'Results written to {output}.'))
+
+        if options['compare']:
+            self._write_comparison(results, options['compare'])
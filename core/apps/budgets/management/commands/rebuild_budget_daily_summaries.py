@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.apps.budgets.models import (
+    Budget as BudgetModel, BudgetDailySummary as BudgetDailySummaryModel, Operation as OperationModel
+)
+from core.apps.budgets.services.summaries import build_summary_rows
+from core.apps.customers.services.versions import BaseDataVersionService
+from core.project.ioc_containers import get_ioc_container
+
+
+class Command(BaseCommand):
+    help = 'Rebuild budget daily summaries from operations.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--budget-id', type=int, action='append', dest='budget_ids', help='Budget to rebuild.')
+        parser.add_argument('--chunk-size', type=int, default=100, help='Budgets rebuilt per transaction.')
+
+    def handle(self, *args, **options):
+        budgets = BudgetModel.objects.order_by('id')
+        if options['budget_ids']:
+            budgets = budgets.filter(id__in=options['budget_ids'])
+
+        budget_ids = list(budgets.values_list('id', flat=True))
+        chunk_size = options['chunk_size']
+        rebuilt = 0
+
+        for start in range(0, len(budget_ids), chunk_size):
+            chunk = budget_ids[start:start + chunk_size]
+
+            with transaction.atomic():
+                # Operation writes update the budget row before touching summaries,
+                # so locking the budgets holds them off until the chunk is rebuilt.
+                list(BudgetModel.objects.select_for_update().filter(id__in=chunk).values_list('id', flat=True))
+
+                BudgetDailySummaryModel.objects.filter(related_budget_id__in=chunk).delete()
+                summaries = BudgetDailySummaryModel.objects.bulk_create([
+                    BudgetDailySummaryModel(
+                        related_budget_id=row['related_budget_id'],
+                        related_category_id=row['related_category_id'],
+                        day=row['day'],
+                        operation_type=row['operation_type'],
+                        total_amount=row['total_amount'],
+                        operations_count=row['operations_count'],
+                    )
+                    for row in build_summary_rows(OperationModel.objects.filter(related_budget_id__in=chunk))
+                ], batch_size=1000)
+                rebuilt += len(summaries)
+                # Reports of every customer in the chunk may have changed.
+                get_ioc_container().resolve(BaseDataVersionService).bump_all()
+
+        self.stdout.write(self.style.SUCCESS(f'{rebuilt} daily summaries rebuilt for {len(budget_ids)} budgets.'))
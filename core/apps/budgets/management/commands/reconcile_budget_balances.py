@@ -0,0 +1,85 @@
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, DecimalField, F, IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from core.apps.budgets.models import Budget as BudgetModel, Operation as OperationModel
+from core.apps.customers.services.versions import BaseDataVersionService
+from core.project.ioc_containers import get_ioc_container
+
+
+def _build_operation_totals(operation_type: str) -> tuple[Coalesce, Coalesce]:
+    operations = OperationModel.objects.filter(
+        related_budget_id=OuterRef('pk'),
+        operation_type=operation_type,
+    ).order_by().values('related_budget_id')
+
+    amount = Subquery(
+        operations.annotate(total=Sum('amount')).values('total'),
+        output_field=DecimalField(max_digits=14, decimal_places=2),
+    )
+    count = Subquery(
+        operations.annotate(total=Count('id')).values('total'),
+        output_field=IntegerField(),
+    )
+
+    return (
+        Coalesce(amount, Value(Decimal('0')), output_field=DecimalField(max_digits=14, decimal_places=2)),
+        Coalesce(count, Value(0), output_field=IntegerField()),
+    )
+
+
+class Command(BaseCommand):
+    help = 'Recompute materialized budget balances and operation counters from operations.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--budget-id', type=int, action='append', dest='budget_ids', help='Budget to reconcile.')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='Budgets reconciled per transaction.')
+        parser.add_argument('--dry-run', action='store_true', help='Only report budgets that drifted.')
+
+    def handle(self, *args, **options):
+        add_amount, add_count = _build_operation_totals(OperationModel.OperationType.ADD)
+        sub_amount, sub_count = _build_operation_totals(OperationModel.OperationType.SUB)
+        expected_values = {
+            'current_balance': F('initial_amount') + add_amount - sub_amount,
+            'add_operations_count': add_count,
+            'sub_operations_count': sub_count,
+        }
+
+        budgets = BudgetModel.objects.order_by('id')
+        if options['budget_ids']:
+            budgets = budgets.filter(id__in=options['budget_ids'])
+
+        budget_ids = list(budgets.values_list('id', flat=True))
+        chunk_size = options['chunk_size']
+        drifted = 0
+
+        for start in range(0, len(budget_ids), chunk_size):
+            chunk = budget_ids[start:start + chunk_size]
+
+            with transaction.atomic():
+                drifted_ids = list(
+                    BudgetModel.objects.select_for_update()
+                    .filter(id__in=chunk)
+                    .annotate(
+                        expected_balance=expected_values['current_balance'],
+                        expected_add_count=expected_values['add_operations_count'],
+                        expected_sub_count=expected_values['sub_operations_count'],
+                    )
+                    .exclude(
+                        current_balance=F('expected_balance'),
+                        add_operations_count=F('expected_add_count'),
+                        sub_operations_count=F('expected_sub_count'),
+                    )
+                    .values_list('id', flat=True)
+                )
+                drifted += len(drifted_ids)
+
+                if drifted_ids and not options['dry_run']:
+                    BudgetModel.objects.filter(id__in=drifted_ids).update(**expected_values)
+                    get_ioc_container().resolve(BaseDataVersionService).bump_all()
+
+        action = 'would be reconciled' if options['dry_run'] else 'reconciled'
+        self.stdout.write(self.style.SUCCESS(f'{drifted} of {len(budget_ids)} budgets {action}.'))
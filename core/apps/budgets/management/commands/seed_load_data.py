@@ -0,0 +1,152 @@
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Iterator
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from core.apps.budgets.loadtests.datasets import LOAD_CURRENCIES
+from core.apps.budgets.loadtests.generators import (
+    BUDGET_COLUMNS, CATEGORY_COLUMNS, CUSTOMER_COLUMNS, OPERATION_COLUMNS, OperationChunk, OperationPlan,
+    format_copy_rows, generate_customer_rows, generate_operation_chunk, get_day_weights, init_operation_worker,
+    plan_operation_chunks, split_count
+)
+from core.apps.budgets.loadtests.writers import analyze, copy_rows, reserve_ids
+from core.apps.budgets.models import (
+    Budget as BudgetModel, Category as CategoryModel, Currency as CurrencyModel, ExchangeRate as ExchangeRateModel,
+    Operation as OperationModel
+)
+from core.apps.budgets.services.rates import ExchangeRateCatalog
+from core.apps.customers.models import Customer as CustomerModel
+from core.project.ioc_containers import get_ioc_container
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed a disposable database with customers, budgets, categories and operations for load tests. '
+        'Operations are generated in parallel chunks and written with COPY on PostgreSQL, fast enough for tens of '
+        'millions of rows; the same seed, sizes, end date and chunk size always give the same data.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--customers', type=int, default=2000, help='Customers to create.')
+        parser.add_argument('--budgets', type=int, default=500, help='Budgets to create, spread over customers.')
+        parser.add_argument('--categories', type=int, default=300, help='Categories to create, spread over customers.')
+        parser.add_argument('--operations', type=int, default=2_000_000, help='Operations to create.')
+        parser.add_argument('--days', type=int, default=365, help='Days the operations are spread over.')
+        parser.add_argument(
+            '--end-date', type=date.fromisoformat, help='Day after the last operation, YYYY-MM-DD, today by default.'
+        )
+        parser.add_argument('--seed', type=int, default=0, help='Seed of the generated data.')
+        parser.add_argument('--chunk-size', type=int, default=100_000, help='Operations generated and copied at once.')
+        parser.add_argument(
+            '--processes', type=int, default=os.cpu_count() or 1, help='Processes generating operations, 1 for none.'
+        )
+
+    def _create_currencies(self, first_day: date) -> list[int]:
+        base_short_name = settings.EXCHANGE_RATE_BASE_CURRENCY.casefold()
+        currency_ids, rates = [], []
+
+        for name, short_name, symbol, rate in LOAD_CURRENCIES:
+            currency, _ = CurrencyModel.objects.get_or_create(
+                short_name=short_name, defaults={'name': name, 'symbol': symbol}
+            )
+            currency_ids.append(currency.id)
+            if short_name.casefold() != base_short_name:
+                rates.append(ExchangeRateModel(related_currency=currency, day=first_day, rate=Decimal(str(rate))))
+
+        ExchangeRateModel.objects.bulk_create(rates, ignore_conflicts=True)
+        transaction.on_commit(get_ioc_container().resolve(ExchangeRateCatalog).invalidate)
+
+        return currency_ids
+
+    def _iter_operation_buffers(
+            self,
+            plan: OperationPlan,
+            chunks: list[OperationChunk],
+            processes: int
+    ) -> Iterator[tuple[OperationChunk, str]]:
+        """
+        Chunks in order, generated ahead by the pool while earlier ones are copied. At most two chunks per process
+        wait in memory, so the dataset size does not bound memory.
+        """
+        if processes <= 1:
+            init_operation_worker(plan)
+            for chunk in chunks:
+                yield chunk, generate_operation_chunk(chunk)
+            return
+
+        # Spawned workers do not inherit the open database connection.
+        with ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=init_operation_worker,
+                initargs=(plan,)
+        ) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append((chunk, executor.submit(generate_operation_chunk, chunk)))
+                if len(pending) > processes * 2:
+                    chunk, future = pending.popleft()
+                    yield chunk, future.result()
+
+            while pending:
+                chunk, future = pending.popleft()
+                yield chunk, future.result()
+
+    def handle(self, *args, **options):
+        if options['operations'] and not options['budgets']:
+            raise CommandError('Operations need at least one budget.')
+        if options['budgets'] and not options['customers']:
+            raise CommandError('Budgets and categories need at least one customer.')
+        if options['days'] < 1 or options['chunk_size'] < 1:
+            raise CommandError('--days and --chunk-size must be positive.')
+
+        first_day = (options['end_date'] or timezone.localdate()) - timedelta(days=options['days'])
+
+        with transaction.atomic():
+            currency_ids = self._create_currencies(first_day)
+            rows = generate_customer_rows(
+                seed=options['seed'],
+                customers=options['customers'],
+                budgets=options['budgets'],
+                categories=options['categories'],
+                currency_ids=currency_ids,
+                first_ids=(
+                    reserve_ids(CustomerModel, options['customers']),
+                    reserve_ids(BudgetModel, options['budgets']),
+                    reserve_ids(CategoryModel, options['categories']),
+                ),
+                first_day=first_day,
+            )
+            copy_rows(CustomerModel, CUSTOMER_COLUMNS, format_copy_rows(rows.customers))
+            copy_rows(BudgetModel, BUDGET_COLUMNS, format_copy_rows(rows.budgets))
+            copy_rows(CategoryModel, CATEGORY_COLUMNS, format_copy_rows(rows.categories))
+
+        day_counts = split_count(options['operations'], get_day_weights(first_day, options['days']))
+        chunks = plan_operation_chunks(day_counts, options['chunk_size'])
+        created = 0
+
+        for chunk, buffer in self._iter_operation_buffers(rows.plan, chunks, options['processes']):
+            with transaction.atomic():
+                copy_rows(OperationModel, OPERATION_COLUMNS, buffer)
+            created += chunk.size
+            self.stdout.write(f'{created} of {options["operations"]} operations created.')
+
+        analyze(CustomerModel, BudgetModel, CategoryModel, OperationModel)
+
+        # Balances, counters and daily summaries are maintained by the API, rebuild them from the seeded rows.
+        call_command('reconcile_budget_balances', stdout=self.stdout)
+        call_command('rebuild_budget_daily_summaries', stdout=self.stdout)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeded {len(rows.customers)} customers, {len(rows.budgets)} budgets, {len(rows.categories)} categories '
+            f'and {created} operations.'
+        ))
@@ -0,0 +1,60 @@
+# Generated by Django 5.1.4 on 2026-10-17 22:25
+
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Count, DecimalField, F, IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_current_balance(apps, schema_editor):
+    Budget = apps.get_model('budgets', 'Budget')
+    Operation = apps.get_model('budgets', 'Operation')
+
+    def totals(operation_type):
+        operations = Operation.objects.filter(
+            related_budget_id=OuterRef('pk'),
+            operation_type=operation_type,
+        ).order_by().values('related_budget_id')
+        amount = Subquery(
+            operations.annotate(total=Sum('amount')).values('total'),
+            output_field=DecimalField(max_digits=14, decimal_places=2),
+        )
+        count = Subquery(operations.annotate(total=Count('id')).values('total'), output_field=IntegerField())
+        return (
+            Coalesce(amount, Value(Decimal('0')), output_field=DecimalField(max_digits=14, decimal_places=2)),
+            Coalesce(count, Value(0), output_field=IntegerField()),
+        )
+
+    add_amount, add_count = totals('ADD')
+    sub_amount, sub_count = totals('SUB')
+    Budget.objects.update(
+        current_balance=F('initial_amount') + add_amount - sub_amount,
+        add_operations_count=add_count,
+        sub_operations_count=sub_count,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budgets', '0007_category_created_at_category_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='budget',
+            name='add_operations_count',
+            field=models.PositiveIntegerField(blank=True, default=0, verbose_name='Addition operations count'),
+        ),
+        migrations.AddField(
+            model_name='budget',
+            name='current_balance',
+            field=models.DecimalField(blank=True, decimal_places=2, default=Decimal('0'), max_digits=14, verbose_name='Current balance'),
+        ),
+        migrations.AddField(
+            model_name='budget',
+            name='sub_operations_count',
+            field=models.PositiveIntegerField(blank=True, default=0, verbose_name='Subtraction operations count'),
+        ),
+        migrations.RunPython(populate_current_balance, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.4 on 2026-10-17 22:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budgets', '0008_budget_current_balance'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='operation',
+            index=models.Index(fields=['related_budget', '-created_at', '-id'], name='operation_budget_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='operation',
+            index=models.Index(fields=['-created_at', '-id'], name='operation_keyset_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.4 on 2026-10-17 22:40
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budgets', '0009_operation_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BudgetDailySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Day')),
+                ('operation_type', models.CharField(choices=[('ADD', 'Addition'), ('SUB', 'Subtraction')], max_length=3, verbose_name='Operation type')),
+                ('total_amount', models.DecimalField(decimal_places=2, default=Decimal('0'), max_digits=14, verbose_name='Total amount')),
+                ('operations_count', models.PositiveIntegerField(default=0, verbose_name='Operations count')),
+                ('related_budget', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_summaries', to='budgets.budget', verbose_name='Related budget')),
+                ('related_category', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='daily_summaries', to='budgets.category', verbose_name='Related category')),
+            ],
+            options={
+                'verbose_name': 'Budget daily summary',
+                'verbose_name_plural': 'Budget daily summaries',
+                'indexes': [models.Index(fields=['related_budget', 'day'], name='budget_daily_summary_day_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('related_category__isnull', False)), fields=('related_budget', 'related_category', 'day', 'operation_type'), name='budget_daily_summary_unique'), models.UniqueConstraint(condition=models.Q(('related_category__isnull', True)), fields=('related_budget', 'day', 'operation_type'), name='budget_daily_summary_uncategorized_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.1.4 on 2026-10-17 22:52
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# Expression indexes matching the UPPER(column::text) LIKE UPPER(...) predicates of icontains lookups.
+TRIGRAM_INDEXES = [
+    ('budgets_operation', 'title', 'operation_title_trgm_idx'),
+    ('budgets_budget', 'title', 'budget_title_trgm_idx'),
+    ('budgets_category', 'name', 'category_name_trgm_idx'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for table, column, name in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ((UPPER({column}::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for _, _, name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budgets', '0010_budgetdailysummary'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.4 on 2026-10-17 22:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budgets', '0011_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExchangeRate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Day')),
+                ('rate', models.DecimalField(decimal_places=10, max_digits=20, verbose_name='Rate')),
+                ('related_currency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='exchange_rates', to='budgets.currency', verbose_name='Related currency')),
+            ],
+            options={
+                'verbose_name': 'Exchange rate',
+                'verbose_name_plural': 'Exchange rates',
+                'constraints': [models.UniqueConstraint(fields=('related_currency', 'day'), name='exchange_rate_unique')],
+            },
+        ),
+    ]
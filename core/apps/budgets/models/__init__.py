@@ -1,2 +1,4 @@
 from .budgets import Currency, Budget  # noqa
 from .operations import Category, Operation  # noqa
+from .summaries import BudgetDailySummary  # noqa
+from .rates import ExchangeRate  # noqa
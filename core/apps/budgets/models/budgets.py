@@ -51,6 +51,23 @@ class Budget(TimestampedBaseModel):
         default=Decimal('0'),
         blank=True,
     )
+    current_balance = models.DecimalField(
+        verbose_name=_('Current balance'),
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0'),
+        blank=True,
+    )
+    add_operations_count = models.PositiveIntegerField(
+        verbose_name=_('Addition operations count'),
+        default=0,
+        blank=True,
+    )
+    sub_operations_count = models.PositiveIntegerField(
+        verbose_name=_('Subtraction operations count'),
+        default=0,
+        blank=True,
+    )
     related_currency = models.ForeignKey(
         verbose_name=_('Related currency'),
         to=Currency,
@@ -73,6 +90,9 @@ class Budget(TimestampedBaseModel):
             updated_at=self.updated_at,
             title=self.title,
             initial_amount=self.initial_amount,
+            current_balance=self.current_balance,
+            add_operations_count=self.add_operations_count,
+            sub_operations_count=self.sub_operations_count,
             related_currency=self.related_currency.to_entity(),
             related_customer=self.related_customer.to_entity(),
         )
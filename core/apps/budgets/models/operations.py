@@ -89,3 +89,7 @@ class Operation(TimestampedBaseModel):
     class Meta:
         verbose_name = _('Operation')
         verbose_name_plural = _('Operations')
+        indexes = [
+            models.Index(fields=['related_budget', '-created_at', '-id'], name='operation_budget_keyset_idx'),
+            models.Index(fields=['-created_at', '-id'], name='operation_keyset_idx'),
+        ]
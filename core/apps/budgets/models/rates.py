@@ -0,0 +1,35 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from core.apps.budgets.models.budgets import Currency
+
+
+class ExchangeRate(models.Model):
+    """
+    Value of one unit of a currency in the base currency (``EXCHANGE_RATE_BASE_CURRENCY``),
+    effective from its day until the next rate of the currency.
+    """
+    related_currency = models.ForeignKey(
+        verbose_name=_('Related currency'),
+        to=Currency,
+        on_delete=models.CASCADE,
+        related_name='exchange_rates',
+    )
+    day = models.DateField(
+        verbose_name=_('Day'),
+    )
+    rate = models.DecimalField(
+        verbose_name=_('Rate'),
+        max_digits=20,
+        decimal_places=10,
+    )
+
+    def __str__(self):
+        return f'{self.related_currency_id} {self.day} {self.rate}'
+
+    class Meta:
+        verbose_name = _('Exchange rate')
+        verbose_name_plural = _('Exchange rates')
+        constraints = [
+            models.UniqueConstraint(fields=['related_currency', 'day'], name='exchange_rate_unique'),
+        ]
@@ -0,0 +1,63 @@
+from decimal import Decimal
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from core.apps.budgets.models.budgets import Budget
+from core.apps.budgets.models.operations import Category, Operation
+
+
+class BudgetDailySummary(models.Model):
+    related_budget = models.ForeignKey(
+        verbose_name=_('Related budget'),
+        to=Budget,
+        on_delete=models.CASCADE,
+        related_name='daily_summaries',
+    )
+    related_category = models.ForeignKey(
+        verbose_name=_('Related category'),
+        to=Category,
+        on_delete=models.CASCADE,
+        null=True,
+        related_name='daily_summaries',
+    )
+    day = models.DateField(
+        verbose_name=_('Day'),
+    )
+    operation_type = models.CharField(
+        verbose_name=_('Operation type'),
+        max_length=3,
+        choices=Operation.OperationType.choices,
+    )
+    total_amount = models.DecimalField(
+        verbose_name=_('Total amount'),
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0'),
+    )
+    operations_count = models.PositiveIntegerField(
+        verbose_name=_('Operations count'),
+        default=0,
+    )
+
+    def __str__(self):
+        return f'{self.related_budget_id} {self.day} {self.operation_type}'
+
+    class Meta:
+        verbose_name = _('Budget daily summary')
+        verbose_name_plural = _('Budget daily summaries')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['related_budget', 'related_category', 'day', 'operation_type'],
+                condition=models.Q(related_category__isnull=False),
+                name='budget_daily_summary_unique',
+            ),
+            models.UniqueConstraint(
+                fields=['related_budget', 'day', 'operation_type'],
+                condition=models.Q(related_category__isnull=True),
+                name='budget_daily_summary_uncategorized_unique',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['related_budget', 'day'], name='budget_daily_summary_day_idx'),
+        ]
@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import Iterable, Optional
+from typing import Optional, Sequence
 
-from django.db.models import Q
+from asgiref.sync import sync_to_async
+from django.db.models import Q, F, QuerySet
 
 from core.api.filters import PaginationIn
 from core.api.v1.budget_management.filters import CurrencyFilters, BudgetFilters
@@ -13,12 +15,18 @@ from core.apps.budgets.models.budgets import (
     Currency as CurrencyModel,
     Budget as BudgetModel,
 )
+from core.apps.budgets.models.operations import Operation as OperationModel
+from core.apps.budgets.services.operations import order_operations, build_operation_search_query
+from core.apps.budgets.services.catalogs import CurrencyCatalog
+from core.apps.common.pagination import Page, get_page, aget_page, paginate_items
+from core.apps.common.search import rank_by_similarity
 from core.apps.customers.entities.customers import Customer
+from core.apps.customers.services.versions import BaseDataVersionService
 
 
 class BaseCurrencyService(ABC):
     @abstractmethod
-    def get_currency_list(self, filters: CurrencyFilters, pagination: PaginationIn) -> Iterable[Currency]:
+    def get_currency_list(self, filters: CurrencyFilters, pagination: PaginationIn) -> Page[Currency]:
         ...
 
     @abstractmethod
@@ -30,28 +38,35 @@ class BaseCurrencyService(ABC):
         ...
 
 
-class ORMCurrencyService(BaseCurrencyService):
-    def _build_currency_query(self, filters: CurrencyFilters) -> Q:
-        query = Q()
+class CatalogCurrencyQueryMixin:
+    def _filter_currencies(self, currencies: list[CurrencyModel], filters: CurrencyFilters) -> list[CurrencyModel]:
+        if filters.search is None:
+            return currencies
 
-        if filters.search is not None:
-            query &= Q(name__icontains=filters.search) | Q(short_name__iexact=filters.search)
+        search = filters.search.casefold()
+        return [
+            currency for currency in currencies
+            if search in currency.name.casefold() or search == currency.short_name.casefold()
+        ]
 
-        return query
 
-    def get_currency_list(self, filters: CurrencyFilters, pagination: PaginationIn) -> Iterable[Currency]:
-        query = self._build_currency_query(filters)
-        qs = CurrencyModel.objects.filter(query)[pagination.offset:pagination.offset + pagination.limit]
+@dataclass(eq=False)
+class CatalogCurrencyService(CatalogCurrencyQueryMixin, BaseCurrencyService):
+    """
+    Serves currencies from the process-local catalog instead of querying them on every call.
+    """
+    currency_catalog: CurrencyCatalog
 
-        return [currency.to_entity() for currency in qs]
+    def get_currency_list(self, filters: CurrencyFilters, pagination: PaginationIn) -> Page[Currency]:
+        currencies = self._filter_currencies(self.currency_catalog.get_currencies(), filters)
 
-    def get_currency_count(self, filters: CurrencyFilters) -> int:
-        query = self._build_currency_query(filters)
+        return paginate_items(currencies, pagination).map(CurrencyModel.to_entity)
 
-        return CurrencyModel.objects.filter(query).count()
+    def get_currency_count(self, filters: CurrencyFilters) -> int:
+        return len(self._filter_currencies(self.currency_catalog.get_currencies(), filters))
 
     def get_currency_by_short_name(self, short_name: str) -> Currency:
-        return CurrencyModel.objects.get(short_name__iexact=short_name).to_entity()
+        return self.currency_catalog.get_by_short_name(short_name).to_entity()
 
 
 class BaseBudgetService(ABC):
@@ -61,7 +76,7 @@ class BaseBudgetService(ABC):
             filters: BudgetFilters,
             pagination: PaginationIn,
             related_customer: Customer
-    ) -> Iterable[Budget]:
+    ) -> Page[Budget]:
         ...
 
     @abstractmethod
@@ -97,7 +112,24 @@ class BaseBudgetService(ABC):
         ...
 
 
-class ORMBudgetService(BaseBudgetService):
+class ORMBudgetQueryMixin:
+    def _get_budget_queryset(self) -> QuerySet[BudgetModel]:
+        return BudgetModel.objects.select_related('related_currency', 'related_customer')
+
+    def _get_budget_list_queryset(
+            self,
+            queryset: QuerySet[BudgetModel],
+            filters: BudgetFilters,
+            related_customer: Customer
+    ) -> QuerySet[BudgetModel]:
+        query = self._build_budget_query(filters)
+
+        return rank_by_similarity(
+            queryset.filter(related_customer_id=related_customer.id).filter(query),
+            filters.search,
+            'title'
+        )
+
     def _build_budget_query(self, filters: BudgetFilters) -> Q:
         query = Q()
 
@@ -106,26 +138,59 @@ class ORMBudgetService(BaseBudgetService):
 
         return query
 
+    def _get_budget_counters_queryset(self, budget_id: int, related_customer: Customer) -> QuerySet:
+        return BudgetModel.objects.filter(related_customer_id=related_customer.id, id=budget_id).values_list(
+            F('add_operations_count') + F('sub_operations_count'), flat=True
+        )
+
+    def _get_budget_operation_count_queryset(self, budget_id: int, related_customer: Customer) -> QuerySet:
+        return OperationModel.objects.filter(
+            related_budget_id=budget_id,
+            related_budget__related_customer_id=related_customer.id
+        )
+
+    def _get_budget_operation_total(
+            self,
+            add_operations_count: int,
+            sub_operations_count: int,
+            filters: BudgetFilters
+    ) -> Optional[int]:
+        """
+        Unfiltered totals come from the counters of the loaded budget, filtered ones are left to the page query.
+        """
+        if filters.search is not None:
+            return None
+
+        return add_operations_count + sub_operations_count
+
+    def _to_budget_operation(self, operation: OperationModel, budget: BudgetModel) -> Operation:
+        # Every operation belongs to the budget loaded before, reuse it instead of joining it per row.
+        operation.related_budget = budget
+        return operation.to_entity()
+
     def _build_budget_operation_query(self, filters: BudgetFilters) -> Q:
         query = Q()
 
         if filters.search is not None:
-            query &= Q(title__icontains=filters.search) | Q(operation_type__iexact=filters.search)
+            query &= build_operation_search_query(filters.search)
 
         return query
 
+
+@dataclass(eq=False)
+class ORMBudgetService(ORMBudgetQueryMixin, BaseBudgetService):
+    currency_catalog: CurrencyCatalog
+    data_version_service: BaseDataVersionService
+
     def get_budget_list(
             self,
             filters: BudgetFilters,
             pagination: PaginationIn,
             related_customer: Customer
-    ) -> Iterable[Budget]:
-        query = self._build_budget_query(filters)
-        qs = BudgetModel.objects.filter(related_customer_id=related_customer.id).filter(query)[
-             pagination.offset:pagination.offset + pagination.limit
-        ]
+    ) -> Page[Budget]:
+        qs = self._get_budget_list_queryset(self._get_budget_queryset(), filters, related_customer)
 
-        return [budget.to_entity() for budget in qs]
+        return get_page(qs, pagination).map(BudgetModel.to_entity)
 
     def get_budget_count(self, filters: BudgetFilters, related_customer: Customer) -> int:
         query = self._build_budget_query(filters)
@@ -138,17 +203,18 @@ class ORMBudgetService(BaseBudgetService):
             pagination: PaginationIn,
             budget_id: int,
             related_customer: Customer
-    ) -> tuple[Budget, Iterable[Operation]]:
+    ) -> tuple[Budget, Page[Operation]]:
         query = self._build_budget_operation_query(filters)
-        budget = BudgetModel.objects.get(
+        budget = self._get_budget_queryset().get(
             related_customer_id=related_customer.id,
             id=budget_id
         )
-        qs = budget.operations.filter(query).order_by('-created_at', '-updated_at')[
-             pagination.offset:pagination.offset + pagination.limit
-        ]
+        qs = order_operations(budget.operations.select_related('related_category__related_customer').filter(query))
+        page = get_page(qs, pagination, keyset=True, total=self._get_budget_operation_total(
+            budget.add_operations_count, budget.sub_operations_count, filters
+        ))
 
-        return budget.to_entity(), [budget_operation.to_entity() for budget_operation in qs]
+        return budget.to_entity(), page.map(lambda operation: self._to_budget_operation(operation, budget))
 
     def get_budget_operation_count(
             self,
@@ -156,15 +222,15 @@ class ORMBudgetService(BaseBudgetService):
             budget_id: int,
             related_customer: Customer
     ) -> int:
+        if filters.search is None:
+            return self._get_budget_counters_queryset(budget_id, related_customer).get()
+
         query = self._build_budget_operation_query(filters)
 
-        return BudgetModel.objects.get(
-            related_customer_id=related_customer.id,
-            id=budget_id
-        ).operations.filter(query).count()
+        return self._get_budget_operation_count_queryset(budget_id, related_customer).filter(query).count()
 
     def get_budget_by_id(self, budget_id: int, related_customer: Customer) -> Budget:
-        return BudgetModel.objects.filter(related_customer_id=related_customer.id).get(id=budget_id).to_entity()
+        return self._get_budget_queryset().filter(related_customer_id=related_customer.id).get(id=budget_id).to_entity()
 
     def create_budget(
             self,
@@ -174,20 +240,24 @@ class ORMBudgetService(BaseBudgetService):
             related_customer: Customer
     ) -> Budget:
         if related_currency_short_name:
-            related_currency = CurrencyModel.objects.get(short_name=related_currency_short_name)
+            related_currency = self.currency_catalog.get_by_short_name(related_currency_short_name)
         else:
-            related_currency = CurrencyModel.objects.get(short_name='USD')
+            related_currency = self.currency_catalog.get_by_short_name('USD')
 
+        initial_amount = initial_amount if initial_amount is not None else Decimal('0')
         budget = BudgetModel.objects.create(
             title=title,
             initial_amount=initial_amount,
+            current_balance=initial_amount,
             related_currency=related_currency,
             related_customer_id=related_customer.id
         )
+        self.data_version_service.bump(related_customer.id)
         return budget.to_entity()
 
     def delete_budget(self, budget_id: int, related_customer: Customer) -> None:
         BudgetModel.objects.filter(related_customer_id=related_customer.id).get(id=budget_id).delete()
+        self.data_version_service.bump(related_customer.id)
 
     def update_budget(
             self,
@@ -196,13 +266,267 @@ class ORMBudgetService(BaseBudgetService):
             initial_amount: Optional[Decimal],
             related_customer: Customer
     ) -> Budget:
-        budget = BudgetModel.objects.filter(related_customer_id=related_customer.id).get(id=budget_id)
+        budget = self._get_budget_queryset().filter(related_customer_id=related_customer.id).get(id=budget_id)
+        update_fields = ['updated_at']
 
         if title is not None:
             budget.title = title
+            update_fields.append('title')
 
         if initial_amount is not None:
+            # Shift the balance by the difference against the stored (not the fetched) initial amount,
+            # so concurrent operation writes are never overwritten.
+            budget.current_balance = F('current_balance') - F('initial_amount') + initial_amount
             budget.initial_amount = initial_amount
+            update_fields.extend(['current_balance', 'initial_amount'])
+
+        budget.save(update_fields=update_fields)
+        self.data_version_service.bump(related_customer.id)
+        budget.refresh_from_db(fields=['current_balance', 'add_operations_count', 'sub_operations_count'])
+        return budget.to_entity()
+
+
+class BaseAsyncCurrencyService(ABC):
+    @abstractmethod
+    async def get_currency_list(self, filters: CurrencyFilters, pagination: PaginationIn) -> Page[Currency]:
+        ...
+
+    @abstractmethod
+    async def get_currency_count(self, filters: CurrencyFilters) -> int:
+        ...
+
+    @abstractmethod
+    async def get_currency_by_short_name(self, short_name: str) -> Currency:
+        ...
+
+
+@dataclass(eq=False)
+class AsyncCatalogCurrencyService(CatalogCurrencyQueryMixin, BaseAsyncCurrencyService):
+    currency_catalog: CurrencyCatalog
+
+    async def get_currency_list(self, filters: CurrencyFilters, pagination: PaginationIn) -> Page[Currency]:
+        currencies = self._filter_currencies(await self.currency_catalog.aget_currencies(), filters)
+
+        return paginate_items(currencies, pagination).map(CurrencyModel.to_entity)
+
+    async def get_currency_count(self, filters: CurrencyFilters) -> int:
+        return len(self._filter_currencies(await self.currency_catalog.aget_currencies(), filters))
+
+    async def get_currency_by_short_name(self, short_name: str) -> Currency:
+        currency = await self.currency_catalog.aget_by_short_name(short_name)
+
+        return currency.to_entity()
+
+
+class BaseAsyncBudgetService(ABC):
+    @abstractmethod
+    async def get_budget_list(
+            self,
+            filters: BudgetFilters,
+            pagination: PaginationIn,
+            related_customer: Customer
+    ) -> Page[Budget]:
+        ...
+
+    @abstractmethod
+    async def get_budget_row_list(
+            self,
+            filters: BudgetFilters,
+            pagination: PaginationIn,
+            related_customer: Customer,
+            fields: Sequence[str]
+    ) -> Page[dict]:
+        ...
+
+    @abstractmethod
+    async def get_budget_count(self, filters: BudgetFilters, related_customer: Customer) -> int:
+        ...
+
+    @abstractmethod
+    async def get_budget_operation_list(
+            self,
+            filters: BudgetFilters,
+            pagination: PaginationIn,
+            budget_id: int,
+            related_customer: Customer
+    ) -> tuple[Budget, Page[Operation]]:
+        ...
+
+    @abstractmethod
+    async def get_budget_operation_row_list(
+            self,
+            filters: BudgetFilters,
+            pagination: PaginationIn,
+            budget_id: int,
+            related_customer: Customer,
+            budget_fields: Sequence[str],
+            operation_fields: Sequence[str]
+    ) -> tuple[dict, Page[dict]]:
+        ...
+
+    @abstractmethod
+    async def get_budget_operation_count(
+            self,
+            filters: BudgetFilters,
+            budget_id: int,
+            related_customer: Customer
+    ) -> int:
+        ...
+
+    @abstractmethod
+    async def get_budget_by_id(self, budget_id: int, related_customer: Customer) -> Budget:
+        ...
+
+    @abstractmethod
+    async def create_budget(
+        self,
+        title: str,
+        initial_amount: Optional[Decimal],
+        related_currency_short_name: Optional[str],
+        related_customer: Customer
+    ) -> Budget:
+        ...
+
+    @abstractmethod
+    async def delete_budget(self, budget_id: int, related_customer: Customer) -> None:
+        ...
+
+    @abstractmethod
+    async def update_budget(
+        self,
+        budget_id: int,
+        title: Optional[str],
+        initial_amount: Optional[Decimal],
+        related_customer: Customer
+    ) -> Budget:
+        ...
+
+
+@dataclass(eq=False)
+class AsyncORMBudgetService(ORMBudgetQueryMixin, BaseAsyncBudgetService):
+    """
+    Reads run on the async ORM, writes need transactions and are delegated to the sync service in a worker thread.
+    """
+    budget_service: BaseBudgetService
+
+    async def get_budget_list(
+            self,
+            filters: BudgetFilters,
+            pagination: PaginationIn,
+            related_customer: Customer
+    ) -> Page[Budget]:
+        qs = self._get_budget_list_queryset(self._get_budget_queryset(), filters, related_customer)
+
+        page = await aget_page(qs, pagination)
+        return page.map(BudgetModel.to_entity)
+
+    async def get_budget_row_list(
+            self,
+            filters: BudgetFilters,
+            pagination: PaginationIn,
+            related_customer: Customer,
+            fields: Sequence[str]
+    ) -> Page[dict]:
+        """
+        Same page as ``get_budget_list``, as flat ``values()`` rows of the given lookups.
+        """
+        qs = self._get_budget_list_queryset(BudgetModel.objects.all(), filters, related_customer)
+
+        return await aget_page(qs.values(*fields), pagination)
+
+    async def get_budget_count(self, filters: BudgetFilters, related_customer: Customer) -> int:
+        query = self._build_budget_query(filters)
+
+        return await BudgetModel.objects.filter(related_customer_id=related_customer.id).filter(query).acount()
+
+    async def get_budget_operation_list(
+            self,
+            filters: BudgetFilters,
+            pagination: PaginationIn,
+            budget_id: int,
+            related_customer: Customer
+    ) -> tuple[Budget, Page[Operation]]:
+        query = self._build_budget_operation_query(filters)
+        budget = await self._get_budget_queryset().aget(
+            related_customer_id=related_customer.id,
+            id=budget_id
+        )
+        qs = order_operations(budget.operations.select_related('related_category__related_customer').filter(query))
+        page = await aget_page(qs, pagination, keyset=True, total=self._get_budget_operation_total(
+            budget.add_operations_count, budget.sub_operations_count, filters
+        ))
+
+        return budget.to_entity(), page.map(lambda operation: self._to_budget_operation(operation, budget))
+
+    async def get_budget_operation_row_list(
+            self,
+            filters: BudgetFilters,
+            pagination: PaginationIn,
+            budget_id: int,
+            related_customer: Customer,
+            budget_fields: Sequence[str],
+            operation_fields: Sequence[str]
+    ) -> tuple[dict, Page[dict]]:
+        """
+        Same page as ``get_budget_operation_list``, as flat ``values()`` rows of the given lookups.
+        Operation rows do not join their budget, it is the budget row returned alongside them.
+        """
+        query = self._build_budget_operation_query(filters)
+        budget = await BudgetModel.objects.filter(related_customer_id=related_customer.id, id=budget_id).values(
+            *dict.fromkeys([*budget_fields, 'id', 'add_operations_count', 'sub_operations_count'])
+        ).aget()
+        qs = order_operations(OperationModel.objects.filter(related_budget_id=budget['id']).filter(query))
+        total = self._get_budget_operation_total(
+            budget['add_operations_count'], budget['sub_operations_count'], filters
+        )
+
+        return budget, await aget_page(qs.values(*operation_fields), pagination, keyset=True, total=total)
+
+    async def get_budget_operation_count(
+            self,
+            filters: BudgetFilters,
+            budget_id: int,
+            related_customer: Customer
+    ) -> int:
+        if filters.search is None:
+            return await self._get_budget_counters_queryset(budget_id, related_customer).aget()
+
+        query = self._build_budget_operation_query(filters)
+
+        return await self._get_budget_operation_count_queryset(budget_id, related_customer).filter(query).acount()
+
+    async def get_budget_by_id(self, budget_id: int, related_customer: Customer) -> Budget:
+        budget = await self._get_budget_queryset().filter(related_customer_id=related_customer.id).aget(id=budget_id)
 
-        budget.save()
         return budget.to_entity()
+
+    async def create_budget(
+            self,
+            title: str,
+            initial_amount: Optional[Decimal],
+            related_currency_short_name: Optional[str],
+            related_customer: Customer
+    ) -> Budget:
+        return await sync_to_async(self.budget_service.create_budget)(
+            title=title,
+            initial_amount=initial_amount,
+            related_currency_short_name=related_currency_short_name,
+            related_customer=related_customer
+        )
+
+    async def delete_budget(self, budget_id: int, related_customer: Customer) -> None:
+        await sync_to_async(self.budget_service.delete_budget)(budget_id=budget_id, related_customer=related_customer)
+
+    async def update_budget(
+            self,
+            budget_id: int,
+            title: Optional[str],
+            initial_amount: Optional[Decimal],
+            related_customer: Customer
+    ) -> Budget:
+        return await sync_to_async(self.budget_service.update_budget)(
+            budget_id=budget_id,
+            title=title,
+            initial_amount=initial_amount,
+            related_customer=related_customer
+        )
@@ -0,0 +1,57 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from django.conf import settings
+
+from core.apps.budgets.models.budgets import Currency as CurrencyModel
+from core.apps.common.catalogs import VersionedCatalog
+
+
+@dataclass(frozen=True)
+class CurrencySnapshot:
+    currencies: list[CurrencyModel]
+    by_short_name: dict[str, CurrencyModel] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, currencies: list[CurrencyModel]) -> 'CurrencySnapshot':
+        return cls(
+            currencies=currencies,
+            by_short_name={currency.short_name.casefold(): currency for currency in currencies},
+        )
+
+
+class CurrencyCatalog(VersionedCatalog[CurrencySnapshot]):
+    """
+    Process-local copy of all currencies, loaded once per worker.
+    """
+    VERSION_CACHE_KEY = 'budgets:currency-catalog-version'
+
+    def __init__(self, check_interval: Optional[float] = None):
+        super().__init__(
+            check_interval if check_interval is not None else settings.CURRENCY_CATALOG_CHECK_INTERVAL
+        )
+
+    def _load(self) -> CurrencySnapshot:
+        return CurrencySnapshot.build(list(CurrencyModel.objects.order_by('id')))
+
+    async def _aload(self) -> CurrencySnapshot:
+        return CurrencySnapshot.build([currency async for currency in CurrencyModel.objects.order_by('id')])
+
+    def _find(self, snapshot: CurrencySnapshot, short_name: str) -> CurrencyModel:
+        try:
+            return snapshot.by_short_name[short_name.casefold()]
+        except KeyError:
+            raise CurrencyModel.DoesNotExist(f'Currency "{short_name}" does not exist.')
+
+    def get_currencies(self) -> list[CurrencyModel]:
+        return self.get_snapshot().currencies
+
+    async def aget_currencies(self) -> list[CurrencyModel]:
+        snapshot = await self.aget_snapshot()
+        return snapshot.currencies
+
+    def get_by_short_name(self, short_name: str) -> CurrencyModel:
+        return self._find(self.get_snapshot(), short_name)
+
+    async def aget_by_short_name(self, short_name: str) -> CurrencyModel:
+        return self._find(await self.aget_snapshot(), short_name)
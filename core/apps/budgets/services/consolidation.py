@@ -0,0 +1,147 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from decimal import Decimal
+
+from django.db.models import F, QuerySet, Sum, Count
+from django.utils import timezone
+
+from core.api.v1.budget_management.filters import ConsolidationFilters
+from core.apps.budgets.entities.reports import ConsolidatedTotals
+from core.apps.budgets.models.budgets import Budget as BudgetModel, Currency as CurrencyModel
+from core.apps.budgets.models.operations import Operation as OperationModel
+from core.apps.budgets.models.summaries import BudgetDailySummary as BudgetDailySummaryModel
+from core.apps.budgets.services.catalogs import CurrencyCatalog
+from core.apps.budgets.services.rates import CurrencyConverter, ExchangeRateCatalog
+from core.apps.customers.entities.customers import Customer
+
+
+class BaseConsolidationService(ABC):
+    @abstractmethod
+    def get_consolidated_totals(self, filters: ConsolidationFilters, related_customer: Customer) -> ConsolidatedTotals:
+        ...
+
+
+class ORMConsolidationQueryMixin:
+    """
+    Groups balances by currency and operation totals by currency and day in the database,
+    so only a handful of rows per day reach the converter however many budgets and operations there are.
+    Balances are converted at the latest rates, operations at the rates of their days.
+    """
+
+    def _get_balance_queryset(self, related_customer: Customer) -> QuerySet:
+        return BudgetModel.objects.filter(
+            related_customer_id=related_customer.id,
+            related_currency__isnull=False,
+        ).order_by().values('related_currency_id').annotate(
+            balance=Sum('current_balance'),
+            budgets_count=Count('id'),
+        )
+
+    def _get_summary_queryset(self, filters: ConsolidationFilters, related_customer: Customer) -> QuerySet:
+        qs = BudgetDailySummaryModel.objects.filter(
+            related_budget__related_customer_id=related_customer.id,
+            related_budget__related_currency__isnull=False,
+        )
+
+        if filters.date_from is not None:
+            qs = qs.filter(day__gte=filters.date_from)
+
+        if filters.date_to is not None:
+            qs = qs.filter(day__lt=filters.date_to)
+
+        return qs.order_by().values(
+            'day',
+            'operation_type',
+            currency_id=F('related_budget__related_currency_id'),
+        ).annotate(
+            amount_sum=Sum('total_amount'),
+            count_sum=Sum('operations_count'),
+        )
+
+    def _convert_operation_totals(
+            self,
+            converter: CurrencyConverter,
+            target: CurrencyModel,
+            summary_rows: list[dict],
+            operation_type: str
+    ) -> Decimal:
+        return converter.convert_sum(
+            (
+                (row['currency_id'], row['day'], row['amount_sum'])
+                for row in summary_rows if row['operation_type'] == operation_type
+            ),
+            target.id
+        )
+
+    def _build_totals(
+            self,
+            converter: CurrencyConverter,
+            target: CurrencyModel,
+            balance_rows: list[dict],
+            summary_rows: list[dict]
+    ) -> ConsolidatedTotals:
+        rates_as_of = timezone.localdate()
+
+        return ConsolidatedTotals(
+            currency=target.short_name,
+            balance=converter.convert_sum(
+                ((row['related_currency_id'], rates_as_of, row['balance']) for row in balance_rows), target.id
+            ),
+            add_total=self._convert_operation_totals(
+                converter, target, summary_rows, OperationModel.OperationType.ADD
+            ),
+            sub_total=self._convert_operation_totals(
+                converter, target, summary_rows, OperationModel.OperationType.SUB
+            ),
+            budgets_count=sum(row['budgets_count'] for row in balance_rows),
+            operations_count=sum(row['count_sum'] for row in summary_rows),
+            rates_as_of=rates_as_of,
+        )
+
+
+@dataclass(eq=False)
+class ORMConsolidationService(ORMConsolidationQueryMixin, BaseConsolidationService):
+    currency_catalog: CurrencyCatalog
+    exchange_rate_catalog: ExchangeRateCatalog
+
+    def get_consolidated_totals(self, filters: ConsolidationFilters, related_customer: Customer) -> ConsolidatedTotals:
+        target = self.currency_catalog.get_by_short_name(filters.currency)
+        converter = CurrencyConverter(self.exchange_rate_catalog.get_snapshot())
+
+        return self._build_totals(
+            converter,
+            target,
+            list(self._get_balance_queryset(related_customer)),
+            list(self._get_summary_queryset(filters, related_customer)),
+        )
+
+
+class BaseAsyncConsolidationService(ABC):
+    @abstractmethod
+    async def get_consolidated_totals(
+            self,
+            filters: ConsolidationFilters,
+            related_customer: Customer
+    ) -> ConsolidatedTotals:
+        ...
+
+
+@dataclass(eq=False)
+class AsyncORMConsolidationService(ORMConsolidationQueryMixin, BaseAsyncConsolidationService):
+    currency_catalog: CurrencyCatalog
+    exchange_rate_catalog: ExchangeRateCatalog
+
+    async def get_consolidated_totals(
+            self,
+            filters: ConsolidationFilters,
+            related_customer: Customer
+    ) -> ConsolidatedTotals:
+        target = await self.currency_catalog.aget_by_short_name(filters.currency)
+        converter = CurrencyConverter(await self.exchange_rate_catalog.aget_snapshot())
+
+        return self._build_totals(
+            converter,
+            target,
+            [row async for row in self._get_balance_queryset(related_customer)],
+            [row async for row in self._get_summary_queryset(filters, related_customer)],
+        )
@@ -0,0 +1,107 @@
+from abc import ABC, abstractmethod
+from datetime import timedelta
+
+from django.db.models import F, OuterRef, QuerySet, Subquery, Sum
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from core.apps.budgets.entities.dashboard import Dashboard, DashboardBudget, DashboardCategory, DashboardOperation
+from core.apps.budgets.models.budgets import Budget as BudgetModel
+from core.apps.budgets.models.operations import Operation as OperationModel
+from core.apps.budgets.models.summaries import BudgetDailySummary as BudgetDailySummaryModel
+from core.apps.budgets.services.operations import order_operations
+from core.apps.customers.entities.customers import Customer
+
+
+class BaseDashboardService(ABC):
+    @abstractmethod
+    def get_dashboard(self, related_customer: Customer) -> Dashboard:
+        ...
+
+
+class ORMDashboardQueryMixin:
+    """
+    The whole dashboard takes three queries, however many budgets the customer has:
+    budgets with their maintained counters and latest operation, categories ranked on the daily summaries,
+    and the latest operations with the names they are shown with.
+    """
+    TOP_CATEGORIES_LIMIT = 5
+    TOP_CATEGORIES_DAYS = 30
+    RECENT_OPERATIONS_LIMIT = 10
+
+    def _get_budget_queryset(self, related_customer: Customer) -> QuerySet:
+        # Balance updates do not touch updated_at, the latest operation tells the last activity.
+        last_operation_at = Subquery(
+            order_operations(OperationModel.objects.filter(related_budget_id=OuterRef('id'))).values('created_at')[:1]
+        )
+
+        return BudgetModel.objects.filter(related_customer_id=related_customer.id).order_by('id').values(
+            'id',
+            'title',
+            'current_balance',
+            currency=F('related_currency__short_name'),
+            operations_count=F('add_operations_count') + F('sub_operations_count'),
+            last_activity_at=Greatest('updated_at', Coalesce(last_operation_at, 'updated_at')),
+        )
+
+    def _get_top_category_queryset(self, related_customer: Customer) -> QuerySet:
+        return BudgetDailySummaryModel.objects.filter(
+            related_budget__related_customer_id=related_customer.id,
+            related_category__isnull=False,
+            day__gte=timezone.localdate() - timedelta(days=self.TOP_CATEGORIES_DAYS),
+        ).values(
+            category_id=F('related_category_id'),
+            category_name=F('related_category__name'),
+        ).annotate(
+            operations_count=Sum('operations_count'),
+        ).order_by('-operations_count', 'category_id')[:self.TOP_CATEGORIES_LIMIT]
+
+    def _get_recent_operation_queryset(self, related_customer: Customer) -> QuerySet:
+        return order_operations(
+            OperationModel.objects.filter(related_budget__related_customer_id=related_customer.id)
+        ).values(
+            'id',
+            'created_at',
+            'title',
+            'operation_type',
+            'amount',
+            budget_id=F('related_budget_id'),
+            budget_title=F('related_budget__title'),
+            currency=F('related_budget__related_currency__short_name'),
+            category_id=F('related_category_id'),
+            category_name=F('related_category__name'),
+        )[:self.RECENT_OPERATIONS_LIMIT]
+
+    def _build_dashboard(self, budgets: list[dict], categories: list[dict], operations: list[dict]) -> Dashboard:
+        return Dashboard(
+            budgets=[DashboardBudget(**row) for row in budgets],
+            top_categories=[
+                DashboardCategory(id=row['category_id'], name=row['category_name'], operations_count=row['operations_count'])
+                for row in categories
+            ],
+            recent_operations=[DashboardOperation(**row) for row in operations],
+        )
+
+
+class ORMDashboardService(ORMDashboardQueryMixin, BaseDashboardService):
+    def get_dashboard(self, related_customer: Customer) -> Dashboard:
+        return self._build_dashboard(
+            list(self._get_budget_queryset(related_customer)),
+            list(self._get_top_category_queryset(related_customer)),
+            list(self._get_recent_operation_queryset(related_customer)),
+        )
+
+
+class BaseAsyncDashboardService(ABC):
+    @abstractmethod
+    async def get_dashboard(self, related_customer: Customer) -> Dashboard:
+        ...
+
+
+class AsyncORMDashboardService(ORMDashboardQueryMixin, BaseAsyncDashboardService):
+    async def get_dashboard(self, related_customer: Customer) -> Dashboard:
+        return self._build_dashboard(
+            [row async for row in self._get_budget_queryset(related_customer)],
+            [row async for row in self._get_top_category_queryset(related_customer)],
+            [row async for row in self._get_recent_operation_queryset(related_customer)],
+        )
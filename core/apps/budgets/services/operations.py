@@ -1,19 +1,61 @@
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import Iterable, Optional
+from itertools import islice
+from typing import AsyncIterator, Iterable, Iterator, Optional, Sequence
 
-from django.db.models import Q
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.db.models import Q, F, QuerySet, Sum, Value
+from django.db.models.functions import Coalesce
 
 from core.api.filters import PaginationIn
 from core.api.v1.budget_management.filters import CategoryFilters, OperationFilters
-from core.apps.budgets.entities.operations import Category, Operation
+from core.apps.budgets.entities.operations import Category, Operation, NewOperation
+from core.apps.budgets.exceptions.operations import (
+    InvalidOperationTypeException, BudgetsNotFoundException, CategoriesNotFoundException
+)
 
 from core.apps.budgets.models.operations import (
     Category as CategoryModel,
     Operation as OperationModel,
     Budget as BudgetModel,
 )
+from core.apps.budgets.services.summaries import ORMDailySummaryMixin
+from core.apps.common.pagination import Page, get_page, aget_page
+from core.apps.common.search import rank_by_similarity
 from core.apps.customers.entities.customers import Customer
+from core.apps.customers.services.versions import BaseDataVersionService
+
+
+def order_operations(queryset: QuerySet) -> QuerySet:
+    """
+    Order operations newest first, the order keyset cursors of operation pages seek on.
+    """
+    return queryset.order_by('-created_at', '-id')
+
+
+def build_operation_search_query(search: str) -> Q:
+    """
+    Match operations by title, or by type when the search names one. Budget titles and category names
+    are matched in subqueries, so each branch can use its own index instead of a join in an OR.
+    """
+    query = Q(title__icontains=search)
+
+    if search.upper() in OperationModel.OperationType.values:
+        query |= Q(operation_type=search.upper())
+
+    return query
+
+
+OPERATION_COUNTERS_TOTAL = Coalesce(Sum(F('add_operations_count') + F('sub_operations_count')), Value(0))
+
+
+def iter_batches(items: Iterable, batch_size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
 
 
 class BaseCategoryService(ABC):
@@ -23,7 +65,7 @@ class BaseCategoryService(ABC):
             filters: CategoryFilters,
             pagination: PaginationIn,
             related_customer: Customer
-    ) -> Iterable[Category]:
+    ) -> Page[Category]:
         ...
 
     @abstractmethod
@@ -56,7 +98,24 @@ class BaseCategoryService(ABC):
         ...
 
 
-class ORMCategoryService(BaseCategoryService):
+class ORMCategoryQueryMixin:
+    def _get_category_queryset(self) -> QuerySet[CategoryModel]:
+        return CategoryModel.objects.select_related('related_customer')
+
+    def _get_category_list_queryset(
+            self,
+            queryset: QuerySet[CategoryModel],
+            filters: CategoryFilters,
+            related_customer: Customer
+    ) -> QuerySet[CategoryModel]:
+        query = self._build_category_query(filters)
+
+        return rank_by_similarity(
+            queryset.filter(related_customer_id=related_customer.id).filter(query),
+            filters.search,
+            'name'
+        )
+
     def _build_category_query(self, filters: CategoryFilters) -> Q:
         query = Q()
 
@@ -65,18 +124,20 @@ class ORMCategoryService(BaseCategoryService):
 
         return query
 
+
+@dataclass(eq=False)
+class ORMCategoryService(ORMCategoryQueryMixin, ORMDailySummaryMixin, BaseCategoryService):
+    data_version_service: BaseDataVersionService
+
     def get_category_list(
             self,
             filters: CategoryFilters,
             pagination: PaginationIn,
             related_customer: Customer
-    ) -> Iterable[Category]:
-        query = self._build_category_query(filters)
-        qs = CategoryModel.objects.filter(related_customer_id=related_customer.id).filter(query)[
-             pagination.offset:pagination.offset + pagination.limit
-        ]
+    ) -> Page[Category]:
+        qs = self._get_category_list_queryset(self._get_category_queryset(), filters, related_customer)
 
-        return [category.to_entity() for category in qs]
+        return get_page(qs, pagination).map(CategoryModel.to_entity)
 
     def get_category_count(self, filters: CategoryFilters, related_customer: Customer) -> int:
         query = self._build_category_query(filters)
@@ -84,7 +145,7 @@ class ORMCategoryService(BaseCategoryService):
         return CategoryModel.objects.filter(related_customer_id=related_customer.id).filter(query).count()
 
     def get_category_by_id(self, category_id: int, related_customer: Customer) -> Category:
-        return CategoryModel.objects.filter(related_customer_id=related_customer.id).get(id=category_id).to_entity()
+        return self._get_category_queryset().filter(related_customer_id=related_customer.id).get(id=category_id).to_entity()
 
     def create_category(
             self,
@@ -95,10 +156,16 @@ class ORMCategoryService(BaseCategoryService):
             name=name,
             related_customer_id=related_customer.id
         )
+        self.data_version_service.bump(related_customer.id)
         return category.to_entity()
 
     def delete_category(self, category_id: int, related_customer: Customer) -> None:
-        CategoryModel.objects.filter(related_customer_id=related_customer.id).get(id=category_id).delete()
+        with transaction.atomic():
+            category = CategoryModel.objects.filter(related_customer_id=related_customer.id).get(id=category_id)
+
+            self._move_category_summaries_to_uncategorized(category_id=category.id)
+            category.delete()
+            self.data_version_service.bump(related_customer.id)
 
     def update_category(
             self,
@@ -106,12 +173,13 @@ class ORMCategoryService(BaseCategoryService):
             name: Optional[str],
             related_customer: Customer
     ) -> Category:
-        category = CategoryModel.objects.filter(related_customer_id=related_customer.id).get(id=category_id)
+        category = self._get_category_queryset().filter(related_customer_id=related_customer.id).get(id=category_id)
 
         if name is not None:
             category.name = name
 
         category.save()
+        self.data_version_service.bump(related_customer.id)
         return category.to_entity()
 
 
@@ -122,7 +190,7 @@ class BaseOperationService(ABC):
             filters: OperationFilters,
             pagination: PaginationIn,
             related_customer: Customer
-    ) -> Iterable[Operation]:
+    ) -> Page[Operation]:
         ...
 
     @abstractmethod
@@ -133,6 +201,15 @@ class BaseOperationService(ABC):
     def get_operation_by_id(self, operation_id: int, related_customer: Customer) -> Operation:
         ...
 
+    @abstractmethod
+    def iter_operation_rows(
+            self,
+            filters: OperationFilters,
+            related_customer: Customer,
+            budget_id: Optional[int] = None
+    ) -> Iterator[dict]:
+        ...
+
     @abstractmethod
     def create_operation(
             self,
@@ -140,11 +217,20 @@ class BaseOperationService(ABC):
             operation_type: str,
             amount: Decimal,
             related_budget_id: int,
-            related_category_id: int,
+            related_category_id: Optional[int],
             related_customer: Customer
     ) -> Operation:
         ...
 
+    @abstractmethod
+    def bulk_create_operations(
+            self,
+            operations: Iterable[NewOperation],
+            related_customer: Customer,
+            batch_size: int = 1000
+    ) -> int:
+        ...
+
     @abstractmethod
     def delete_operation(self, operation_id: int, related_customer: Customer) -> None:
         ...
@@ -162,38 +248,140 @@ class BaseOperationService(ABC):
         ...
 
 
-class ORMOperationService(BaseOperationService):
+class ORMOperationQueryMixin:
+    EXPORT_CHUNK_SIZE = 2000
+
+    def _get_operation_counters_queryset(self, related_customer: Customer) -> QuerySet[BudgetModel]:
+        """
+        Budgets of the customer, whose maintained counters add up to the unfiltered operation total.
+        """
+        return BudgetModel.objects.filter(related_customer_id=related_customer.id)
+
+    def _get_export_queryset(
+            self,
+            filters: OperationFilters,
+            related_customer: Customer,
+            budget_id: Optional[int] = None
+    ) -> QuerySet:
+        qs = OperationModel.objects.filter(related_budget__related_customer_id=related_customer.id).filter(
+            self._build_operation_query(filters)
+        )
+
+        if budget_id is not None:
+            qs = qs.filter(related_budget_id=budget_id)
+
+        return qs.order_by('created_at', 'id').values(
+            'id',
+            'created_at',
+            'updated_at',
+            'title',
+            'operation_type',
+            'amount',
+            'related_budget_id',
+            'related_category_id',
+            budget_title=F('related_budget__title'),
+            currency=F('related_budget__related_currency__short_name'),
+            category_name=F('related_category__name'),
+        )
+
+    def _get_operation_queryset(self) -> QuerySet[OperationModel]:
+        return OperationModel.objects.select_related(
+            'related_budget__related_currency',
+            'related_budget__related_customer',
+            'related_category__related_customer',
+        )
+
+    def _get_operation_list_queryset(
+            self,
+            queryset: QuerySet[OperationModel],
+            filters: OperationFilters,
+            related_customer: Customer
+    ) -> QuerySet[OperationModel]:
+        query = self._build_operation_query(filters)
+
+        return order_operations(queryset.filter(related_budget__related_customer_id=related_customer.id).filter(query))
+
     def _build_operation_query(self, filters: OperationFilters) -> Q:
         query = Q()
 
         if filters.search is not None:
-            query &= (
-                Q(title__icontains=filters.search) | Q(operation_type__iexact=filters.search) |
-                Q(related_budget__title__icontains=filters.search) | Q(related_category__name__icontains=filters.search)
+            query &= build_operation_search_query(filters.search) | Q(
+                related_budget_id__in=BudgetModel.objects.filter(title__icontains=filters.search).values('id')
+            ) | Q(
+                related_category_id__in=CategoryModel.objects.filter(name__icontains=filters.search).values('id')
             )
 
         return query
 
+
+@dataclass(eq=False)
+class ORMOperationService(ORMOperationQueryMixin, ORMDailySummaryMixin, BaseOperationService):
+    data_version_service: BaseDataVersionService
+
+    def _get_signed_amount(self, operation_type: str, amount: Decimal) -> Decimal:
+        return -amount if operation_type == OperationModel.OperationType.SUB else amount
+
+    def _get_counter_deltas(self, operation_type: str, step: int) -> tuple[int, int]:
+        if operation_type == OperationModel.OperationType.SUB:
+            return 0, step
+        return step, 0
+
+    def _apply_budget_delta(
+            self,
+            budget_id: int,
+            balance_delta: Decimal,
+            add_operations_delta: int = 0,
+            sub_operations_delta: int = 0
+    ) -> None:
+        """
+        Move the materialized balance and counters of a budget with in-database arithmetic.
+        Must be called in the same transaction as the operation write it reflects.
+        """
+        if not balance_delta and not add_operations_delta and not sub_operations_delta:
+            return
+
+        BudgetModel.objects.filter(id=budget_id).update(
+            current_balance=F('current_balance') + balance_delta,
+            add_operations_count=F('add_operations_count') + add_operations_delta,
+            sub_operations_count=F('sub_operations_count') + sub_operations_delta,
+        )
+
     def get_operation_list(
             self,
             filters: OperationFilters,
             pagination: PaginationIn,
             related_customer: Customer
-    ) -> Iterable[Operation]:
-        query = self._build_operation_query(filters)
-        qs = OperationModel.objects.filter(related_budget__related_customer_id=related_customer.id).filter(query)[
-             pagination.offset:pagination.offset + pagination.limit
-        ]
+    ) -> Page[Operation]:
+        qs = self._get_operation_list_queryset(self._get_operation_queryset(), filters, related_customer)
+        total = None
+
+        if filters.search is None and not pagination.has_more:
+            total = self._get_operation_counters_queryset(related_customer).aggregate(total=OPERATION_COUNTERS_TOTAL)['total']
 
-        return [operation.to_entity() for operation in qs]
+        return get_page(qs, pagination, keyset=True, total=total).map(OperationModel.to_entity)
 
     def get_operation_count(self, filters: OperationFilters, related_customer: Customer) -> int:
+        if filters.search is None:
+            return self._get_operation_counters_queryset(related_customer).aggregate(total=OPERATION_COUNTERS_TOTAL)['total']
+
         query = self._build_operation_query(filters)
 
         return OperationModel.objects.filter(related_budget__related_customer_id=related_customer.id).filter(query).count()
 
     def get_operation_by_id(self, operation_id: int, related_customer: Customer) -> Operation:
-        return OperationModel.objects.filter(related_budget__related_customer_id=related_customer.id).get(id=operation_id).to_entity()
+        return self._get_operation_queryset().filter(
+            related_budget__related_customer_id=related_customer.id
+        ).get(id=operation_id).to_entity()
+
+    def iter_operation_rows(
+            self,
+            filters: OperationFilters,
+            related_customer: Customer,
+            budget_id: Optional[int] = None
+    ) -> Iterator[dict]:
+        qs = self._get_export_queryset(filters=filters, related_customer=related_customer, budget_id=budget_id)
+
+        yield from qs.iterator(chunk_size=self.EXPORT_CHUNK_SIZE)
 
     def create_operation(
             self,
@@ -201,22 +389,147 @@ class ORMOperationService(BaseOperationService):
             operation_type: str,
             amount: Decimal,
             related_budget_id: int,
-            related_customer: Customer,
-            related_category_id: Optional[int]
+            related_category_id: Optional[int],
+            related_customer: Customer
     ) -> Operation:
-        related_budget = BudgetModel.objects.filter(related_customer_id=related_customer.id).get(id=related_budget_id)
+        related_budget = BudgetModel.objects.select_related('related_currency', 'related_customer').filter(
+            related_customer_id=related_customer.id
+        ).get(id=related_budget_id)
+        related_category = None
+
+        if related_category_id is not None:
+            related_category = CategoryModel.objects.select_related('related_customer').filter(
+                related_customer_id=related_customer.id
+            ).get(id=related_category_id)
+
+        with transaction.atomic():
+            operation = OperationModel.objects.create(
+                title=title,
+                operation_type=operation_type,
+                amount=amount,
+                related_budget=related_budget,
+                related_category=related_category
+            )
+            add_delta, sub_delta = self._get_counter_deltas(operation.operation_type, 1)
+            self._apply_budget_delta(
+                budget_id=related_budget.id,
+                balance_delta=self._get_signed_amount(operation.operation_type, operation.amount),
+                add_operations_delta=add_delta,
+                sub_operations_delta=sub_delta,
+            )
+            self._apply_summary_deltas({self._get_summary_key(operation): (operation.amount, 1)})
+            self.data_version_service.bump(related_customer.id)
+            related_budget.refresh_from_db(fields=['current_balance', 'add_operations_count', 'sub_operations_count'])
 
-        operation = OperationModel.objects.create(
-            title=title,
-            operation_type=operation_type,
-            amount=amount,
-            related_budget=related_budget,
-            related_category_id=related_category_id
-        )
         return operation.to_entity()
 
+    def _verify_bulk_relations(
+            self,
+            operations: list[NewOperation],
+            related_customer: Customer,
+            verified_budget_ids: set[int],
+            verified_category_ids: set[int]
+    ) -> None:
+        """
+        Check operation types and ownership of referenced budgets and categories,
+        querying each model once per batch and only for ids not verified by previous batches.
+        """
+        for operation in operations:
+            if operation.operation_type not in OperationModel.OperationType.values:
+                raise InvalidOperationTypeException(operation_type=operation.operation_type)
+
+        budget_ids = {operation.related_budget_id for operation in operations} - verified_budget_ids
+        if budget_ids:
+            owned_ids = set(BudgetModel.objects.filter(
+                related_customer_id=related_customer.id,
+                id__in=budget_ids
+            ).values_list('id', flat=True))
+
+            if owned_ids != budget_ids:
+                raise BudgetsNotFoundException(budget_ids=sorted(budget_ids - owned_ids))
+            verified_budget_ids |= owned_ids
+
+        category_ids = {
+            operation.related_category_id for operation in operations if operation.related_category_id is not None
+        } - verified_category_ids
+        if category_ids:
+            owned_ids = set(CategoryModel.objects.filter(
+                related_customer_id=related_customer.id,
+                id__in=category_ids
+            ).values_list('id', flat=True))
+
+            if owned_ids != category_ids:
+                raise CategoriesNotFoundException(category_ids=sorted(category_ids - owned_ids))
+            verified_category_ids |= owned_ids
+
+    def bulk_create_operations(
+            self,
+            operations: Iterable[NewOperation],
+            related_customer: Customer,
+            batch_size: int = 1000
+    ) -> int:
+        verified_budget_ids, verified_category_ids = set(), set()
+        budget_deltas = defaultdict(lambda: [Decimal('0'), 0, 0])
+        summary_deltas = defaultdict(lambda: [Decimal('0'), 0])
+        created_count = 0
+
+        with transaction.atomic():
+            for batch in iter_batches(operations, batch_size):
+                self._verify_bulk_relations(batch, related_customer, verified_budget_ids, verified_category_ids)
+
+                created_operations = OperationModel.objects.bulk_create([
+                    OperationModel(
+                        title=operation.title or '',
+                        operation_type=operation.operation_type,
+                        amount=operation.amount,
+                        related_budget_id=operation.related_budget_id,
+                        related_category_id=operation.related_category_id,
+                    )
+                    for operation in batch
+                ])
+                created_count += len(batch)
+
+                for operation in created_operations:
+                    add_delta, sub_delta = self._get_counter_deltas(operation.operation_type, 1)
+                    budget_delta = budget_deltas[operation.related_budget_id]
+                    budget_delta[0] += self._get_signed_amount(operation.operation_type, operation.amount)
+                    budget_delta[1] += add_delta
+                    budget_delta[2] += sub_delta
+
+                    summary_delta = summary_deltas[self._get_summary_key(operation)]
+                    summary_delta[0] += operation.amount
+                    summary_delta[1] += 1
+
+            for budget_id, (balance_delta, add_delta, sub_delta) in budget_deltas.items():
+                self._apply_budget_delta(
+                    budget_id=budget_id,
+                    balance_delta=balance_delta,
+                    add_operations_delta=add_delta,
+                    sub_operations_delta=sub_delta,
+                )
+            self._apply_summary_deltas(summary_deltas)
+            self.data_version_service.bump(related_customer.id)
+
+        return created_count
+
     def delete_operation(self, operation_id: int, related_customer: Customer) -> None:
-        OperationModel.objects.filter(related_budget__related_customer_id=related_customer.id).get(id=operation_id).delete()
+        with transaction.atomic():
+            operation = OperationModel.objects.select_for_update().filter(
+                related_budget__related_customer_id=related_customer.id
+            ).get(id=operation_id)
+            add_delta, sub_delta = self._get_counter_deltas(operation.operation_type, -1)
+
+            summary_key = self._get_summary_key(operation)
+
+            operation.delete()
+            self._apply_budget_delta(
+                budget_id=operation.related_budget_id,
+                balance_delta=-self._get_signed_amount(operation.operation_type, operation.amount),
+                add_operations_delta=add_delta,
+                sub_operations_delta=sub_delta,
+            )
+            self._apply_summary_deltas({summary_key: (-operation.amount, -1)})
+            self.data_version_service.bump(related_customer.id)
 
     def update_operation(
             self,
@@ -227,19 +540,384 @@ class ORMOperationService(BaseOperationService):
             related_category_id: Optional[int],
             related_customer: Customer
     ) -> Operation:
-        operation = OperationModel.objects.filter(related_budget__related_customer_id=related_customer.id).get(id=operation_id)
+        with transaction.atomic():
+            operation = self._get_operation_queryset().select_for_update(of=('self',)).filter(
+                related_budget__related_customer_id=related_customer.id
+            ).get(id=operation_id)
+            old_operation_type, old_amount = operation.operation_type, operation.amount
+            old_summary_key = self._get_summary_key(operation)
+
+            if title is not None:
+                operation.title = title
+
+            if operation_type is not None:
+                operation.operation_type = operation_type
+
+            if amount is not None:
+                operation.amount = amount
+
+            if related_category_id is not None:
+                operation.related_category = CategoryModel.objects.select_related('related_customer').filter(
+                    related_customer_id=related_customer.id
+                ).get(id=related_category_id)
+
+            operation.save()
+
+            old_add_delta, old_sub_delta = self._get_counter_deltas(old_operation_type, -1)
+            new_add_delta, new_sub_delta = self._get_counter_deltas(operation.operation_type, 1)
+            self._apply_budget_delta(
+                budget_id=operation.related_budget_id,
+                balance_delta=(
+                    self._get_signed_amount(operation.operation_type, operation.amount) -
+                    self._get_signed_amount(old_operation_type, old_amount)
+                ),
+                add_operations_delta=old_add_delta + new_add_delta,
+                sub_operations_delta=old_sub_delta + new_sub_delta,
+            )
+            summary_deltas = defaultdict(lambda: [Decimal('0'), 0])
+            for summary_key, amount, step in (
+                    (old_summary_key, -old_amount, -1),
+                    (self._get_summary_key(operation), operation.amount, 1),
+            ):
+                summary_deltas[summary_key][0] += amount
+                summary_deltas[summary_key][1] += step
+            self._apply_summary_deltas(summary_deltas)
+            self.data_version_service.bump(related_customer.id)
+            operation.related_budget.refresh_from_db(
+                fields=['current_balance', 'add_operations_count', 'sub_operations_count']
+            )
+
+        return operation.to_entity()
 
-        if title is not None:
-            operation.title = title
 
-        if operation_type is not None:
-            operation.operation_type = operation_type
+class BaseAsyncCategoryService(ABC):
+    @abstractmethod
+    async def get_category_list(
+            self,
+            filters: CategoryFilters,
+            pagination: PaginationIn,
+            related_customer: Customer
+    ) -> Page[Category]:
+        ...
+
+    @abstractmethod
+    async def get_category_row_list(
+            self,
+            filters: CategoryFilters,
+            pagination: PaginationIn,
+            related_customer: Customer,
+            fields: Sequence[str]
+    ) -> Page[dict]:
+        ...
 
-        if amount is not None:
-            operation.amount = amount
+    @abstractmethod
+    async def get_category_count(self, filters: CategoryFilters, related_customer: Customer) -> int:
+        ...
 
-        if related_category_id is not None:
-            operation.related_category = CategoryModel.objects.filter(related_customer_id=related_customer.id).get(id=related_category_id)
+    @abstractmethod
+    async def get_category_by_id(self, category_id: int, related_customer: Customer) -> Category:
+        ...
+
+    @abstractmethod
+    async def create_category(
+            self,
+            name: str,
+            related_customer: Customer
+    ) -> Category:
+        ...
+
+    @abstractmethod
+    async def delete_category(self, category_id: int, related_customer: Customer) -> None:
+        ...
+
+    @abstractmethod
+    async def update_category(
+            self,
+            category_id: int,
+            name: Optional[str],
+            related_customer: Customer
+    ) -> Category:
+        ...
+
+
+@dataclass(eq=False)
+class AsyncORMCategoryService(ORMCategoryQueryMixin, BaseAsyncCategoryService):
+    """
+    Reads run on the async ORM, writes are delegated to the sync service in a worker thread.
+    """
+    category_service: BaseCategoryService
+
+    async def get_category_list(
+            self,
+            filters: CategoryFilters,
+            pagination: PaginationIn,
+            related_customer: Customer
+    ) -> Page[Category]:
+        qs = self._get_category_list_queryset(self._get_category_queryset(), filters, related_customer)
+
+        page = await aget_page(qs, pagination)
+        return page.map(CategoryModel.to_entity)
+
+    async def get_category_row_list(
+            self,
+            filters: CategoryFilters,
+            pagination: PaginationIn,
+            related_customer: Customer,
+            fields: Sequence[str]
+    ) -> Page[dict]:
+        """
+        Same page as ``get_category_list``, as flat ``values()`` rows of the given lookups.
+        """
+        qs = self._get_category_list_queryset(CategoryModel.objects.all(), filters, related_customer)
+
+        return await aget_page(qs.values(*fields), pagination)
+
+    async def get_category_count(self, filters: CategoryFilters, related_customer: Customer) -> int:
+        query = self._build_category_query(filters)
+
+        return await CategoryModel.objects.filter(related_customer_id=related_customer.id).filter(query).acount()
+
+    async def get_category_by_id(self, category_id: int, related_customer: Customer) -> Category:
+        category = await self._get_category_queryset().filter(
+            related_customer_id=related_customer.id
+        ).aget(id=category_id)
+
+        return category.to_entity()
+
+    async def create_category(
+            self,
+            name: str,
+            related_customer: Customer
+    ) -> Category:
+        return await sync_to_async(self.category_service.create_category)(
+            name=name,
+            related_customer=related_customer
+        )
+
+    async def delete_category(self, category_id: int, related_customer: Customer) -> None:
+        await sync_to_async(self.category_service.delete_category)(
+            category_id=category_id,
+            related_customer=related_customer
+        )
+
+    async def update_category(
+            self,
+            category_id: int,
+            name: Optional[str],
+            related_customer: Customer
+    ) -> Category:
+        return await sync_to_async(self.category_service.update_category)(
+            category_id=category_id,
+            name=name,
+            related_customer=related_customer
+        )
+
+
+class BaseAsyncOperationService(ABC):
+    @abstractmethod
+    async def get_operation_list(
+            self,
+            filters: OperationFilters,
+            pagination: PaginationIn,
+            related_customer: Customer
+    ) -> Page[Operation]:
+        ...
+
+    @abstractmethod
+    async def get_operation_row_list(
+            self,
+            filters: OperationFilters,
+            pagination: PaginationIn,
+            related_customer: Customer,
+            fields: Sequence[str]
+    ) -> Page[dict]:
+        ...
+
+    @abstractmethod
+    async def get_operation_count(self, filters: OperationFilters, related_customer: Customer) -> int:
+        ...
+
+    @abstractmethod
+    async def get_operation_by_id(self, operation_id: int, related_customer: Customer) -> Operation:
+        ...
+
+    @abstractmethod
+    def iter_operation_rows(
+            self,
+            filters: OperationFilters,
+            related_customer: Customer,
+            budget_id: Optional[int] = None
+    ) -> AsyncIterator[dict]:
+        ...
+
+    @abstractmethod
+    async def create_operation(
+            self,
+            title: Optional[str],
+            operation_type: str,
+            amount: Decimal,
+            related_budget_id: int,
+            related_category_id: Optional[int],
+            related_customer: Customer
+    ) -> Operation:
+        ...
+
+    @abstractmethod
+    async def bulk_create_operations(
+            self,
+            operations: Iterable[NewOperation],
+            related_customer: Customer,
+            batch_size: int = 1000
+    ) -> int:
+        ...
+
+    @abstractmethod
+    async def delete_operation(self, operation_id: int, related_customer: Customer) -> None:
+        ...
+
+    @abstractmethod
+    async def update_operation(
+            self,
+            operation_id: int,
+            title: Optional[str],
+            operation_type: Optional[str],
+            amount: Optional[Decimal],
+            related_category_id: Optional[int],
+            related_customer: Customer
+    ) -> Operation:
+        ...
+
+
+@dataclass(eq=False)
+class AsyncORMOperationService(ORMOperationQueryMixin, BaseAsyncOperationService):
+    """
+    Reads run on the async ORM, writes keep the budget balance in a transaction
+    and are delegated to the sync service in a worker thread.
+    """
+    operation_service: BaseOperationService
+
+    async def get_operation_list(
+            self,
+            filters: OperationFilters,
+            pagination: PaginationIn,
+            related_customer: Customer
+    ) -> Page[Operation]:
+        qs = self._get_operation_list_queryset(self._get_operation_queryset(), filters, related_customer)
+        total = await self._get_operation_list_total(filters, pagination, related_customer)
+
+        page = await aget_page(qs, pagination, keyset=True, total=total)
+        return page.map(OperationModel.to_entity)
+
+    async def get_operation_row_list(
+            self,
+            filters: OperationFilters,
+            pagination: PaginationIn,
+            related_customer: Customer,
+            fields: Sequence[str]
+    ) -> Page[dict]:
+        """
+        Same page as ``get_operation_list``, as flat ``values()`` rows of the given lookups.
+        """
+        qs = self._get_operation_list_queryset(OperationModel.objects.all(), filters, related_customer)
+        total = await self._get_operation_list_total(filters, pagination, related_customer)
+
+        return await aget_page(qs.values(*fields), pagination, keyset=True, total=total)
+
+    async def _get_operation_list_total(
+            self,
+            filters: OperationFilters,
+            pagination: PaginationIn,
+            related_customer: Customer
+    ) -> Optional[int]:
+        if filters.search is not None or pagination.has_more:
+            return None
+
+        counters = await self._get_operation_counters_queryset(related_customer).aaggregate(
+            total=OPERATION_COUNTERS_TOTAL
+        )
+        return counters['total']
+
+    async def get_operation_count(self, filters: OperationFilters, related_customer: Customer) -> int:
+        if filters.search is None:
+            counters = await self._get_operation_counters_queryset(related_customer).aaggregate(
+                total=OPERATION_COUNTERS_TOTAL
+            )
+            return counters['total']
+
+        query = self._build_operation_query(filters)
+
+        return await OperationModel.objects.filter(
+            related_budget__related_customer_id=related_customer.id
+        ).filter(query).acount()
+
+    async def get_operation_by_id(self, operation_id: int, related_customer: Customer) -> Operation:
+        operation = await self._get_operation_queryset().filter(
+            related_budget__related_customer_id=related_customer.id
+        ).aget(id=operation_id)
 
-        operation.save()
         return operation.to_entity()
+
+    async def iter_operation_rows(
+            self,
+            filters: OperationFilters,
+            related_customer: Customer,
+            budget_id: Optional[int] = None
+    ) -> AsyncIterator[dict]:
+        qs = self._get_export_queryset(filters=filters, related_customer=related_customer, budget_id=budget_id)
+
+        async for row in qs.aiterator(chunk_size=self.EXPORT_CHUNK_SIZE):
+            yield row
+
+    async def create_operation(
+            self,
+            title: Optional[str],
+            operation_type: str,
+            amount: Decimal,
+            related_budget_id: int,
+            related_category_id: Optional[int],
+            related_customer: Customer
+    ) -> Operation:
+        return await sync_to_async(self.operation_service.create_operation)(
+            title=title,
+            operation_type=operation_type,
+            amount=amount,
+            related_budget_id=related_budget_id,
+            related_category_id=related_category_id,
+            related_customer=related_customer
+        )
+
+    async def bulk_create_operations(
+            self,
+            operations: Iterable[NewOperation],
+            related_customer: Customer,
+            batch_size: int = 1000
+    ) -> int:
+        return await sync_to_async(self.operation_service.bulk_create_operations)(
+            operations=operations,
+            related_customer=related_customer,
+            batch_size=batch_size
+        )
+
+    async def delete_operation(self, operation_id: int, related_customer: Customer) -> None:
+        await sync_to_async(self.operation_service.delete_operation)(
+            operation_id=operation_id,
+            related_customer=related_customer
+        )
+
+    async def update_operation(
+            self,
+            operation_id: int,
+            title: Optional[str],
+            operation_type: Optional[str],
+            amount: Optional[Decimal],
+            related_category_id: Optional[int],
+            related_customer: Customer
+    ) -> Operation:
+        return await sync_to_async(self.operation_service.update_operation)(
+            operation_id=operation_id,
+            title=title,
+            operation_type=operation_type,
+            amount=amount,
+            related_category_id=related_category_id,
+            related_customer=related_customer
+        )
@@ -0,0 +1,165 @@
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from itertools import groupby
+from operator import itemgetter
+from typing import Iterable, Optional, Sequence
+
+from django.conf import settings
+
+from core.apps.budgets.exceptions.rates import ExchangeRateNotFoundException
+from core.apps.budgets.models.budgets import Currency as CurrencyModel
+from core.apps.budgets.models.rates import ExchangeRate as ExchangeRateModel
+from core.apps.common.catalogs import VersionedCatalog
+
+# Amounts are stored with two decimal places, conversions run on integer hundredths.
+MINOR_UNITS_EXPONENT = 2
+# Rates are kept as integers scaled by the decimal places they are stored with, so conversions are exact.
+RATE_EXPONENT = ExchangeRateModel._meta.get_field('rate').decimal_places
+
+
+def to_scaled_rate(rate: Decimal) -> int:
+    return int(rate.scaleb(RATE_EXPONENT))
+
+
+def divide_half_even(numerator: int, denominator: int) -> int:
+    """
+    Integer quotient of a positive denominator, rounded half to even like ``ROUND_HALF_EVEN``.
+    """
+    quotient, remainder = divmod(numerator, denominator)
+    if 2 * remainder > denominator or (2 * remainder == denominator and quotient % 2):
+        quotient += 1
+
+    return quotient
+
+
+@dataclass(frozen=True)
+class RateHistory:
+    """
+    Rates of one currency in the base currency, each effective from its day (as an ordinal) on,
+    as integers scaled by ``RATE_EXPONENT``.
+    """
+    days: list[int]
+    rates: list[int]
+
+@dataclass(frozen=True)
+class ExchangeRateSnapshot:
+    base_currency_id: Optional[int]
+    short_names: dict[int, str] = field(default_factory=dict)
+    histories: dict[int, RateHistory] = field(default_factory=dict)
+
+
+class ExchangeRateCatalog(VersionedCatalog[ExchangeRateSnapshot]):
+    """
+    Process-local table of all exchange rates, kept as sorted lists per currency
+    so whole batches of amounts are converted without touching the database.
+    """
+    VERSION_CACHE_KEY = 'budgets:exchange-rate-catalog-version'
+    LOAD_CHUNK_SIZE = 10_000
+
+    def __init__(self, check_interval: Optional[float] = None):
+        super().__init__(check_interval if check_interval is not None else settings.EXCHANGE_RATE_CHECK_INTERVAL)
+
+    def _get_rates_queryset(self):
+        return ExchangeRateModel.objects.order_by('related_currency_id', 'day').values_list(
+            'related_currency_id', 'day', 'rate'
+        )
+
+    def _build(self, short_names: dict[int, str], rates: Iterable[tuple[int, date, Decimal]]) -> ExchangeRateSnapshot:
+        base_short_name = settings.EXCHANGE_RATE_BASE_CURRENCY.casefold()
+        histories = {}
+
+        for currency_id, currency_rates in groupby(rates, key=itemgetter(0)):
+            days, values = [], []
+            for _, day, rate in currency_rates:
+                days.append(day.toordinal())
+                values.append(to_scaled_rate(rate))
+
+            histories[currency_id] = RateHistory(days=days, rates=values)
+
+        return ExchangeRateSnapshot(
+            base_currency_id=next(
+                (currency_id for currency_id, short_name in short_names.items() if short_name.casefold() == base_short_name),
+                None
+            ),
+            short_names=short_names,
+            histories=histories,
+        )
+
+    def _load(self) -> ExchangeRateSnapshot:
+        short_names = dict(CurrencyModel.objects.values_list('id', 'short_name'))
+
+        return self._build(short_names, self._get_rates_queryset().iterator(chunk_size=self.LOAD_CHUNK_SIZE))
+
+    async def _aload(self) -> ExchangeRateSnapshot:
+        short_names = {currency_id: short_name async for currency_id, short_name in CurrencyModel.objects.values_list(
+            'id', 'short_name'
+        )}
+        rates = [row async for row in self._get_rates_queryset()]
+
+        return self._build(short_names, rates)
+
+
+@dataclass(frozen=True)
+class CurrencyConverter:
+    """
+    Converts batches of amounts between currencies through their rates in the base currency.
+
+    Each amount is converted at the rate effective on its day in exact integer arithmetic, rounded half
+    to even to the minor unit and summed as an integer.
+    """
+    snapshot: ExchangeRateSnapshot
+
+    def _get_missing_rate_exception(self, currency_id: int, day: int) -> ExchangeRateNotFoundException:
+        return ExchangeRateNotFoundException(
+            currency=self.snapshot.short_names.get(currency_id, str(currency_id)),
+            day=date.fromordinal(day)
+        )
+
+    def _get_rates(self, currency_id: int, days: Sequence[int]) -> list[int]:
+        if currency_id == self.snapshot.base_currency_id:
+            return [10 ** RATE_EXPONENT] * len(days)
+
+        history = self.snapshot.histories.get(currency_id)
+        if history is None:
+            raise self._get_missing_rate_exception(currency_id, min(days))
+
+        rates = []
+        for day in days:
+            index = bisect_right(history.days, day) - 1
+            if index < 0:
+                raise self._get_missing_rate_exception(currency_id, day)
+            rates.append(history.rates[index])
+
+        return rates
+
+    def _convert_minor_units(self, minor_units: list[int], source_rates: list[int], target_rates: list[int]) -> int:
+        return sum(
+            divide_half_even(amount * source_rate, target_rate)
+            for amount, source_rate, target_rate in zip(minor_units, source_rates, target_rates)
+        )
+
+    def convert_sum(self, amounts: Iterable[tuple[int, date, Decimal]], target_currency_id: int) -> Decimal:
+        """
+        Sum (currency id, day, amount) entries in the target currency.
+        """
+        groups = defaultdict(lambda: ([], []))
+        for currency_id, day, amount in amounts:
+            days, minor_units = groups[currency_id]
+            days.append(day.toordinal())
+            minor_units.append(int(amount.scaleb(MINOR_UNITS_EXPONENT)))
+
+        total = 0
+        for currency_id, (days, minor_units) in groups.items():
+            if currency_id == target_currency_id:
+                total += sum(minor_units)
+                continue
+
+            total += self._convert_minor_units(
+                minor_units, self._get_rates(currency_id, days), self._get_rates(target_currency_id, days)
+            )
+
+        return Decimal(total).scaleb(-MINOR_UNITS_EXPONENT).quantize(Decimal(1).scaleb(-MINOR_UNITS_EXPONENT))
+
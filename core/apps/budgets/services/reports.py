@@ -0,0 +1,329 @@
+from abc import ABC, abstractmethod
+from datetime import date, datetime, time
+from typing import Iterable, Literal, Optional, TypeVar
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db.models import Q, F, QuerySet, Sum, Count, Avg, ExpressionWrapper, DecimalField
+from django.db.models.functions import TruncDay, TruncWeek, TruncMonth
+from django.utils import timezone
+
+from core.api.v1.budget_management.filters import OperationFilters, ReportFilters
+from core.apps.budgets.entities.reports import OperationTotals, CategoryTotals, PeriodTotals
+from core.apps.budgets.models.operations import Operation as OperationModel
+from core.apps.budgets.models.summaries import BudgetDailySummary as BudgetDailySummaryModel
+from core.apps.budgets.services.operations import ORMOperationQueryMixin
+from core.apps.customers.entities.customers import Customer
+
+ReportPeriod = Literal['day', 'week', 'month']
+TTotals = TypeVar('TTotals', bound=OperationTotals)
+
+PERIOD_TRUNCATORS = {
+    'day': TruncDay,
+    'week': TruncWeek,
+    'month': TruncMonth,
+}
+
+
+class BaseReportService(ABC):
+    @abstractmethod
+    def get_operation_type_report(
+            self,
+            filters: OperationFilters,
+            report_filters: ReportFilters,
+            related_customer: Customer
+    ) -> Iterable[OperationTotals]:
+        ...
+
+    @abstractmethod
+    def get_category_report(
+            self,
+            filters: OperationFilters,
+            report_filters: ReportFilters,
+            related_customer: Customer
+    ) -> Iterable[CategoryTotals]:
+        ...
+
+    @abstractmethod
+    def get_period_report(
+            self,
+            filters: OperationFilters,
+            report_filters: ReportFilters,
+            period: ReportPeriod,
+            related_customer: Customer
+    ) -> Iterable[PeriodTotals]:
+        ...
+
+
+class ORMReportQueryMixin(ORMOperationQueryMixin):
+    """
+    Builds grouped querysets so totals, counts and averages are computed by the database.
+    Amounts are never summed across currencies, the currency is always part of the group.
+
+    Reports read the daily summaries when the filters line up with whole summary days,
+    and fall back to grouping operations otherwise.
+    """
+
+    def _get_summary_day_bound(self, value: datetime) -> Optional[date]:
+        default_timezone = timezone.get_default_timezone()
+        if timezone.is_naive(value):
+            value = timezone.make_aware(value, default_timezone)
+
+        value = timezone.localtime(value, default_timezone)
+        return value.date() if value.time() == time.min else None
+
+    def _can_use_summaries(self, filters: OperationFilters, report_filters: ReportFilters) -> bool:
+        if filters.search is not None or report_filters.timezone != settings.TIME_ZONE:
+            return False
+
+        return all(
+            self._get_summary_day_bound(bound) is not None
+            for bound in (report_filters.date_from, report_filters.date_to) if bound is not None
+        )
+
+    def _build_report_query(self, report_filters: ReportFilters) -> Q:
+        query = Q()
+
+        if report_filters.budget_id is not None:
+            query &= Q(related_budget_id=report_filters.budget_id)
+
+        if report_filters.date_from is not None:
+            query &= Q(created_at__gte=report_filters.date_from)
+
+        if report_filters.date_to is not None:
+            query &= Q(created_at__lt=report_filters.date_to)
+
+        return query
+
+    def _build_summary_query(self, report_filters: ReportFilters) -> Q:
+        query = Q()
+
+        if report_filters.budget_id is not None:
+            query &= Q(related_budget_id=report_filters.budget_id)
+
+        if report_filters.date_from is not None:
+            query &= Q(day__gte=self._get_summary_day_bound(report_filters.date_from))
+
+        if report_filters.date_to is not None:
+            query &= Q(day__lt=self._get_summary_day_bound(report_filters.date_to))
+
+        return query
+
+    def _get_report_queryset(
+            self,
+            filters: OperationFilters,
+            report_filters: ReportFilters,
+            related_customer: Customer,
+            **group_by
+    ) -> QuerySet:
+        group_by = {
+            'currency': F('related_budget__related_currency__short_name'),
+            **group_by,
+        }
+
+        return OperationModel.objects.filter(
+            related_budget__related_customer_id=related_customer.id
+        ).filter(
+            self._build_operation_query(filters)
+        ).filter(
+            self._build_report_query(report_filters)
+        ).values(
+            'operation_type',
+            **group_by
+        ).annotate(
+            amount_sum=Sum('amount'),
+            count_sum=Count('id'),
+            amount_avg=Avg('amount'),
+        )
+
+    def _get_summary_report_queryset(
+            self,
+            report_filters: ReportFilters,
+            related_customer: Customer,
+            **group_by
+    ) -> QuerySet:
+        group_by = {
+            'currency': F('related_budget__related_currency__short_name'),
+            **group_by,
+        }
+
+        return BudgetDailySummaryModel.objects.filter(
+            related_budget__related_customer_id=related_customer.id
+        ).filter(
+            self._build_summary_query(report_filters)
+        ).values(
+            'operation_type',
+            **group_by
+        ).annotate(
+            amount_sum=Sum('total_amount'),
+            count_sum=Sum('operations_count'),
+            amount_avg=ExpressionWrapper(
+                Sum('total_amount') / Sum('operations_count'),
+                output_field=DecimalField(max_digits=14, decimal_places=2)
+            ),
+        )
+
+    def _get_grouped_queryset(
+            self,
+            filters: OperationFilters,
+            report_filters: ReportFilters,
+            related_customer: Customer,
+            **group_by
+    ) -> QuerySet:
+        if self._can_use_summaries(filters, report_filters):
+            return self._get_summary_report_queryset(report_filters, related_customer, **group_by)
+
+        return self._get_report_queryset(filters, report_filters, related_customer, **group_by)
+
+    def _to_totals(self, totals_class: type[TTotals], row: dict) -> TTotals:
+        period_start = row.get('period_start')
+        if period_start is not None and not isinstance(period_start, datetime):
+            row['period_start'] = datetime.combine(period_start, time.min, tzinfo=timezone.get_default_timezone())
+
+        return totals_class(
+            total_amount=row.pop('amount_sum'),
+            operations_count=row.pop('count_sum'),
+            average_amount=row.pop('amount_avg'),
+            **row
+        )
+
+    def _get_operation_type_report_queryset(
+            self,
+            filters: OperationFilters,
+            report_filters: ReportFilters,
+            related_customer: Customer
+    ) -> QuerySet:
+        return self._get_grouped_queryset(filters, report_filters, related_customer).order_by(
+            'currency', 'operation_type'
+        )
+
+    def _get_category_report_queryset(
+            self,
+            filters: OperationFilters,
+            report_filters: ReportFilters,
+            related_customer: Customer
+    ) -> QuerySet:
+        return self._get_grouped_queryset(
+            filters,
+            report_filters,
+            related_customer,
+            category_id=F('related_category_id'),
+            category_name=F('related_category__name'),
+        ).order_by('currency', 'operation_type', '-amount_sum', 'category_id')
+
+    def _get_period_report_queryset(
+            self,
+            filters: OperationFilters,
+            report_filters: ReportFilters,
+            period: ReportPeriod,
+            related_customer: Customer
+    ) -> QuerySet:
+        truncator = PERIOD_TRUNCATORS[period]
+
+        if self._can_use_summaries(filters, report_filters):
+            qs = self._get_summary_report_queryset(report_filters, related_customer, period_start=truncator('day'))
+        else:
+            qs = self._get_report_queryset(
+                filters,
+                report_filters,
+                related_customer,
+                period_start=truncator('created_at', tzinfo=ZoneInfo(report_filters.timezone)),
+            )
+
+        return qs.order_by('period_start', 'currency', 'operation_type')
+
+
+class ORMReportService(ORMReportQueryMixin, BaseReportService):
+    def get_operation_type_report(
+            self,
+            filters: OperationFilters,
+            report_filters: ReportFilters,
+            related_customer: Customer
+    ) -> Iterable[OperationTotals]:
+        qs = self._get_operation_type_report_queryset(filters, report_filters, related_customer)
+
+        return [self._to_totals(OperationTotals, row) for row in qs]
+
+    def get_category_report(
+            self,
+            filters: OperationFilters,
+            report_filters: ReportFilters,
+            related_customer: Customer
+    ) -> Iterable[CategoryTotals]:
+        qs = self._get_category_report_queryset(filters, report_filters, related_customer)
+
+        return [self._to_totals(CategoryTotals, row) for row in qs]
+
+    def get_period_report(
+            self,
+            filters: OperationFilters,
+            report_filters: ReportFilters,
+            period: ReportPeriod,
+            related_customer: Customer
+    ) -> Iterable[PeriodTotals]:
+        qs = self._get_period_report_queryset(filters, report_filters, period, related_customer)
+
+        return [self._to_totals(PeriodTotals, row) for row in qs]
+
+
+class BaseAsyncReportService(ABC):
+    @abstractmethod
+    async def get_operation_type_report(
+            self,
+            filters: OperationFilters,
+            report_filters: ReportFilters,
+            related_customer: Customer
+    ) -> Iterable[OperationTotals]:
+        ...
+
+    @abstractmethod
+    async def get_category_report(
+            self,
+            filters: OperationFilters,
+            report_filters: ReportFilters,
+            related_customer: Customer
+    ) -> Iterable[CategoryTotals]:
+        ...
+
+    @abstractmethod
+    async def get_period_report(
+            self,
+            filters: OperationFilters,
+            report_filters: ReportFilters,
+            period: ReportPeriod,
+            related_customer: Customer
+    ) -> Iterable[PeriodTotals]:
+        ...
+
+
+class AsyncORMReportService(ORMReportQueryMixin, BaseAsyncReportService):
+    async def get_operation_type_report(
+            self,
+            filters: OperationFilters,
+            report_filters: ReportFilters,
+            related_customer: Customer
+    ) -> Iterable[OperationTotals]:
+        qs = self._get_operation_type_report_queryset(filters, report_filters, related_customer)
+
+        return [self._to_totals(OperationTotals, row) async for row in qs]
+
+    async def get_category_report(
+            self,
+            filters: OperationFilters,
+            report_filters: ReportFilters,
+            related_customer: Customer
+    ) -> Iterable[CategoryTotals]:
+        qs = self._get_category_report_queryset(filters, report_filters, related_customer)
+
+        return [self._to_totals(CategoryTotals, row) async for row in qs]
+
+    async def get_period_report(
+            self,
+            filters: OperationFilters,
+            report_filters: ReportFilters,
+            period: ReportPeriod,
+            related_customer: Customer
+    ) -> Iterable[PeriodTotals]:
+        qs = self._get_period_report_queryset(filters, report_filters, period, related_customer)
+
+        return [self._to_totals(PeriodTotals, row) async for row in qs]
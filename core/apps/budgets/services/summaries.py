@@ -0,0 +1,105 @@
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Mapping, NamedTuple, Optional
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, QuerySet, Sum, Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from core.apps.budgets.models.operations import Operation as OperationModel
+from core.apps.budgets.models.summaries import BudgetDailySummary as BudgetDailySummaryModel
+
+
+class SummaryKey(NamedTuple):
+    budget_id: int
+    category_id: Optional[int]
+    day: date
+    operation_type: str
+
+
+SummaryDeltas = Mapping[SummaryKey, tuple[Decimal, int]]
+
+
+def get_summary_day(created_at: datetime) -> date:
+    """
+    Daily summaries are cut in the project default timezone.
+    """
+    return timezone.localtime(created_at, timezone.get_default_timezone()).date()
+
+
+def build_summary_rows(operations: QuerySet[OperationModel]) -> QuerySet:
+    return operations.annotate(
+        day=TruncDate('created_at', tzinfo=timezone.get_default_timezone()),
+    ).order_by().values(
+        'related_budget_id', 'related_category_id', 'day', 'operation_type',
+    ).annotate(
+        total_amount=Sum('amount'),
+        operations_count=Count('id'),
+    )
+
+
+class ORMDailySummaryMixin:
+    def _get_summary_key(self, operation: OperationModel) -> SummaryKey:
+        return SummaryKey(
+            budget_id=operation.related_budget_id,
+            category_id=operation.related_category_id,
+            day=get_summary_day(operation.created_at),
+            operation_type=operation.operation_type,
+        )
+
+    def _apply_summary_deltas(self, deltas: SummaryDeltas) -> None:
+        """
+        Move daily summary rows by the given amount and count deltas, creating missing rows.
+        Must be called in the same transaction as the operation writes it reflects,
+        after the budget row has been updated so writers of one budget are serialized.
+        """
+        for key, (amount_delta, count_delta) in deltas.items():
+            if not amount_delta and not count_delta:
+                continue
+
+            summaries = BudgetDailySummaryModel.objects.filter(
+                related_budget_id=key.budget_id,
+                related_category_id=key.category_id,
+                day=key.day,
+                operation_type=key.operation_type,
+            )
+            values = {
+                'total_amount': F('total_amount') + amount_delta,
+                'operations_count': F('operations_count') + count_delta,
+            }
+
+            if summaries.update(**values):
+                if count_delta < 0:
+                    summaries.filter(operations_count=0).delete()
+                continue
+
+            try:
+                with transaction.atomic():
+                    BudgetDailySummaryModel.objects.create(
+                        related_budget_id=key.budget_id,
+                        related_category_id=key.category_id,
+                        day=key.day,
+                        operation_type=key.operation_type,
+                        total_amount=amount_delta,
+                        operations_count=count_delta,
+                    )
+            except IntegrityError:
+                summaries.update(**values)
+
+    def _move_category_summaries_to_uncategorized(self, category_id: int) -> None:
+        """
+        Fold the summary rows of a category into the uncategorized rows of the same budgets,
+        mirroring how its operations lose the category when it is deleted.
+        """
+        deltas = defaultdict(lambda: [Decimal('0'), 0])
+        summaries = BudgetDailySummaryModel.objects.filter(related_category_id=category_id)
+
+        for summary in summaries:
+            delta = deltas[SummaryKey(summary.related_budget_id, None, summary.day, summary.operation_type)]
+            delta[0] += summary.total_amount
+            delta[1] += summary.operations_count
+
+        summaries.delete()
+        self._apply_summary_deltas(deltas)
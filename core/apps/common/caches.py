@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+# State every process must see: sign-in codes, data versions, rate limit buckets and catalog versions.
+SHARED_CACHE_ALIAS = 'default'
+PROCESS_LOCAL_CACHE_BACKENDS = frozenset({'django.core.cache.backends.locmem.LocMemCache'})
+
+
+def is_cache_shared(alias: str = SHARED_CACHE_ALIAS) -> bool:
+    return settings.CACHES[alias]['BACKEND'] not in PROCESS_LOCAL_CACHE_BACKENDS
+
+
+def check_shared_cache(processes: int) -> None:
+    """
+    Refuse to serve from several processes when each would keep its own copy of the shared state.
+    """
+    if processes > 1 and not is_cache_shared():
+        raise ImproperlyConfigured(
+            f'The {SHARED_CACHE_ALIAS} cache is local to each process, {processes} workers would each keep their own '
+            f'sign-in codes, data versions and rate limits. Point CACHE_URL to a shared cache such as Redis, '
+            f'or run a single worker.'
+        )
@@ -0,0 +1,92 @@
+from abc import ABC, abstractmethod
+from time import monotonic
+from typing import Generic, Optional, TypeVar
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+
+TSnapshot = TypeVar('TSnapshot')
+
+
+class VersionedCatalog(ABC, Generic[TSnapshot]):
+    """
+    Process-local snapshot of rarely changing rows, loaded once per worker.
+
+    Workers compare their snapshot with a version kept in the shared cache at most once per
+    check interval and reload when it moved. `invalidate` moves the version, so changes made
+    in one worker reach the others within the interval when the cache is shared between them.
+
+    Versions expire after `max_age` seconds and the first worker to find one missing starts
+    the next, so every worker reloads at least that often, even after a lost invalidation or
+    a change made outside the admin and the management commands.
+    """
+    VERSION_CACHE_KEY: str
+
+    def __init__(self, check_interval: float, max_age: Optional[float] = None):
+        self.check_interval = check_interval
+        self.max_age = max_age if max_age is not None else settings.CATALOG_MAX_AGE
+        self._snapshot: Optional[TSnapshot] = None
+        self._version: Optional[str] = None
+        self._checked_at = 0.0
+
+    @abstractmethod
+    def _load(self) -> TSnapshot:
+        ...
+
+    @abstractmethod
+    async def _aload(self) -> TSnapshot:
+        ...
+
+    def _is_check_due(self) -> bool:
+        return self._snapshot is None or monotonic() - self._checked_at >= self.check_interval
+
+    def _is_stale(self, version: Optional[str]) -> bool:
+        self._checked_at = monotonic()
+        return self._snapshot is None or self._version != version
+
+    def _get_version(self) -> str:
+        version = cache.get(self.VERSION_CACHE_KEY)
+        if version is None:
+            cache.add(self.VERSION_CACHE_KEY, uuid4().hex, timeout=self.max_age)
+            version = cache.get(self.VERSION_CACHE_KEY)
+
+        return version
+
+    async def _aget_version(self) -> str:
+        version = await cache.aget(self.VERSION_CACHE_KEY)
+        if version is None:
+            await cache.aadd(self.VERSION_CACHE_KEY, uuid4().hex, timeout=self.max_age)
+            version = await cache.aget(self.VERSION_CACHE_KEY)
+
+        return version
+
+    def get_snapshot(self) -> TSnapshot:
+        if self._is_check_due():
+            version = self._get_version()
+            if self._is_stale(version):
+                self._snapshot, self._version = self._load(), version
+
+        return self._snapshot
+
+    async def aget_snapshot(self) -> TSnapshot:
+        if self._is_check_due():
+            version = await self._aget_version()
+            if self._is_stale(version):
+                self._snapshot, self._version = await self._aload(), version
+
+        return self._snapshot
+
+    @property
+    def version(self) -> Optional[str]:
+        """
+        Shared version the current snapshot was loaded at, None until it is first loaded.
+        """
+        return self._version
+
+    def invalidate(self) -> None:
+        cache.set(self.VERSION_CACHE_KEY, uuid4().hex, timeout=self.max_age)
+        self.reset()
+
+    def reset(self) -> None:
+        self._snapshot = None
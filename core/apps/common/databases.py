@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+from typing import Any
+
+from django.db import connections
+
+
+@dataclass(frozen=True)
+class ConnectionPoolStats:
+    """
+    Counters of one database connection pool in this worker, totals since the pool was created.
+    """
+    alias: str
+    min_size: int
+    max_size: int
+    size: int
+    idle: int
+    waiting: int
+    requests: int
+    wait_ms: int
+    errors: int
+    connections: int
+    connect_ms: int
+
+    @property
+    def in_use(self) -> int:
+        return self.size - self.idle
+
+    @property
+    def average_wait_ms(self) -> float:
+        return self.wait_ms / self.requests if self.requests else 0.0
+
+    @classmethod
+    def from_pool_stats(cls, alias: str, stats: dict[str, Any]) -> 'ConnectionPoolStats':
+        # psycopg_pool leaves counters that are still zero out of its stats.
+        return cls(
+            alias=alias,
+            min_size=stats.get('pool_min', 0),
+            max_size=stats.get('pool_max', 0),
+            size=stats.get('pool_size', 0),
+            idle=stats.get('pool_available', 0),
+            waiting=stats.get('requests_waiting', 0),
+            requests=stats.get('requests_num', 0),
+            wait_ms=stats.get('requests_wait_ms', 0),
+            errors=stats.get('requests_errors', 0),
+            connections=stats.get('connections_num', 0),
+            connect_ms=stats.get('connections_ms', 0),
+        )
+
+
+def get_connection_pool_stats() -> list[ConnectionPoolStats]:
+    """
+    Stats of the pools of all pooled database connections, the pool is shared by the threads of a worker.
+    Pools are opened on the first connection, before that they hold nothing worth reporting.
+    """
+    stats = []
+    for alias in connections:
+        pool = getattr(connections[alias], 'pool', None)
+        if pool is not None and not pool.closed:
+            stats.append(ConnectionPoolStats.from_pool_stats(alias, pool.get_stats()))
+
+    return stats
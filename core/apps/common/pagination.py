@@ -0,0 +1,101 @@
+from dataclasses import dataclass, field
+from typing import Callable, Generic, Optional, TypeVar
+
+from django.db.models import Count, QuerySet, Window
+
+from core.api.filters import PaginationIn
+
+TItem = TypeVar('TItem')
+TMappedItem = TypeVar('TMappedItem')
+
+WINDOW_TOTAL_ANNOTATION = 'pagination_window_total'
+
+
+@dataclass
+class Page(Generic[TItem]):
+    items: list[TItem] = field(default_factory=list)
+    total: Optional[int] = None
+    has_more: Optional[bool] = None
+
+    def map(self, function: Callable[[TItem], TMappedItem]) -> 'Page[TMappedItem]':
+        return Page(items=[function(item) for item in self.items], total=self.total, has_more=self.has_more)
+
+
+def paginate_items(items: list[TItem], pagination: PaginationIn) -> Page[TItem]:
+    """
+    Cut a page out of items already held in memory.
+    """
+    start, end = pagination.offset, pagination.offset + pagination.limit
+
+    if pagination.has_more:
+        return Page(items=items[start:end], has_more=len(items) > end)
+
+    return Page(items=items[start:end], total=len(items))
+
+
+def _slice_page(queryset: QuerySet, pagination: PaginationIn, keyset: bool, total: Optional[int]) -> QuerySet:
+    cursor = pagination.get_cursor() if keyset else None
+    if cursor is not None:
+        queryset, start = queryset.filter(cursor.to_query()), 0
+    else:
+        start = pagination.offset
+
+    if pagination.has_more:
+        return queryset[start:start + pagination.limit + 1]
+
+    if total is None and cursor is None:
+        # COUNT(*) OVER () is evaluated before LIMIT, so every row of the page carries the full total.
+        queryset = queryset.annotate(**{WINDOW_TOTAL_ANNOTATION: Window(expression=Count('*'))})
+
+    return queryset[start:start + pagination.limit]
+
+
+def _build_page(rows: list, pagination: PaginationIn, total: Optional[int]) -> Page:
+    if pagination.has_more:
+        return Page(items=rows[:pagination.limit], has_more=len(rows) > pagination.limit)
+
+    if total is None and rows:
+        # Model rows carry the window total as an attribute, ``values()`` rows as a key.
+        if isinstance(rows[0], dict):
+            total = rows[0].get(WINDOW_TOTAL_ANNOTATION)
+        else:
+            total = getattr(rows[0], WINDOW_TOTAL_ANNOTATION, None)
+
+    return Page(items=rows, total=total)
+
+
+def get_page(
+        queryset: QuerySet,
+        pagination: PaginationIn,
+        keyset: bool = False,
+        total: Optional[int] = None
+) -> Page:
+    """
+    Fetch a page of an ordered queryset together with its total in a single query.
+
+    A known ``total`` (e.g. from maintained counters) is used as is. In ``has_more`` mode one extra row
+    is fetched instead and no total is computed. ``keyset`` pages seek past the pagination cursor
+    of a queryset ordered by (-created_at, -id). A separate COUNT only runs when the window total
+    is unavailable: for cursor pages and for pages past the end.
+    """
+    page = _build_page(list(_slice_page(queryset, pagination, keyset, total)), pagination, total)
+
+    if page.total is None and page.has_more is None:
+        page.total = queryset.count()
+
+    return page
+
+
+async def aget_page(
+        queryset: QuerySet,
+        pagination: PaginationIn,
+        keyset: bool = False,
+        total: Optional[int] = None
+) -> Page:
+    rows = [row async for row in _slice_page(queryset, pagination, keyset, total)]
+    page = _build_page(rows, pagination, total)
+
+    if page.total is None and page.has_more is None:
+        page.total = await queryset.acount()
+
+    return page
@@ -0,0 +1,24 @@
+from typing import Optional
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connections
+from django.db.models import QuerySet
+from django.db.models.functions import Greatest
+
+
+def is_trigram_search_available(using: str) -> bool:
+    return connections[using].vendor == 'postgresql'
+
+
+def rank_by_similarity(queryset: QuerySet, search: Optional[str], *fields: str) -> QuerySet:
+    """
+    Order search results by pg_trgm word similarity to the search string, best match first.
+    Other backends keep the queryset order, matching still works there through plain lookups.
+    """
+    if search is None or not is_trigram_search_available(queryset.db):
+        return queryset
+
+    ranks = [TrigramWordSimilarity(search, field) for field in fields]
+    rank = ranks[0] if len(ranks) == 1 else Greatest(*ranks)
+
+    return queryset.annotate(search_rank=rank).order_by('-search_rank', 'id')
@@ -1,9 +1,33 @@
 from django.contrib import admin
 
 from core.apps.customers.models import Customer
+from core.apps.customers.services.versions import BaseDataVersionService
+from core.project.ioc_containers import get_ioc_container
+
+
+class CustomerDataAdminMixin:
+    """
+    Admin changes bypass the services, so they move the data version of all customers
+    and cached API responses are revalidated.
+    """
+
+    def _bump_data_versions(self) -> None:
+        get_ioc_container().resolve(BaseDataVersionService).bump_all()
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        self._bump_data_versions()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        self._bump_data_versions()
+
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        self._bump_data_versions()
 
 
 @admin.register(Customer)
-class CustomerAdmin(admin.ModelAdmin):
+class CustomerAdmin(CustomerDataAdminMixin, admin.ModelAdmin):
     list_display = ('id', 'phone', 'username', 'created_at', 'updated_at')
     search_fields = ('phone', )
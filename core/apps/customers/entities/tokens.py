@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class TokenPair:
+    access_token: str
+    refresh_token: str
+    expires_in: int
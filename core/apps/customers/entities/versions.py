@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class DataVersion:
+    """
+    Versions of the data a customer reads, as nanosecond timestamps of the last writes:
+    one moved by writes to the customer's own data, one moved by writes made outside the API.
+    """
+    customer: int
+    shared: int
+
+    @property
+    def tag(self) -> str:
+        return f'{self.shared:x}.{self.customer:x}'
+
+    @property
+    def modified_at(self) -> int:
+        return max(self.customer, self.shared) // 10 ** 9
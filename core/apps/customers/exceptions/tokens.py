@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+from core.apps.common.exceptions import ServiceException
+
+
+@dataclass(eq=False)
+class TokenException(ServiceException):
+    @property
+    def message(self):
+        return 'Token exception occurred.'
+
+
+@dataclass(eq=False)
+class InvalidTokenException(TokenException):
+    token_type: str
+
+    @property
+    def message(self):
+        return f'Invalid or expired {self.token_type} token.'
+
+
+@dataclass(eq=False)
+class TokenRevokedException(TokenException):
+    customer_id: int
+
+    @property
+    def message(self):
+        return 'Token has been revoked.'
@@ -0,0 +1,20 @@
+from core.apps.customers.services.auth import SEND_CODE_JOB
+from core.apps.customers.services.codes import BaseCodeService
+from core.apps.customers.services.customers import BaseCustomerService
+from core.apps.customers.services.senders import BaseSenderService
+from core.project.ioc_containers import get_ioc_container
+
+
+def send_code(payload: dict) -> None:
+    ioc_container = get_ioc_container()
+    customer_service = ioc_container.resolve(BaseCustomerService)
+    code_service = ioc_container.resolve(BaseCodeService)
+    sender_service = ioc_container.resolve(BaseSenderService)
+
+    customer = customer_service.get(phone=payload['phone'])
+    code = code_service.get_code(customer=customer)
+    # The code expired or was already confirmed, there is nothing left to deliver.
+    if code is None:
+        return
+
+    sender_service.send_code(customer=customer, code=code)
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.4 on 2026-10-17 22:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0002_customer_username_alter_customer_token'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='customer',
+            name='token',
+        ),
+        migrations.AddField(
+            model_name='customer',
+            name='token_version',
+            field=models.PositiveIntegerField(default=0, verbose_name='Auth token version'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+
+def remove_codes_from_send_code_jobs(apps, schema_editor):
+    Job = apps.get_model('jobs', 'Job')
+
+    jobs = Job.objects.filter(kind='customers.send_code', payload__has_key='code').only('payload')
+    for job in jobs.iterator():
+        del job.payload['code']
+        job.save(update_fields=['payload'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0003_customer_token_version'),
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_codes_from_send_code_jobs, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,3 @@
-from uuid import uuid4
-
 from django.db import models
 
 from core.apps.common.models import TimestampedBaseModel
@@ -18,11 +16,9 @@ class Customer(TimestampedBaseModel):
         max_length=20,
         unique=True,
     )
-    token = models.CharField(
-        verbose_name=_('Auth token'),
-        max_length=255,
-        unique=True,
-        default=uuid4,
+    token_version = models.PositiveIntegerField(
+        verbose_name=_('Auth token version'),
+        default=0,
     )
 
     def to_entity(self) -> CustomerEntity:
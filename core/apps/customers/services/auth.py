@@ -1,35 +1,98 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
-from core.apps.customers.services.codes import BaseCodeService
-from core.apps.customers.services.customers import BaseCustomerService
-from core.apps.customers.services.senders import BaseSenderService
+from core.apps.customers.entities.customers import Customer as CustomerEntity
+from core.apps.customers.entities.tokens import TokenPair
+from core.apps.customers.services.codes import BaseCodeService, BaseAsyncCodeService
+from core.apps.customers.services.customers import BaseCustomerService, BaseAsyncCustomerService
+from core.apps.jobs.services.jobs import BaseJobService, BaseAsyncJobService
+
+# Codes are delivered by background workers, so the provider never holds up authorization.
+# Jobs only carry the phone, workers read the code from the code service, so codes never reach the jobs table.
+SEND_CODE_JOB = 'customers.send_code'
 
 
 @dataclass(eq=False)
 class BaseAuthService(ABC):
     customer_service: BaseCustomerService
     code_service: BaseCodeService
-    sender_service: BaseSenderService
+    job_service: BaseJobService
 
     @abstractmethod
     def authorize(self, phone: str, username: str):
         ...
 
     @abstractmethod
-    def confirm(self, code: str, phone: str):
+    def confirm(self, code: str, phone: str) -> TokenPair:
+        ...
+
+    @abstractmethod
+    def refresh(self, refresh_token: str) -> TokenPair:
+        ...
+
+    @abstractmethod
+    def logout(self, customer: CustomerEntity) -> None:
         ...
 
 
 class AuthService(BaseAuthService):
     def authorize(self, phone: str, username: str):
         customer = self.customer_service.get_or_create(phone=phone, username=username)
-        code = self.code_service.generate_code(customer=customer)
-        self.sender_service.send_code(customer=customer, code=code)
+        self.code_service.generate_code(customer=customer)
+        self.job_service.enqueue(SEND_CODE_JOB, {'phone': customer.phone})
 
-    def confirm(self, code: str, phone: str):
+    def confirm(self, code: str, phone: str) -> TokenPair:
         customer = self.customer_service.get(phone=phone)
         self.code_service.validate_code(customer=customer, code=code)
-        token = self.customer_service.generate_token(customer=customer)
+        tokens = self.customer_service.generate_token(customer=customer)
+
+        return tokens
+
+    def refresh(self, refresh_token: str) -> TokenPair:
+        return self.customer_service.refresh_token(refresh_token=refresh_token)
+
+    def logout(self, customer: CustomerEntity) -> None:
+        self.customer_service.revoke_tokens(customer=customer)
+
+
+@dataclass(eq=False)
+class BaseAsyncAuthService(ABC):
+    customer_service: BaseAsyncCustomerService
+    code_service: BaseAsyncCodeService
+    job_service: BaseAsyncJobService
+
+    @abstractmethod
+    async def authorize(self, phone: str, username: str):
+        ...
+
+    @abstractmethod
+    async def confirm(self, code: str, phone: str) -> TokenPair:
+        ...
+
+    @abstractmethod
+    async def refresh(self, refresh_token: str) -> TokenPair:
+        ...
+
+    @abstractmethod
+    async def logout(self, customer: CustomerEntity) -> None:
+        ...
+
+
+class AsyncAuthService(BaseAsyncAuthService):
+    async def authorize(self, phone: str, username: str):
+        customer = await self.customer_service.get_or_create(phone=phone, username=username)
+        await self.code_service.generate_code(customer=customer)
+        await self.job_service.enqueue(SEND_CODE_JOB, {'phone': customer.phone})
+
+    async def confirm(self, code: str, phone: str) -> TokenPair:
+        customer = await self.customer_service.get(phone=phone)
+        await self.code_service.validate_code(customer=customer, code=code)
+        tokens = await self.customer_service.generate_token(customer=customer)
+
+        return tokens
+
+    async def refresh(self, refresh_token: str) -> TokenPair:
+        return await self.customer_service.refresh_token(refresh_token=refresh_token)
 
-        return token
+    async def logout(self, customer: CustomerEntity) -> None:
+        await self.customer_service.revoke_tokens(customer=customer)
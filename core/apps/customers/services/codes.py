@@ -1,5 +1,6 @@
 from random import randint
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from django.core.cache import cache
 
@@ -12,6 +13,10 @@ class BaseCodeService(ABC):
     def generate_code(self, customer: CustomerEntity) -> str:
         ...
 
+    @abstractmethod
+    def get_code(self, customer: CustomerEntity) -> Optional[str]:
+        ...
+
     @abstractmethod
     def validate_code(self, code: str, customer: CustomerEntity) -> None:
         ...
@@ -26,6 +31,9 @@ class DjangoCacheCodeService(BaseCodeService):
 
         return code
 
+    def get_code(self, customer: CustomerEntity) -> Optional[str]:
+        return cache.get(customer.phone)
+
     def validate_code(self, code: str, customer: CustomerEntity) -> None:
         cached_code = cache.get(customer.phone)
 
@@ -36,3 +44,41 @@ class DjangoCacheCodeService(BaseCodeService):
             raise CodesNotEqualException(code=code, cached_code=cached_code)
 
         cache.delete(customer.phone)
+
+
+class BaseAsyncCodeService(ABC):
+    @abstractmethod
+    async def generate_code(self, customer: CustomerEntity) -> str:
+        ...
+
+    @abstractmethod
+    async def get_code(self, customer: CustomerEntity) -> Optional[str]:
+        ...
+
+    @abstractmethod
+    async def validate_code(self, code: str, customer: CustomerEntity) -> None:
+        ...
+
+
+class AsyncDjangoCacheCodeService(BaseAsyncCodeService):
+    async def generate_code(self, customer: CustomerEntity) -> str:
+        code_length = 6
+        # code = ''.join([f'{randint(0, 9)}' for _ in range(code_length)])
+        code = '000000'
+        await cache.aset(customer.phone, code)
+
+        return code
+
+    async def get_code(self, customer: CustomerEntity) -> Optional[str]:
+        return await cache.aget(customer.phone)
+
+    async def validate_code(self, code: str, customer: CustomerEntity) -> None:
+        cached_code = await cache.aget(customer.phone)
+
+        if cached_code is None:
+            raise CodeNotFoundException(code=code)
+
+        if cached_code != code:
+            raise CodesNotEqualException(code=code, cached_code=cached_code)
+
+        await cache.adelete(customer.phone)
@@ -1,11 +1,21 @@
 from abc import ABC, abstractmethod
-from uuid import uuid4
+from dataclasses import dataclass
+
+from django.db.models import F
 
 from core.apps.customers.entities.customers import Customer as CustomerEntity
+from core.apps.customers.entities.tokens import TokenPair
+from core.apps.customers.exceptions.customers import CustomerNotFoundException
+from core.apps.customers.exceptions.tokens import TokenRevokedException
 from core.apps.customers.models import Customer as CustomerModel
+from core.apps.customers.services.tokens import BaseTokenService
+from core.apps.customers.services.versions import BaseDataVersionService, BaseAsyncDataVersionService
 
 
+@dataclass(eq=False)
 class BaseCustomerService(ABC):
+    token_service: BaseTokenService
+
     @abstractmethod
     def get(self, phone: str) -> CustomerEntity:
         ...
@@ -15,11 +25,26 @@ class BaseCustomerService(ABC):
         ...
 
     @abstractmethod
-    def generate_token(self, customer: CustomerEntity) -> str:
+    def generate_token(self, customer: CustomerEntity) -> TokenPair:
+        ...
+
+    @abstractmethod
+    def refresh_token(self, refresh_token: str) -> TokenPair:
+        ...
+
+    @abstractmethod
+    def revoke_tokens(self, customer: CustomerEntity) -> None:
+        ...
+
+    @abstractmethod
+    def update_username(self, username: str, customer: CustomerEntity) -> CustomerEntity:
         ...
 
 
+@dataclass(eq=False)
 class ORMCustomerService(BaseCustomerService):
+    data_version_service: BaseDataVersionService
+
     def get(self, phone: str) -> CustomerEntity:
         try:
             customer_dto = CustomerModel.objects.get(phone=phone)
@@ -33,18 +58,112 @@ class ORMCustomerService(BaseCustomerService):
 
         return customer_dto.to_entity()
 
-    def generate_token(self, customer: CustomerEntity) -> str:
-        generated_token = str(uuid4())
-        CustomerModel.objects.filter(phone=customer.phone).update(
-            token=generated_token
+    def generate_token(self, customer: CustomerEntity) -> TokenPair:
+        token_version = CustomerModel.objects.filter(id=customer.id).values_list('token_version', flat=True).get()
+
+        return self.token_service.issue_tokens(customer=customer, token_version=token_version)
+
+    def refresh_token(self, refresh_token: str) -> TokenPair:
+        customer_id, token_version = self.token_service.get_refresh_claims(refresh_token)
+
+        try:
+            customer_dto = CustomerModel.objects.get(id=customer_id)
+        except CustomerModel.DoesNotExist:
+            raise CustomerNotFoundException()
+
+        if customer_dto.token_version != token_version:
+            raise TokenRevokedException(customer_id=customer_id)
+
+        return self.token_service.issue_tokens(
+            customer=customer_dto.to_entity(),
+            token_version=customer_dto.token_version
         )
-        return generated_token
+
+    def revoke_tokens(self, customer: CustomerEntity) -> None:
+        CustomerModel.objects.filter(id=customer.id).update(token_version=F('token_version') + 1)
 
     def update_username(self, username: str, customer: CustomerEntity) -> CustomerEntity:
         customer = CustomerModel.objects.get(id=customer.id)
 
         customer.username = username
         customer.save()
+        self.data_version_service.bump(customer.id)
 
         return customer.to_entity()
 
+
+@dataclass(eq=False)
+class BaseAsyncCustomerService(ABC):
+    token_service: BaseTokenService
+
+    @abstractmethod
+    async def get(self, phone: str) -> CustomerEntity:
+        ...
+
+    @abstractmethod
+    async def get_or_create(self, phone: str, username: str) -> CustomerEntity:
+        ...
+
+    @abstractmethod
+    async def generate_token(self, customer: CustomerEntity) -> TokenPair:
+        ...
+
+    @abstractmethod
+    async def refresh_token(self, refresh_token: str) -> TokenPair:
+        ...
+
+    @abstractmethod
+    async def revoke_tokens(self, customer: CustomerEntity) -> None:
+        ...
+
+    @abstractmethod
+    async def update_username(self, username: str, customer: CustomerEntity) -> CustomerEntity:
+        ...
+
+
+@dataclass(eq=False)
+class AsyncORMCustomerService(BaseAsyncCustomerService):
+    data_version_service: BaseAsyncDataVersionService
+
+    async def get(self, phone: str) -> CustomerEntity:
+        customer_dto = await CustomerModel.objects.aget(phone=phone)
+
+        return customer_dto.to_entity()
+
+    async def get_or_create(self, phone: str, username: str) -> CustomerEntity:
+        customer_dto, _ = await CustomerModel.objects.aget_or_create(phone=phone, defaults={'username': username})
+
+        return customer_dto.to_entity()
+
+    async def generate_token(self, customer: CustomerEntity) -> TokenPair:
+        token_version = await CustomerModel.objects.filter(id=customer.id).values_list('token_version', flat=True).aget()
+
+        return self.token_service.issue_tokens(customer=customer, token_version=token_version)
+
+    async def refresh_token(self, refresh_token: str) -> TokenPair:
+        customer_id, token_version = self.token_service.get_refresh_claims(refresh_token)
+
+        try:
+            customer_dto = await CustomerModel.objects.aget(id=customer_id)
+        except CustomerModel.DoesNotExist:
+            raise CustomerNotFoundException()
+
+        if customer_dto.token_version != token_version:
+            raise TokenRevokedException(customer_id=customer_id)
+
+        return self.token_service.issue_tokens(
+            customer=customer_dto.to_entity(),
+            token_version=customer_dto.token_version
+        )
+
+    async def revoke_tokens(self, customer: CustomerEntity) -> None:
+        await CustomerModel.objects.filter(id=customer.id).aupdate(token_version=F('token_version') + 1)
+
+    async def update_username(self, username: str, customer: CustomerEntity) -> CustomerEntity:
+        customer = await CustomerModel.objects.aget(id=customer.id)
+
+        customer.username = username
+        await customer.asave()
+        await self.data_version_service.bump(customer.id)
+
+        return customer.to_entity()
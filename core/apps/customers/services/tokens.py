@@ -0,0 +1,99 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+
+import jwt
+from django.conf import settings
+
+from core.apps.customers.entities.customers import Customer as CustomerEntity
+from core.apps.customers.entities.tokens import TokenPair
+from core.apps.customers.exceptions.tokens import InvalidTokenException
+
+
+class BaseTokenService(ABC):
+    @abstractmethod
+    def issue_tokens(self, customer: CustomerEntity, token_version: int) -> TokenPair:
+        ...
+
+    @abstractmethod
+    def get_customer(self, access_token: str) -> CustomerEntity:
+        ...
+
+    @abstractmethod
+    def get_refresh_claims(self, refresh_token: str) -> tuple[int, int]:
+        ...
+
+
+class JWTTokenService(BaseTokenService):
+    """
+    Access tokens carry the whole customer entity and are verified in memory only,
+    refresh tokens carry the customer token version which is checked against storage on refresh.
+    """
+    ACCESS_TOKEN_TYPE = 'access'
+    REFRESH_TOKEN_TYPE = 'refresh'
+
+    def _encode(self, payload: dict) -> str:
+        return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+
+    def _decode(self, token: str, token_type: str) -> dict:
+        try:
+            payload = jwt.decode(
+                token,
+                settings.JWT_SECRET_KEY,
+                algorithms=[settings.JWT_ALGORITHM],
+                options={'require': ['sub', 'type', 'exp']},
+            )
+        except jwt.PyJWTError:
+            raise InvalidTokenException(token_type=token_type)
+
+        if payload['type'] != token_type:
+            raise InvalidTokenException(token_type=token_type)
+
+        return payload
+
+    def issue_tokens(self, customer: CustomerEntity, token_version: int) -> TokenPair:
+        issued_at = datetime.now(tz=timezone.utc)
+        access_token = self._encode({
+            'sub': str(customer.id),
+            'type': self.ACCESS_TOKEN_TYPE,
+            'iat': issued_at,
+            'exp': issued_at + settings.ACCESS_TOKEN_LIFETIME,
+            'username': customer.username,
+            'phone': customer.phone,
+            'created_at': customer.created_at.isoformat(),
+            'updated_at': customer.updated_at.isoformat() if customer.updated_at else None,
+        })
+        refresh_token = self._encode({
+            'sub': str(customer.id),
+            'type': self.REFRESH_TOKEN_TYPE,
+            'iat': issued_at,
+            'exp': issued_at + settings.REFRESH_TOKEN_LIFETIME,
+            'ver': token_version,
+        })
+
+        return TokenPair(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            expires_in=int(settings.ACCESS_TOKEN_LIFETIME.total_seconds()),
+        )
+
+    def get_customer(self, access_token: str) -> CustomerEntity:
+        payload = self._decode(access_token, self.ACCESS_TOKEN_TYPE)
+
+        try:
+            return CustomerEntity(
+                id=int(payload['sub']),
+                created_at=datetime.fromisoformat(payload['created_at']),
+                updated_at=datetime.fromisoformat(payload['updated_at']) if payload['updated_at'] else None,
+                username=payload['username'],
+                phone=payload['phone'],
+            )
+        except (KeyError, TypeError, ValueError):
+            raise InvalidTokenException(token_type=self.ACCESS_TOKEN_TYPE)
+
+    def get_refresh_claims(self, refresh_token: str) -> tuple[int, int]:
+        payload = self._decode(refresh_token, self.REFRESH_TOKEN_TYPE)
+
+        try:
+            return int(payload['sub']), int(payload['ver'])
+        except (KeyError, TypeError, ValueError):
+            raise InvalidTokenException(token_type=self.REFRESH_TOKEN_TYPE)
@@ -0,0 +1,101 @@
+from abc import ABC, abstractmethod
+from functools import partial
+from time import time_ns
+from typing import Optional
+
+from django.core.cache import cache
+from django.db import transaction
+
+from core.apps.customers.entities.versions import DataVersion
+
+
+class BaseDataVersionService(ABC):
+    @abstractmethod
+    def get_version(self, customer_id: int) -> DataVersion:
+        ...
+
+    @abstractmethod
+    def bump(self, customer_id: int) -> None:
+        ...
+
+    @abstractmethod
+    def bump_all(self) -> None:
+        ...
+
+
+class DjangoCacheDataVersionMixin:
+    """
+    Versions live in the shared cache without expiry. A version missing from the cache, never set
+    or evicted, starts at the current time, so it can never come back to a value already handed out.
+    Every worker has to read the same versions, so several workers refuse to start on a process-local
+    cache (see core.apps.common.caches.check_shared_cache).
+    """
+    SHARED_VERSION_KEY = 'customers:data-version'
+
+    def _get_version_key(self, customer_id: int) -> str:
+        return f'customers:{customer_id}:data-version'
+
+    def _get_next_version(self, current: Optional[int]) -> int:
+        # Clocks of different workers may disagree, the version only ever moves forward.
+        return max(time_ns(), (current or 0) + 1)
+
+    def _build_version(self, customer_id: int, versions: dict[str, int]) -> DataVersion:
+        return DataVersion(
+            customer=versions[self._get_version_key(customer_id)],
+            shared=versions[self.SHARED_VERSION_KEY],
+        )
+
+
+class DjangoCacheDataVersionService(DjangoCacheDataVersionMixin, BaseDataVersionService):
+    def get_version(self, customer_id: int) -> DataVersion:
+        keys = [self._get_version_key(customer_id), self.SHARED_VERSION_KEY]
+        versions = cache.get_many(keys)
+
+        for key in keys:
+            if key not in versions:
+                version = time_ns()
+                versions[key] = version if cache.add(key, version, timeout=None) else cache.get(key, version)
+
+        return self._build_version(customer_id, versions)
+
+    def _move(self, key: str) -> None:
+        cache.set(key, self._get_next_version(cache.get(key)), timeout=None)
+
+    def bump(self, customer_id: int) -> None:
+        """
+        Move the customer's version once the current transaction commits.
+        """
+        transaction.on_commit(partial(self._move, self._get_version_key(customer_id)))
+
+    def bump_all(self) -> None:
+        """
+        Move the version shared by all customers once the current transaction commits.
+        """
+        transaction.on_commit(partial(self._move, self.SHARED_VERSION_KEY))
+
+
+class BaseAsyncDataVersionService(ABC):
+    @abstractmethod
+    async def get_version(self, customer_id: int) -> DataVersion:
+        ...
+
+    @abstractmethod
+    async def bump(self, customer_id: int) -> None:
+        ...
+
+
+class AsyncDjangoCacheDataVersionService(DjangoCacheDataVersionMixin, BaseAsyncDataVersionService):
+    async def get_version(self, customer_id: int) -> DataVersion:
+        keys = [self._get_version_key(customer_id), self.SHARED_VERSION_KEY]
+        versions = await cache.aget_many(keys)
+
+        for key in keys:
+            if key not in versions:
+                version = time_ns()
+                versions[key] = version if await cache.aadd(key, version, timeout=None) else await cache.aget(key, version)
+
+        return self._build_version(customer_id, versions)
+
+    async def bump(self, customer_id: int) -> None:
+        key = self._get_version_key(customer_id)
+        await cache.aset(key, self._get_next_version(await cache.aget(key)), timeout=None)
@@ -0,0 +1,9 @@
+from django.contrib import admin
+
+from core.apps.jobs.models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'kind', 'status', 'attempts', 'max_attempts', 'run_at', 'created_at',)
+    list_filter = ('status', 'kind',)
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class JobBatchResult:
+    done: int = 0
+    retried: int = 0
+    failed: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.done + self.retried + self.failed
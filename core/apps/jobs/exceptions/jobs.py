@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+from core.apps.common.exceptions import ServiceException
+
+
+@dataclass(eq=False)
+class JobException(ServiceException):
+    @property
+    def message(self):
+        return 'Job exception occurred.'
+
+
+@dataclass(eq=False)
+class UnknownJobKindException(JobException):
+    kind: str
+
+    @property
+    def message(self):
+        return f'No handler is configured for jobs of kind "{self.kind}".'
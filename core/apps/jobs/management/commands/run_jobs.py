@@ -0,0 +1,47 @@
+import signal
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.apps.common.caches import SHARED_CACHE_ALIAS, is_cache_shared
+from core.apps.jobs.services.workers import ORMJobWorker
+
+
+class Command(BaseCommand):
+    help = 'Run background jobs. Start as many workers as needed, they never take the same job.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None, help='Jobs claimed per transaction.')
+        parser.add_argument(
+            '--poll-interval', type=float, default=settings.JOB_POLL_INTERVAL, help='Seconds to wait on an empty queue.'
+        )
+        parser.add_argument('--once', action='store_true', help='Exit once no job is due instead of polling.')
+
+    def _stop(self, signum, frame):
+        self.stopping = True
+
+    def handle(self, *args, **options):
+        # Job handlers read state the API left in the cache, e.g. sign-in codes, from another process.
+        if not is_cache_shared():
+            raise CommandError(
+                f'The {SHARED_CACHE_ALIAS} cache is local to each process, jobs could not read what the API stored '
+                f'in it. Point CACHE_URL to the cache of the API, e.g. Redis.'
+            )
+
+        worker = ORMJobWorker(batch_size=options['batch_size'])
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        while not self.stopping:
+            result = worker.run_batch()
+
+            if result.total:
+                self.stdout.write(f'{result.done} done, {result.retried} retried, {result.failed} failed.')
+                continue
+
+            if options['once']:
+                break
+
+            time.sleep(options['poll_interval'])
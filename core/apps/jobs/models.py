@@ -0,0 +1,57 @@
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from core.apps.common.models import TimestampedBaseModel
+
+
+class Job(TimestampedBaseModel):
+    """
+    Unit of background work. Pending jobs are picked up by `run_jobs` workers once `run_at` passes,
+    done jobs are deleted, jobs out of attempts stay as failed for inspection.
+    """
+    class Status(models.TextChoices):
+        PENDING = 'pending', _('Pending')
+        FAILED = 'failed', _('Failed')
+
+    kind = models.CharField(
+        verbose_name=_('Kind'),
+        max_length=100,
+    )
+    payload = models.JSONField(
+        verbose_name=_('Payload'),
+        default=dict,
+    )
+    status = models.CharField(
+        verbose_name=_('Status'),
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+    )
+    run_at = models.DateTimeField(
+        verbose_name=_('Run at'),
+        default=timezone.now,
+    )
+    attempts = models.PositiveIntegerField(
+        verbose_name=_('Attempts'),
+        default=0,
+    )
+    max_attempts = models.PositiveIntegerField(
+        verbose_name=_('Max attempts'),
+    )
+    last_error = models.TextField(
+        verbose_name=_('Last error'),
+        blank=True,
+    )
+
+    def __str__(self):
+        return f'{self.kind} #{self.id}'
+
+    class Meta:
+        verbose_name = _('Job')
+        verbose_name_plural = _('Jobs')
+        indexes = [
+            # Workers only ever scan due pending jobs, the index stays as small as the queue.
+            models.Index(fields=['run_at', 'id'], condition=Q(status='pending'), name='job_pending_run_at_idx'),
+        ]
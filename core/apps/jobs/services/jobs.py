@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+from core.apps.jobs.models import Job as JobModel
+
+
+class BaseJobService(ABC):
+    @abstractmethod
+    def enqueue(self, kind: str, payload: dict, delay: Optional[timedelta] = None) -> None:
+        ...
+
+
+class ORMJobService(BaseJobService):
+    """
+    Jobs are rows of the current transaction: workers only see them once it commits.
+    """
+    def enqueue(self, kind: str, payload: dict, delay: Optional[timedelta] = None) -> None:
+        JobModel.objects.create(
+            kind=kind,
+            payload=payload,
+            run_at=timezone.now() + (delay or timedelta()),
+            max_attempts=settings.JOB_MAX_ATTEMPTS,
+        )
+
+
+class BaseAsyncJobService(ABC):
+    @abstractmethod
+    async def enqueue(self, kind: str, payload: dict, delay: Optional[timedelta] = None) -> None:
+        ...
+
+
+class AsyncORMJobService(BaseAsyncJobService):
+    async def enqueue(self, kind: str, payload: dict, delay: Optional[timedelta] = None) -> None:
+        await JobModel.objects.acreate(
+            kind=kind,
+            payload=payload,
+            run_at=timezone.now() + (delay or timedelta()),
+            max_attempts=settings.JOB_MAX_ATTEMPTS,
+        )
@@ -0,0 +1,87 @@
+import random
+from datetime import timedelta
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from core.apps.jobs.entities.jobs import JobBatchResult
+from core.apps.jobs.exceptions.jobs import UnknownJobKindException
+from core.apps.jobs.models import Job as JobModel
+
+JobHandler = Callable[[dict], None]
+
+
+class ORMJobWorker:
+    """
+    Runs due jobs in batches with the handlers configured in ``JOB_HANDLERS``.
+
+    A batch is claimed with ``SELECT ... FOR UPDATE SKIP LOCKED`` and held in one transaction while it runs,
+    so concurrent workers never take the same job and the jobs of a worker that dies return to the queue.
+    Each handler runs in a savepoint: a failing job rolls back its own writes only and is retried
+    with exponential backoff until it runs out of attempts.
+    """
+
+    def __init__(self, batch_size: Optional[int] = None):
+        self.batch_size = batch_size if batch_size is not None else settings.JOB_BATCH_SIZE
+        self._handlers: dict[str, JobHandler] = {}
+
+    def _get_handler(self, kind: str) -> JobHandler:
+        if kind not in self._handlers:
+            try:
+                self._handlers[kind] = import_string(settings.JOB_HANDLERS[kind])
+            except KeyError:
+                raise UnknownJobKindException(kind=kind)
+
+        return self._handlers[kind]
+
+    def _get_retry_delay(self, attempts: int) -> timedelta:
+        delay = min(settings.JOB_RETRY_BACKOFF * 2 ** (attempts - 1), settings.JOB_RETRY_BACKOFF_MAX)
+        # Jitter keeps jobs failed together from being retried together.
+        return timedelta(seconds=delay * random.uniform(0.5, 1.0))
+
+    def _fail(self, job: JobModel, exception: Exception) -> bool:
+        """
+        Record a failed attempt, return whether the job is retried.
+        """
+        job.attempts += 1
+        job.last_error = f'{type(exception).__name__}: {exception}'
+
+        if isinstance(exception, UnknownJobKindException) or job.attempts >= job.max_attempts:
+            job.status = JobModel.Status.FAILED
+        else:
+            job.run_at = timezone.now() + self._get_retry_delay(job.attempts)
+
+        job.save(update_fields=['attempts', 'last_error', 'status', 'run_at', 'updated_at'])
+        return job.status == JobModel.Status.PENDING
+
+    def run_batch(self) -> JobBatchResult:
+        result = JobBatchResult()
+
+        with transaction.atomic():
+            jobs = list(
+                JobModel.objects.select_for_update(skip_locked=True)
+                .filter(status=JobModel.Status.PENDING, run_at__lte=timezone.now())
+                .order_by('run_at', 'id')[:self.batch_size]
+            )
+            done_ids = []
+
+            for job in jobs:
+                try:
+                    handler = self._get_handler(job.kind)
+                    with transaction.atomic():
+                        handler(job.payload)
+                except Exception as exception:
+                    if self._fail(job, exception):
+                        result.retried += 1
+                    else:
+                        result.failed += 1
+                else:
+                    done_ids.append(job.id)
+
+            JobModel.objects.filter(id__in=done_ids).delete()
+            result.done = len(done_ids)
+
+        return result
@@ -0,0 +1,83 @@
+"""
+Gunicorn settings for serving the ASGI application with uvicorn workers, see `entrypoint.sh`.
+"""
+import os
+
+import environ
+
+env = environ.Env()
+
+
+def get_cpu_count() -> int:
+    # Cores this container may run on, not all cores of the host.
+    return len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count() or 1
+
+
+wsgi_app = 'core.project.asgi:application'
+worker_class = 'uvicorn_worker.UvicornWorker'
+bind = env('GUNICORN_BIND', default='0.0.0.0:8000')
+
+# Workers are event loops, one per core keeps every core busy without contending for them.
+workers = env.int('GUNICORN_WORKERS', default=get_cpu_count() * env.int('GUNICORN_WORKERS_PER_CORE', default=1))
+
+# Import the project once in the master, forked workers share its memory copy-on-write.
+# A preloaded app is not re-imported on HUP, new code needs a restart.
+preload_app = env.bool('GUNICORN_PRELOAD', default=True)
+
+# A worker silent for longer, e.g. with its event loop blocked, is killed and replaced.
+timeout = env.int('GUNICORN_TIMEOUT_SECONDS', default=30)
+graceful_timeout = env.int('GUNICORN_GRACEFUL_TIMEOUT_SECONDS', default=30)
+keepalive = env.int('GUNICORN_KEEPALIVE_SECONDS', default=5)
+
+# Recycle workers after this many requests (0 never), the jitter keeps them from restarting together.
+max_requests = env.int('GUNICORN_MAX_REQUESTS', default=0)
+max_requests_jitter = env.int('GUNICORN_MAX_REQUESTS_JITTER', default=0)
+
+forwarded_allow_ips = env('GUNICORN_FORWARDED_ALLOW_IPS', default='127.0.0.1')
+accesslog = env('GUNICORN_ACCESS_LOG', default=None)
+errorlog = '-'
+loglevel = env('GUNICORN_LOG_LEVEL', default='info')
+
+
+def on_starting(server) -> None:
+    """
+    Stop before forking workers that could not share sign-in codes, data versions and rate limits.
+    """
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.project.settings.local')
+
+    from django.core.exceptions import ImproperlyConfigured
+
+    from core.apps.common.caches import check_shared_cache
+
+    try:
+        check_shared_cache(server.cfg.workers)
+    except ImproperlyConfigured as error:
+        # Gunicorn reports runtime errors of the arbiter and exits.
+        raise RuntimeError(str(error)) from error
+
+
+def post_fork(server, worker) -> None:
+    """
+    Drop database connections and pools inherited from the master, each worker opens its own.
+    """
+    if not server.cfg.preload_app:
+        return
+
+    from django.db import connections
+
+    for connection in connections.all(initialized_only=True):
+        connection.close()
+        if hasattr(connection, 'close_pool'):
+            connection.close_pool()
+
+
+def child_exit(server, worker) -> None:
+    """
+    Drop per-process files of an exited worker that only hold live values, its counters stay in /metrics.
+    """
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        return
+
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -1,18 +1,41 @@
 from functools import lru_cache
 import punq
 
+from core.api.caching import ResponseCache
 from core.apps.budgets.services.budgets import (
-    BaseCurrencyService, ORMCurrencyService, BaseBudgetService, ORMBudgetService
+    BaseCurrencyService, CatalogCurrencyService, BaseBudgetService, ORMBudgetService,
+    BaseAsyncCurrencyService, AsyncCatalogCurrencyService, BaseAsyncBudgetService, AsyncORMBudgetService
+)
+from core.apps.budgets.services.catalogs import CurrencyCatalog
+from core.apps.budgets.services.consolidation import (
+    BaseConsolidationService, ORMConsolidationService, BaseAsyncConsolidationService, AsyncORMConsolidationService
+)
+from core.apps.budgets.services.dashboard import (
+    BaseDashboardService, ORMDashboardService, BaseAsyncDashboardService, AsyncORMDashboardService
 )
 from core.apps.budgets.services.operations import (
-    BaseCategoryService, ORMCategoryService, BaseOperationService, ORMOperationService
+    BaseCategoryService, ORMCategoryService, BaseOperationService, ORMOperationService,
+    BaseAsyncCategoryService, AsyncORMCategoryService, BaseAsyncOperationService, AsyncORMOperationService
+)
+from core.apps.budgets.services.rates import ExchangeRateCatalog
+from core.apps.budgets.services.reports import (
+    BaseReportService, ORMReportService, BaseAsyncReportService, AsyncORMReportService
+)
+from core.apps.customers.services.auth import BaseAuthService, AuthService, BaseAsyncAuthService, AsyncAuthService
+from core.apps.customers.services.codes import (
+    BaseCodeService, DjangoCacheCodeService, BaseAsyncCodeService, AsyncDjangoCacheCodeService
+)
+from core.apps.customers.services.customers import (
+    BaseCustomerService, ORMCustomerService, BaseAsyncCustomerService, AsyncORMCustomerService
 )
-from core.apps.customers.services.auth import BaseAuthService, AuthService
-from core.apps.customers.services.codes import BaseCodeService, DjangoCacheCodeService
-from core.apps.customers.services.customers import BaseCustomerService, ORMCustomerService
 from core.apps.customers.services.senders import (
     BaseSenderService, DummySenderService, SMSVonageSenderService
 )
+from core.apps.customers.services.tokens import BaseTokenService, JWTTokenService
+from core.apps.customers.services.versions import (
+    BaseDataVersionService, DjangoCacheDataVersionService, BaseAsyncDataVersionService, AsyncDjangoCacheDataVersionService
+)
+from core.apps.jobs.services.jobs import BaseJobService, ORMJobService, BaseAsyncJobService, AsyncORMJobService
 
 
 @lru_cache(maxsize=1)
@@ -23,15 +46,40 @@ def get_ioc_container() -> punq.Container:
 def _initialize_ioc_container() -> punq.Container:
     ioc_container = punq.Container()
 
-    ioc_container.register(BaseCurrencyService, ORMCurrencyService)
+    ioc_container.register(CurrencyCatalog, instance=CurrencyCatalog())
+    ioc_container.register(ExchangeRateCatalog, instance=ExchangeRateCatalog())
+    ioc_container.register(ResponseCache, instance=ResponseCache())
+    ioc_container.register(BaseDataVersionService, DjangoCacheDataVersionService)
+    ioc_container.register(BaseAsyncDataVersionService, AsyncDjangoCacheDataVersionService)
+
+    ioc_container.register(BaseCurrencyService, CatalogCurrencyService)
     ioc_container.register(BaseBudgetService, ORMBudgetService)
 
     ioc_container.register(BaseCategoryService, ORMCategoryService)
     ioc_container.register(BaseOperationService, ORMOperationService)
+    ioc_container.register(BaseReportService, ORMReportService)
+    ioc_container.register(BaseConsolidationService, ORMConsolidationService)
+    ioc_container.register(BaseDashboardService, ORMDashboardService)
 
+    ioc_container.register(BaseTokenService, JWTTokenService)
     ioc_container.register(BaseCustomerService, ORMCustomerService)
     ioc_container.register(BaseCodeService, DjangoCacheCodeService)
     ioc_container.register(BaseSenderService, DummySenderService)
+    ioc_container.register(BaseJobService, ORMJobService)
     ioc_container.register(BaseAuthService, AuthService)
 
+    ioc_container.register(BaseAsyncCurrencyService, AsyncCatalogCurrencyService)
+    ioc_container.register(BaseAsyncBudgetService, AsyncORMBudgetService)
+
+    ioc_container.register(BaseAsyncCategoryService, AsyncORMCategoryService)
+    ioc_container.register(BaseAsyncOperationService, AsyncORMOperationService)
+    ioc_container.register(BaseAsyncReportService, AsyncORMReportService)
+    ioc_container.register(BaseAsyncConsolidationService, AsyncORMConsolidationService)
+    ioc_container.register(BaseAsyncDashboardService, AsyncORMDashboardService)
+
+    ioc_container.register(BaseAsyncCustomerService, AsyncORMCustomerService)
+    ioc_container.register(BaseAsyncCodeService, AsyncDjangoCacheCodeService)
+    ioc_container.register(BaseAsyncJobService, AsyncORMJobService)
+    ioc_container.register(BaseAsyncAuthService, AsyncAuthService)
+
     return ioc_container
@@ -1,3 +1,4 @@
+from datetime import timedelta
 from pathlib import Path
 
 import environ
@@ -27,9 +28,12 @@ INSTALLED_APPS = [
 
     'core.apps.budgets.apps.BudgetsConfig',
     'core.apps.customers.apps.CustomersConfig',
+    'core.apps.jobs.apps.JobsConfig',
 ]
 
 MIDDLEWARE = [
+    # First, so durations and queries cover the whole middleware stack.
+    'core.api.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.locale.LocaleMiddleware',
@@ -62,6 +66,8 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'core.project.wsgi.application'
 
+ASGI_APPLICATION = 'core.project.asgi.application'
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -73,6 +79,31 @@ DATABASES = {
     }
 }
 
+# `pool` keeps a psycopg connection pool per worker process, the mode meant for ASGI;
+# `persistent` reuses one connection per thread for DATABASE_CONN_MAX_AGE_SECONDS; `none` connects per request.
+DATABASE_POOL_MODE = env('DATABASE_POOL_MODE', default='pool')
+
+if DATABASE_POOL_MODE == 'pool':
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': env.int('DATABASE_POOL_MIN_SIZE', default=2),
+            'max_size': env.int('DATABASE_POOL_MAX_SIZE', default=10),
+            'timeout': env.float('DATABASE_POOL_TIMEOUT_SECONDS', default=10.0),
+            'max_idle': env.float('DATABASE_POOL_MAX_IDLE_SECONDS', default=300.0),
+            'max_lifetime': env.float('DATABASE_POOL_MAX_LIFETIME_SECONDS', default=3600.0),
+        },
+    }
+elif DATABASE_POOL_MODE == 'persistent':
+    DATABASES['default']['CONN_MAX_AGE'] = env.int('DATABASE_CONN_MAX_AGE_SECONDS', default=60)
+
+# Checked out connections are verified first, a connection dropped by the server is replaced instead of failing a request.
+DATABASES['default']['CONN_HEALTH_CHECKS'] = env.bool('DATABASE_CONN_HEALTH_CHECKS', default=True)
+
+CACHES = {
+    'default': env.cache_url('CACHE_URL', default='locmemcache://'),
+    'responses': env.cache_url('RESPONSE_CACHE_URL', default='locmemcache://responses?max_entries=10000&timeout=300'),
+}
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -114,3 +145,44 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 CORS_ALLOW_ALL_ORIGINS = True
 
 CORS_ALLOW_CREDENTIALS = True
+
+JWT_SECRET_KEY = env('JWT_SECRET_KEY', default=SECRET_KEY)
+
+JWT_ALGORITHM = 'HS256'
+
+ACCESS_TOKEN_LIFETIME = timedelta(minutes=env.int('ACCESS_TOKEN_LIFETIME_MINUTES', default=15))
+
+REFRESH_TOKEN_LIFETIME = timedelta(days=env.int('REFRESH_TOKEN_LIFETIME_DAYS', default=30))
+
+# Catalogs reload at least this often, whether or not they were invalidated.
+CATALOG_MAX_AGE = env.float('CATALOG_MAX_AGE_SECONDS', default=60 * 60.0)
+CURRENCY_CATALOG_CHECK_INTERVAL = env.float('CURRENCY_CATALOG_CHECK_INTERVAL_SECONDS', default=5.0)
+CURRENCY_CACHE_MAX_AGE = env.int('CURRENCY_CACHE_MAX_AGE_SECONDS', default=24 * 60 * 60)
+RESPONSE_CACHE_MAX_ITEM_BYTES = env.int('RESPONSE_CACHE_MAX_ITEM_BYTES', default=256 * 1024)
+EXCHANGE_RATE_BASE_CURRENCY = env('EXCHANGE_RATE_BASE_CURRENCY', default='USD')
+EXCHANGE_RATE_CHECK_INTERVAL = env.float('EXCHANGE_RATE_CHECK_INTERVAL_SECONDS', default=60.0)
+
+API_THROTTLE_RATES = {
+    'auth_phone': env('THROTTLE_AUTH_PHONE_RATE', default='5/h'),
+    'auth_ip': env('THROTTLE_AUTH_IP_RATE', default='30/m'),
+    'confirm_phone': env('THROTTLE_CONFIRM_PHONE_RATE', default='10/h'),
+    'confirm_ip': env('THROTTLE_CONFIRM_IP_RATE', default='60/m'),
+    'writes': env('THROTTLE_WRITES_RATE', default='120/m'),
+}
+NINJA_NUM_PROXIES = env.int('NINJA_NUM_PROXIES', default=None)
+
+# Bearer token required by /metrics, the endpoint is open when empty.
+METRICS_TOKEN = env('METRICS_TOKEN', default='')
+
+JOB_HANDLERS = {
+    'customers.send_code': 'core.apps.customers.jobs.send_code',
+}
+JOB_BATCH_SIZE = env.int('JOB_BATCH_SIZE', default=10)
+JOB_POLL_INTERVAL = env.float('JOB_POLL_INTERVAL_SECONDS', default=1.0)
+JOB_MAX_ATTEMPTS = env.int('JOB_MAX_ATTEMPTS', default=5)
+JOB_RETRY_BACKOFF = env.float('JOB_RETRY_BACKOFF_SECONDS', default=5.0)
+JOB_RETRY_BACKOFF_MAX = env.float('JOB_RETRY_BACKOFF_MAX_SECONDS', default=600.0)
+
+API_RENDERER = env('API_RENDERER', default='core.api.renderers.ORJSONRenderer')
+API_JSON_DECIMAL_MODE = env('API_JSON_DECIMAL_MODE', default='string')
+API_JSON_DATETIME_PRECISION = env('API_JSON_DATETIME_PRECISION', default='milliseconds')
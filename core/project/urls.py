@@ -3,9 +3,12 @@ from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
 
+from core.api.metrics import metrics_view
+
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('api/', include('core.api.urls'))
+    path('api/', include('core.api.urls')),
+    path('metrics', metrics_view, name='metrics'),
 ]
 
 # if settings.DEBUG:
@@ -13,14 +13,21 @@ wait_for_port() {
     sleep 1
     local current_time=$(date +%s)
     local elapsed_time=$((current_time - start_time))
-    echo "trying to connect to pg via $host:$port"
+    echo "trying to connect to $host:$port"
 
     if [ $elapsed_time -ge $timeout ]; then
-      echo 'Unable to connect to pg'
+      echo "Unable to connect to $host:$port"
       exit 1
     fi
   done
 }
 
 wait_for_port "postgres" 5432
-python manage.py runserver 0.0.0.0:8000
\ No newline at end of file
+wait_for_port "redis" 6379
+
+# Workers write metrics to files here, /metrics of any worker aggregates them; start each run from an empty directory.
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus}"
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
+exec gunicorn --config core/project/gunicorn.conf.py
\ No newline at end of file
@@ -0,0 +1,40 @@
+import pytest
+from django.core.cache import caches
+from django.test import Client
+
+from core.apps.budgets.services.catalogs import CurrencyCatalog
+from core.apps.budgets.services.rates import ExchangeRateCatalog
+from core.apps.customers.models import Customer
+from core.apps.customers.services.tokens import JWTTokenService
+from core.project.ioc_containers import get_ioc_container
+from tests.factories.customers import CustomerModelFactory
+
+
+@pytest.fixture(autouse=True)
+def reset_currency_catalog() -> None:
+    """
+    Currencies and rates are created per test, drop the catalogs loaded by a previous one.
+    """
+    get_ioc_container().resolve(CurrencyCatalog).reset()
+    get_ioc_container().resolve(ExchangeRateCatalog).reset()
+
+
+@pytest.fixture(autouse=True)
+def clear_caches() -> None:
+    """
+    Database ids repeat between tests, drop data versions and responses cached by a previous one.
+    """
+    for cache in caches.all():
+        cache.clear()
+
+
+@pytest.fixture()
+def customer() -> Customer:
+    return CustomerModelFactory.create()
+
+
+@pytest.fixture()
+def auth_client(customer: Customer) -> Client:
+    tokens = JWTTokenService().issue_tokens(customer=customer.to_entity(), token_version=customer.token_version)
+
+    return Client(HTTP_AUTHORIZATION=f'Bearer {tokens.access_token}')
@@ -0,0 +1,134 @@
+import json
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from core.api.parsers import MAX_ITEM_SIZE
+from core.apps.budgets.models import Budget, Operation
+from core.apps.customers.models import Customer
+from tests.factories.budgets import BudgetModelFactory, CurrencyModelFactory
+from tests.factories.operations import CategoryModelFactory
+
+URL = '/api/v1/management/operations/bulk'
+
+
+def build_operation(budget_id: int, operation_type: str = 'ADD', amount: str = '10.00', **fields) -> dict:
+    return {
+        'title': 'Bulk', 'operation_type': operation_type, 'amount': amount, 'related_budget_id': budget_id, **fields
+    }
+
+
+@pytest.mark.django_db
+def test_bulk_create_updates_budgets_once_per_request(
+        auth_client: Client,
+        customer: Customer,
+        django_capture_on_commit_callbacks
+):
+    """
+    Test operations sent as a JSON array are created, and the balance and counters of each budget are updated
+    with one query, whatever the number of its operations.
+    :param auth_client:
+    :param customer:
+    :param django_capture_on_commit_callbacks:
+    :return:
+    """
+    first_budget, second_budget = BudgetModelFactory.create_batch(
+        2, related_customer=customer, related_currency=CurrencyModelFactory.create(), initial_amount=Decimal('100.00')
+    )
+    category = CategoryModelFactory.create(related_customer=customer)
+    payload = [
+        build_operation(first_budget.id, 'ADD', '10.00', related_category_id=category.id),
+        build_operation(first_budget.id, 'SUB', '3.50'),
+        build_operation(first_budget.id, 'ADD', '5.00'),
+        build_operation(second_budget.id, 'SUB', '20.00'),
+    ]
+
+    with django_capture_on_commit_callbacks(execute=True), CaptureQueriesContext(connection) as queries:
+        response = auth_client.post(URL, payload, content_type='application/json')
+    assert response.status_code == 200, f'{response.content=}'
+    assert response.json()['data']['created'] == 4, f'{response.content=}'
+
+    budget_updates = [query['sql'] for query in queries if query['sql'].startswith('UPDATE "budgets_budget"')]
+    assert len(budget_updates) == 2, f'{budget_updates=}'
+
+    first_budget.refresh_from_db()
+    second_budget.refresh_from_db()
+    assert (first_budget.current_balance, first_budget.add_operations_count, first_budget.sub_operations_count) == (
+        Decimal('111.50'), 2, 1
+    ), f'{first_budget.__dict__=}'
+    assert (second_budget.current_balance, second_budget.add_operations_count, second_budget.sub_operations_count) == (
+        Decimal('80.00'), 0, 1
+    ), f'{second_budget.__dict__=}'
+    assert Operation.objects.filter(related_category=category).count() == 1
+
+
+@pytest.mark.django_db
+def test_bulk_create_accepts_ndjson(auth_client: Client, customer: Customer):
+    """
+    Test operations sent as an NDJSON stream are created, blank lines skipped.
+    :param auth_client:
+    :param customer:
+    :return:
+    """
+    budget = BudgetModelFactory.create(related_customer=customer)
+    body = '\n'.join(json.dumps(build_operation(budget.id)) for _ in range(3)) + '\n\n'
+
+    response = auth_client.post(URL, body, content_type='application/x-ndjson')
+
+    assert response.status_code == 200, f'{response.content=}'
+    assert response.json()['data']['created'] == 3, f'{response.content=}'
+    assert Operation.objects.filter(related_budget=budget).count() == 3
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('foreign', ['budget', 'category'])
+def test_bulk_create_rejects_relations_of_other_customers(auth_client: Client, customer: Customer, foreign: str):
+    """
+    Test a batch referencing a budget or category of another customer is rejected with 400 and writes nothing.
+    :param auth_client:
+    :param customer:
+    :param foreign:
+    :return:
+    """
+    budget = BudgetModelFactory.create(related_customer=customer, initial_amount=Decimal('100.00'))
+    other_budget = BudgetModelFactory.create(related_currency=budget.related_currency)
+    other_category = CategoryModelFactory.create(related_customer=other_budget.related_customer)
+    foreign_operation = (
+        build_operation(other_budget.id) if foreign == 'budget'
+        else build_operation(budget.id, related_category_id=other_category.id)
+    )
+
+    response = auth_client.post(URL, [build_operation(budget.id), foreign_operation], content_type='application/json')
+
+    assert response.status_code == 400, f'{response.content=}'
+    assert not Operation.objects.exists()
+    assert Budget.objects.get(id=budget.id).current_balance == Decimal('100.00')
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('content_type, body', [
+    ('application/json', '[{"title": "' + 'x' * (MAX_ITEM_SIZE * 3)),
+    ('application/x-ndjson', '{"title": "' + 'x' * (MAX_ITEM_SIZE * 3) + '"}\n'),
+])
+def test_bulk_create_rejects_items_over_size_limit(
+        auth_client: Client,
+        customer: Customer,
+        content_type: str,
+        body: str
+):
+    """
+    Test an item larger than the item size limit is rejected with 400 and writes nothing.
+    :param auth_client:
+    :param customer:
+    :param content_type:
+    :param body:
+    :return:
+    """
+    response = auth_client.post(URL, body, content_type=content_type)
+
+    assert response.status_code == 400, f'{response.content=}'
+    assert str(MAX_ITEM_SIZE) in response.json()['detail'], f'{response.content=}'
+    assert not Operation.objects.exists()
@@ -0,0 +1,186 @@
+import pytest
+from django.conf import settings
+from django.test import Client, override_settings
+from prometheus_client import REGISTRY
+
+from core.api.caching import ResponseCache
+from core.apps.budgets.services.rates import ExchangeRateCatalog
+from core.apps.customers.models import Customer
+from core.project.ioc_containers import get_ioc_container
+from tests.factories.budgets import BudgetModelFactory, CurrencyModelFactory
+
+
+@pytest.mark.django_db
+def test_read_endpoints_revalidate_on_customer_writes(
+        auth_client: Client,
+        customer: Customer,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks
+):
+    """
+    Test a matching If-None-Match is answered with 304 without queries until the customer writes.
+    :param auth_client:
+    :param customer:
+    :param django_assert_num_queries:
+    :param django_capture_on_commit_callbacks:
+    :return:
+    """
+    BudgetModelFactory.create(related_customer=customer)
+    url = '/api/v1/management/budgets'
+
+    response = auth_client.get(url)
+    etag = response['ETag']
+    assert response.status_code == 200, f'{response.content=}'
+    assert 'no-cache' in response['Cache-Control'], f'{response.headers=}'
+
+    with django_assert_num_queries(0):
+        response = auth_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304, f'{response.status_code=}'
+    assert response['ETag'] == etag, f'{response.headers=}'
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = auth_client.post('/api/v1/management/categories', {'name': 'Food'}, content_type='application/json')
+    assert response.status_code == 200, f'{response.content=}'
+
+    response = auth_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200, f'{response.status_code=}'
+    assert response['ETag'] != etag, f'{response.headers=}'
+
+
+@pytest.mark.django_db
+def test_currencies_are_publicly_cacheable(auth_client: Client):
+    """
+    Test currency responses carry long-lived public cache headers and revalidate to 304.
+    :param auth_client:
+    :return:
+    """
+    currency = CurrencyModelFactory.create()
+    url = f'/api/v1/management/currencies/{currency.short_name}'
+
+    response = auth_client.get(url)
+    assert response.status_code == 200, f'{response.content=}'
+    assert 'public' in response['Cache-Control'] and 'max-age=' in response['Cache-Control'], f'{response.headers=}'
+
+    response = auth_client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == 304, f'{response.status_code=}'
+
+
+def get_response_cache_lookups(outcome: str, alias: str = ResponseCache.CACHE_ALIAS) -> float:
+    """
+    Lookups of the response cache `alias` with the outcome so far.
+    :param outcome:
+    :param alias:
+    :return:
+    """
+    return REGISTRY.get_sample_value('response_cache_lookups_total', {'cache': alias, 'outcome': outcome}) or 0
+
+
+@pytest.mark.django_db
+def test_repeated_reads_are_served_from_response_cache(
+        auth_client: Client,
+        customer: Customer,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks
+):
+    """
+    Test a repeated read is served from the response cache without queries until the customer writes.
+    :param auth_client:
+    :param customer:
+    :param django_assert_num_queries:
+    :param django_capture_on_commit_callbacks:
+    :return:
+    """
+    budget = BudgetModelFactory.create(related_customer=customer)
+    url = f'/api/v1/management/budgets/{budget.id}'
+    hits, misses = get_response_cache_lookups('hit'), get_response_cache_lookups('miss')
+
+    content = auth_client.get(url).content
+    with django_assert_num_queries(0):
+        response = auth_client.get(url)
+    assert response.content == content, f'{response.content=}'
+    assert get_response_cache_lookups('hit') - hits == 1
+    assert get_response_cache_lookups('miss') - misses == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        auth_client.put(url, {'title': 'Renamed'}, content_type='application/json')
+
+    response = auth_client.get(url)
+    assert response.json()['data']['item']['title'] == 'Renamed', f'{response.content=}'
+    assert get_response_cache_lookups('miss') - misses == 2
+
+def use_worker_response_cache(alias: str) -> ResponseCache:
+    """
+    Serve the following requests as a worker whose response cache is the cache `alias`.
+    :param alias:
+    :return:
+    """
+    response_cache = ResponseCache(cache_alias=alias)
+    # The container keeps instances it has resolved, start from a new one.
+    get_ioc_container.cache_clear()
+    get_ioc_container().register(ResponseCache, instance=response_cache)
+
+    return response_cache
+
+
+@pytest.mark.django_db
+def test_response_cache_local_to_worker_is_not_stale_after_write_through_another(
+        auth_client: Client,
+        customer: Customer,
+        django_capture_on_commit_callbacks
+):
+    """
+    Test a worker with its own response cache does not serve an entry cached before a write made through another
+    worker, since both read data versions from the shared default cache.
+    :param auth_client:
+    :param customer:
+    :param django_capture_on_commit_callbacks:
+    :return:
+    """
+    budget = BudgetModelFactory.create(related_customer=customer)
+    url = f'/api/v1/management/budgets/{budget.id}'
+    worker_caches = {
+        alias: {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': alias}
+        for alias in ('first-worker', 'second-worker')
+    }
+
+    with override_settings(CACHES={**settings.CACHES, **worker_caches}):
+        try:
+            hits = get_response_cache_lookups('hit', 'first-worker')
+            use_worker_response_cache('first-worker')
+            title = auth_client.get(url).json()['data']['item']['title']
+            auth_client.get(url)
+            assert get_response_cache_lookups('hit', 'first-worker') == hits + 1
+
+            use_worker_response_cache('second-worker')
+            with django_capture_on_commit_callbacks(execute=True):
+                auth_client.put(url, {'title': f'{title} renamed'}, content_type='application/json')
+
+            use_worker_response_cache('first-worker')
+            response = auth_client.get(url)
+        finally:
+            get_ioc_container.cache_clear()
+
+    assert response.json()['data']['item']['title'] == f'{title} renamed', f'{response.content=}'
+
+
+@pytest.mark.django_db
+def test_consolidated_totals_revalidate_on_exchange_rate_changes(auth_client: Client, customer: Customer):
+    """
+    Test consolidated totals get a new ETag once the exchange rates are reloaded, even without a customer write.
+    :param auth_client:
+    :param customer:
+    :return:
+    """
+    CurrencyModelFactory.create(short_name='USD')
+    url = '/api/v1/management/reports/consolidated?currency=USD'
+
+    response = auth_client.get(url)
+    etag = response['ETag']
+    assert response.status_code == 200, f'{response.content=}'
+    assert auth_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    get_ioc_container().resolve(ExchangeRateCatalog).invalidate()
+
+    response = auth_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200, f'{response.status_code=}'
+    assert response['ETag'] != etag, f'{response.headers=}'
@@ -0,0 +1,108 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from django.test import Client
+from django.utils.dateparse import parse_datetime
+
+from core.apps.budgets.models import Operation
+from core.apps.budgets.services.dashboard import ORMDashboardQueryMixin
+from core.apps.customers.models import Customer
+from tests.factories.budgets import BudgetModelFactory, CurrencyModelFactory
+from tests.factories.operations import CategoryModelFactory, OperationModelFactory
+
+URL = '/api/v1/dashboard'
+
+
+def to_milliseconds(value: datetime) -> datetime:
+    # The JSON renderer writes datetimes to the millisecond.
+    return value.replace(microsecond=value.microsecond // 1000 * 1000)
+
+
+@pytest.mark.django_db
+def test_dashboard_content(auth_client: Client, customer: Customer, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test the dashboard shows the balances and last activity of every budget, categories ranked by operations
+    and the latest operations of the customer only, each list cut at its limit.
+    :param auth_client:
+    :param customer:
+    :param monkeypatch:
+    :return:
+    """
+    monkeypatch.setattr(ORMDashboardQueryMixin, 'TOP_CATEGORIES_LIMIT', 2)
+    monkeypatch.setattr(ORMDashboardQueryMixin, 'RECENT_OPERATIONS_LIMIT', 3)
+
+    currency = CurrencyModelFactory.create()
+    first_budget, second_budget, idle_budget = [
+        BudgetModelFactory.create(related_customer=customer, related_currency=currency, initial_amount=Decimal(amount))
+        for amount in ('100.00', '50.00', '10.00')
+    ]
+    food, rent, fun = CategoryModelFactory.create_batch(3, related_customer=customer)
+    OperationModelFactory.create(related_budget__related_currency=currency)
+
+    # The bulk endpoint maintains the balances, counters and daily summaries the dashboard reads.
+    payload = [
+        {'budget': first_budget, 'operation_type': 'ADD', 'amount': '10.00', 'category': food},
+        {'budget': second_budget, 'operation_type': 'SUB', 'amount': '20.00', 'category': fun},
+        {'budget': first_budget, 'operation_type': 'SUB', 'amount': '2.50', 'category': food},
+        {'budget': second_budget, 'operation_type': 'ADD', 'amount': '1.00', 'category': food},
+        {'budget': first_budget, 'operation_type': 'ADD', 'amount': '5.00', 'category': rent},
+        {'budget': second_budget, 'operation_type': 'SUB', 'amount': '4.00', 'category': rent},
+    ]
+    response = auth_client.post('/api/v1/management/operations/bulk', [
+        {
+            'title': 'Dashboard',
+            'operation_type': item['operation_type'],
+            'amount': item['amount'],
+            'related_budget_id': item['budget'].id,
+            'related_category_id': item['category'].id,
+        }
+        for item in payload
+    ], content_type='application/json')
+    assert response.status_code == 200, f'{response.content=}'
+
+    response = auth_client.get(URL)
+    assert response.status_code == 200, f'{response.content=}'
+    dashboard = response.json()['data']['item']
+
+    budgets = {budget['id']: budget for budget in dashboard['budgets']}
+    assert list(budgets) == [first_budget.id, second_budget.id, idle_budget.id], f'{budgets=}'
+    assert (budgets[first_budget.id]['current_balance'], budgets[first_budget.id]['operations_count']) == (
+        '112.50', 3
+    ), f'{budgets[first_budget.id]=}'
+    assert (budgets[second_budget.id]['current_balance'], budgets[second_budget.id]['operations_count']) == (
+        '27.00', 3
+    ), f'{budgets[second_budget.id]=}'
+    assert (budgets[idle_budget.id]['current_balance'], budgets[idle_budget.id]['operations_count']) == (
+        '10.00', 0
+    ), f'{budgets[idle_budget.id]=}'
+
+    for budget in (first_budget, second_budget):
+        last_operation = Operation.objects.filter(related_budget=budget).latest('created_at', 'id')
+        assert parse_datetime(budgets[budget.id]['last_activity_at']) == to_milliseconds(last_operation.created_at)
+    idle_budget.refresh_from_db()
+    assert parse_datetime(budgets[idle_budget.id]['last_activity_at']) == to_milliseconds(idle_budget.updated_at)
+
+    assert [(category['id'], category['operations_count']) for category in dashboard['top_categories']] == [
+        (food.id, 3), (rent.id, 2)
+    ], f'{dashboard["top_categories"]=}'
+
+    latest_operations = list(
+        Operation.objects.filter(related_budget__related_customer=customer).order_by('-created_at', '-id')[:3]
+    )
+    recent_operations = dashboard['recent_operations']
+    assert [operation['id'] for operation in recent_operations] == [
+        operation.id for operation in latest_operations
+    ], f'{recent_operations=}'
+    assert recent_operations[0] | {'created_at': None} == {
+        'id': latest_operations[0].id,
+        'created_at': None,
+        'title': 'Dashboard',
+        'operation_type': 'SUB',
+        'amount': '4.00',
+        'budget_id': second_budget.id,
+        'budget_title': second_budget.title,
+        'currency': currency.short_name,
+        'category_id': rent.id,
+        'category_name': rent.name,
+    }, f'{recent_operations[0]=}'
@@ -0,0 +1,145 @@
+import csv
+import io
+import json
+import warnings
+from decimal import Decimal
+
+import pytest
+from django.test import Client
+
+from core.api.v1.budget_management import handlers
+from core.api.v1.budget_management.exporters import EXPORT_COLUMNS, BaseOperationExporter
+from core.apps.customers.models import Customer
+from tests.factories.budgets import BudgetModelFactory
+from tests.factories.operations import OperationModelFactory
+
+URL = '/api/v1/management/operations/export'
+
+
+def get_chunks(client: Client, **params) -> list[bytes]:
+    """
+    Request an export and return its body as streamed, chunk by chunk.
+    :param client:
+    :param params:
+    :return:
+    """
+    response = client.get(URL, params)
+    assert response.status_code == 200, f'{response.content=}'
+
+    # The test client consumes the async stream synchronously, which Django warns about.
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return list(response)
+
+
+@pytest.fixture()
+def operations(customer: Customer) -> list:
+    budget = BudgetModelFactory.create(related_customer=customer)
+
+    return [
+        OperationModelFactory.create(related_budget=budget, amount=Decimal(f'{index}.50'))
+        for index in range(1, 6)
+    ]
+
+
+@pytest.mark.django_db
+def test_csv_export_has_header_and_rows_in_several_chunks(
+        auth_client: Client,
+        operations: list,
+        monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Test a CSV export starts with the header, holds every operation in creation order and is streamed in chunks.
+    :param auth_client:
+    :param operations:
+    :param monkeypatch:
+    :return:
+    """
+    monkeypatch.setattr(BaseOperationExporter, 'rows_per_chunk', 2)
+
+    chunks = get_chunks(auth_client, format='csv')
+    rows = list(csv.DictReader(io.StringIO(b''.join(chunks).decode())))
+
+    assert len(chunks) > 2, f'{chunks=}'
+    assert b''.join(chunks).decode().splitlines()[0] == ','.join(EXPORT_COLUMNS)
+    assert [int(row['id']) for row in rows] == [operation.id for operation in operations], f'{rows=}'
+    assert [row['amount'] for row in rows] == ['1.50', '2.50', '3.50', '4.50', '5.50'], f'{rows=}'
+    assert rows[0]['category_name'] == operations[0].related_category.name, f'{rows[0]=}'
+
+
+@pytest.mark.django_db
+def test_ndjson_export_has_one_operation_per_line(
+        auth_client: Client,
+        operations: list,
+        monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Test an NDJSON export holds one JSON object per operation, with the same values across chunks.
+    :param auth_client:
+    :param operations:
+    :param monkeypatch:
+    :return:
+    """
+    monkeypatch.setattr(BaseOperationExporter, 'rows_per_chunk', 2)
+
+    chunks = get_chunks(auth_client, format='ndjson')
+    lines = [json.loads(line) for line in b''.join(chunks).decode().splitlines()]
+
+    assert len(chunks) == 3, f'{chunks=}'
+    assert [line['id'] for line in lines] == [operation.id for operation in operations], f'{lines=}'
+    assert set(lines[0]) == set(EXPORT_COLUMNS), f'{lines[0]=}'
+    assert lines[-1]['amount'] == '5.50', f'{lines[-1]=}'
+
+
+@pytest.mark.django_db
+def test_parquet_export_round_trips(auth_client: Client, operations: list, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test a Parquet export written in several row groups reads back with every operation and exact amounts.
+    :param auth_client:
+    :param operations:
+    :param monkeypatch:
+    :return:
+    """
+    parquet = pytest.importorskip('pyarrow.parquet')
+    monkeypatch.setattr(handlers.OPERATION_EXPORTERS['parquet'], 'rows_per_chunk', 2)
+
+    chunks = get_chunks(auth_client, format='parquet')
+    table = parquet.read_table(io.BytesIO(b''.join(chunks)))
+
+    assert len(chunks) == 3, f'{len(chunks)=}'
+    assert table.num_rows == len(operations), f'{table.num_rows=}'
+    assert table.column('id').to_pylist() == [operation.id for operation in operations]
+    assert table.column('amount').to_pylist() == [operation.amount for operation in operations]
+
+
+@pytest.mark.django_db
+def test_parquet_export_without_pyarrow_is_not_implemented(auth_client: Client, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test Parquet exports answer 501 on servers without pyarrow.
+    :param auth_client:
+    :param monkeypatch:
+    :return:
+    """
+    monkeypatch.setattr(handlers, 'is_parquet_available', lambda: False)
+
+    assert auth_client.get(URL, {'format': 'parquet'}).status_code == 501
+
+
+@pytest.mark.django_db
+def test_export_of_budget_of_another_customer_is_not_found(auth_client: Client, customer: Customer):
+    """
+    Test exporting the operations of a budget the customer does not own answers 404.
+    :param auth_client:
+    :param customer:
+    :return:
+    """
+    own_operation = OperationModelFactory.create(related_budget=BudgetModelFactory.create(related_customer=customer))
+    other_operation = OperationModelFactory.create(
+        related_budget__related_currency=own_operation.related_budget.related_currency
+    )
+
+    response = auth_client.get(URL, {'budget_id': other_operation.related_budget_id})
+    assert response.status_code == 404, f'{response.status_code=}'
+
+    rows = list(csv.DictReader(io.StringIO(b''.join(get_chunks(auth_client)).decode())))
+    assert [int(row['id']) for row in rows] == [own_operation.id], f'{rows=}'
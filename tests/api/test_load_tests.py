@@ -0,0 +1,34 @@
+import json
+import random
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.test import Client
+
+from core.apps.budgets.loadtests.scenarios import SCENARIOS, load_fixtures
+
+
+@pytest.mark.django_db
+def test_load_scenarios_send_valid_requests(client: Client):
+    """
+    Test every load test scenario builds requests the API accepts on a seeded dataset.
+    :param client:
+    :return:
+    """
+    call_command('seed_load_data', customers=4, budgets=8, categories=8, operations=200, stdout=StringIO())
+    fixtures = load_fixtures(customers=4)
+    assert fixtures.customers, f'{fixtures=}'
+
+    # Confirming needs a code sent by a running server.
+    for scenario in [scenario for scenario in SCENARIOS if scenario.name != 'confirm']:
+        rng = random.Random(scenario.name)
+        if scenario.prepare is not None:
+            scenario.prepare(fixtures, rng, 1, None)
+
+        request = scenario.build(fixtures, rng, 0)
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {request.token}'} if request.token else {}
+        data = json.dumps(request.body) if request.body is not None else ''
+
+        response = client.generic(request.method, request.path, data=data, content_type='application/json', **headers)
+        assert response.status_code == 200, f'{scenario.name=} {response.status_code=}'
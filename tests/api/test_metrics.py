@@ -0,0 +1,55 @@
+import pytest
+from django.test import Client, override_settings
+from prometheus_client import REGISTRY
+
+from core.api import metrics
+from core.apps.common.databases import ConnectionPoolStats
+
+OPERATION = 'core_api_v1_budget_management_handlers_get_budget_list_handler'
+LABELS = {'operation': OPERATION, 'method': 'GET', 'status': '2xx'}
+
+
+@pytest.mark.django_db
+def test_request_metrics_are_labelled_by_operation(auth_client: Client):
+    """
+    Test a request is counted under its django-ninja operation with its SQL queries and response size.
+    :param auth_client:
+    :return:
+    """
+    requests = REGISTRY.get_sample_value('http_request_duration_seconds_count', LABELS) or 0
+    queries = REGISTRY.get_sample_value('http_request_db_queries_sum', LABELS) or 0
+
+    response = auth_client.get('/api/v1/management/budgets')
+    assert response.status_code == 200, f'{response.content=}'
+
+    assert REGISTRY.get_sample_value('http_request_duration_seconds_count', LABELS) == requests + 1
+    assert REGISTRY.get_sample_value('http_request_db_queries_sum', LABELS) > queries
+    assert REGISTRY.get_sample_value('http_response_size_bytes_sum', LABELS) >= len(response.content)
+
+    response = auth_client.get('/metrics')
+    assert response.status_code == 200, f'{response.status_code=}'
+    assert f'operation="{OPERATION}"' in response.content.decode(), f'{response.content=}'
+
+    with override_settings(METRICS_TOKEN='secret'):
+        assert Client().get('/metrics').status_code == 401
+        assert Client(HTTP_AUTHORIZATION='Bearer secret').get('/metrics').status_code == 200
+
+
+@pytest.mark.django_db
+def test_connection_pool_stats_are_exported(monkeypatch: pytest.MonkeyPatch):
+    """
+    Test the connection pool stats of the worker serving a scrape are exported as gauges.
+    :param monkeypatch:
+    :return:
+    """
+    stats = ConnectionPoolStats(
+        alias='default', min_size=2, max_size=10, size=4, idle=1, waiting=2, requests=50, wait_ms=1500, errors=1,
+        connections=4, connect_ms=40,
+    )
+    monkeypatch.setattr(metrics, 'get_connection_pool_stats', lambda: [stats])
+
+    content = Client().get('/metrics').content.decode()
+
+    assert 'db_pool_connections{alias="default",state="in_use"} 3.0' in content, f'{content=}'
+    assert 'db_pool_waiting_requests{alias="default"} 2.0' in content, f'{content=}'
+    assert 'db_pool_wait_seconds{alias="default"} 1.5' in content, f'{content=}'
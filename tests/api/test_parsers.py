@@ -0,0 +1,72 @@
+import io
+import json
+
+import pytest
+
+from core.api.parsers import PayloadError, iter_json_array, iter_ndjson
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 64, 64 * 1024])
+def test_iter_json_array_across_chunk_boundaries(chunk_size: int):
+    """
+    Test JSON array items are decoded the same regardless of how the stream is chunked.
+    :param chunk_size:
+    :return:
+    """
+
+    items = [{'title': f'Operation, ]{index}', 'amount': '1234.50', 'id': index} for index in range(50)] + [12345, 'ж']
+    stream = io.BytesIO(json.dumps(items, ensure_ascii=False).encode())
+
+    assert list(iter_json_array(stream, chunk_size=chunk_size)) == items
+
+
+@pytest.mark.parametrize('payload', [b'{}', b'[1,', b'[1 2]', b'[1] []', b''])
+def test_iter_json_array_rejects_malformed(payload: bytes):
+    """
+    Test malformed payloads raise PayloadError instead of yielding partial data silently.
+    :param payload:
+    :return:
+    """
+
+    with pytest.raises(PayloadError):
+        list(iter_json_array(io.BytesIO(payload), chunk_size=2))
+
+
+class CountingStream(io.BytesIO):
+    def __init__(self, payload: bytes):
+        super().__init__(payload)
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def test_iter_json_array_stops_at_malformed_item():
+    """
+    Test an item that does not decode is rejected after max_item_size, without reading the rest of the payload.
+    :return:
+    """
+
+    stream = CountingStream(b'[{"amount": "1.00"}, {"amount": "1.00"' + b' ' * 1024 * 1024 + b'}]')
+    items = iter_json_array(stream, chunk_size=1024, max_item_size=4096)
+
+    assert next(items) == {'amount': '1.00'}
+    with pytest.raises(PayloadError):
+        next(items)
+    assert stream.bytes_read < 8 * 1024, f'{stream.bytes_read=}'
+
+    with pytest.raises(PayloadError):
+        list(iter_ndjson(io.BytesIO(b'{"title": "' + b'x' * 8192 + b'"}\n'), max_item_size=4096))
+
+
+def test_iter_ndjson_skips_blank_lines():
+    """
+    Test NDJSON stream yields one value per non-empty line.
+    :return:
+    """
+
+    stream = io.BytesIO(b'{"amount": "1.00"}\n\n{"amount": "2.00"}\n')
+
+    assert list(iter_ndjson(stream)) == [{'amount': '1.00'}, {'amount': '2.00'}]
@@ -0,0 +1,74 @@
+import pytest
+from django.test import Client
+
+from core.apps.customers.models import Customer
+from tests.factories.budgets import BudgetModelFactory, CurrencyModelFactory
+from tests.factories.operations import CategoryModelFactory, OperationModelFactory
+
+ROWS_PER_RELATION = 5
+
+# Access tokens are verified in memory, so the whole budget belongs to the handler.
+# List totals come from a window count on the page query or from maintained counters.
+# Currencies are loaded into the process-local catalog by the first request of each test.
+ENDPOINT_QUERY_BUDGETS = [
+    ('/api/v1/management/currencies', 1),
+    ('/api/v1/management/currencies/{currency_short_name}', 1),
+    ('/api/v1/management/budgets', 1),
+    ('/api/v1/management/budgets/{budget_id}', 1),
+    ('/api/v1/management/budgets/{budget_id}/operations', 2),
+    ('/api/v1/management/budgets/{budget_id}/operations?search=add', 2),
+    ('/api/v1/management/categories', 1),
+    ('/api/v1/management/categories/{category_id}', 1),
+    ('/api/v1/management/operations', 2),
+    ('/api/v1/management/operations?search=add', 1),
+    ('/api/v1/management/operations?has_more=true', 1),
+    ('/api/v1/management/operations/{operation_id}', 1),
+    ('/api/v1/customers/profile', 1),
+    ('/api/v1/dashboard', 3),
+]
+
+
+@pytest.fixture()
+def seeded_ids(customer: Customer) -> dict:
+    currency = CurrencyModelFactory.create()
+    budgets = BudgetModelFactory.create_batch(
+        size=ROWS_PER_RELATION, related_customer=customer, related_currency=currency
+    )
+    categories = CategoryModelFactory.create_batch(size=ROWS_PER_RELATION, related_customer=customer)
+    operations = [
+        OperationModelFactory.create(related_budget=budget, related_category=category)
+        for budget in budgets
+        for category in categories
+    ]
+
+    return {
+        'currency_short_name': currency.short_name,
+        'budget_id': budgets[0].id,
+        'category_id': categories[0].id,
+        'operation_id': operations[0].id,
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('url, query_budget', ENDPOINT_QUERY_BUDGETS)
+def test_read_endpoint_query_budget(
+        auth_client: Client,
+        seeded_ids: dict,
+        django_assert_num_queries,
+        url: str,
+        query_budget: int
+):
+    """
+    Test read endpoints load their whole relation graph with a fixed number of queries, regardless of rows returned.
+    :param auth_client:
+    :param seeded_ids:
+    :param django_assert_num_queries:
+    :param url:
+    :param query_budget:
+    :return:
+    """
+
+    with django_assert_num_queries(query_budget):
+        response = auth_client.get(url.format(**seeded_ids))
+
+    assert response.status_code == 200, f'{response.content=}'
@@ -0,0 +1,20 @@
+import json
+
+from ninja.renderers import JSONRenderer
+
+from core.api.renderers import ORJSONRenderer
+from core.apps.budgets.management.commands.benchmark_renderers import build_operation_page
+
+
+def test_orjson_renderer_matches_default_renderer():
+    """
+    Test the orjson renderer writes the same values as the default renderer, decimals and datetimes included.
+    :return:
+    """
+    page = build_operation_page(items=10)
+
+    content = ORJSONRenderer(decimal_mode='string', datetime_precision='milliseconds').render(
+        None, page, response_status=200
+    )
+
+    assert json.loads(content) == json.loads(JSONRenderer().render(None, page, response_status=200))
@@ -0,0 +1,94 @@
+from decimal import Decimal
+
+import pytest
+from django.test import Client
+
+from core.api.filters import PaginationIn, PaginationOut, get_next_cursor
+from core.api.schemas import ApiResponse, ListPaginatedResponse
+from core.api.urls import api
+from core.api.v1.budget_management.filters import BudgetFilters, CategoryFilters, OperationFilters
+from core.api.v1.budget_management.schemas.budgets import BudgetSchema, BudgetOperationSchema
+from core.api.v1.budget_management.schemas.operations import CategorySchema, OperationSchema
+from core.apps.budgets.services.budgets import ORMBudgetService
+from core.apps.budgets.services.catalogs import CurrencyCatalog
+from core.apps.budgets.services.operations import ORMCategoryService, ORMOperationService
+from core.apps.customers.models import Customer
+from core.apps.customers.services.versions import DjangoCacheDataVersionService
+from tests.factories.budgets import BudgetModelFactory
+from tests.factories.operations import CategoryModelFactory, OperationModelFactory
+
+
+def _render_legacy(schema: type, items: list, page, pagination: PaginationIn, cursor: bool = False) -> bytes:
+    pagination_out = PaginationOut(
+        offset=pagination.offset,
+        limit=pagination.limit,
+        total=page.total,
+        has_more=page.has_more,
+        next_cursor=get_next_cursor(page.items, pagination.limit, page.has_more) if cursor else None
+    )
+    response = ApiResponse[ListPaginatedResponse[schema]](
+        data=ListPaginatedResponse(items=items, pagination=pagination_out)
+    )
+
+    content = api.renderer.render(None, response.model_dump(), response_status=200)
+    return content if isinstance(content, bytes) else content.encode()
+
+
+@pytest.mark.django_db
+def test_list_rows_render_like_schemas(auth_client: Client, customer: Customer):
+    """
+    Test list endpoints built from values() rows render byte for byte the JSON of the entity and schema path.
+    :param auth_client:
+    :param customer:
+    :return:
+    """
+    budget = BudgetModelFactory.create(related_customer=customer, initial_amount=Decimal('12.50'))
+    category = CategoryModelFactory.create(related_customer=customer)
+    OperationModelFactory.create(related_budget=budget, related_category=category, amount=Decimal('3.10'))
+    OperationModelFactory.create(related_budget=budget, related_category=None, title='')
+
+    customer_entity = customer.to_entity()
+    pagination = PaginationIn(limit=1)
+    data_version_service = DjangoCacheDataVersionService()
+    budget_service = ORMBudgetService(currency_catalog=CurrencyCatalog(), data_version_service=data_version_service)
+    operation_service = ORMOperationService(data_version_service=data_version_service)
+    category_service = ORMCategoryService(data_version_service=data_version_service)
+
+    operation_page = operation_service.get_operation_list(OperationFilters(), pagination, customer_entity)
+    budget_page = budget_service.get_budget_list(BudgetFilters(), pagination, customer_entity)
+    category_page = category_service.get_category_list(CategoryFilters(), pagination, customer_entity)
+    budget_entity, budget_operation_page = budget_service.get_budget_operation_list(
+        BudgetFilters(), PaginationIn(), budget.id, customer_entity
+    )
+
+    golden = {
+        '/api/v1/management/operations?limit=1': _render_legacy(
+            OperationSchema,
+            [OperationSchema.from_entity(entity=obj) for obj in operation_page.items],
+            operation_page,
+            pagination,
+            cursor=True
+        ),
+        '/api/v1/management/budgets?limit=1': _render_legacy(
+            BudgetSchema, [BudgetSchema.from_entity(entity=obj) for obj in budget_page.items], budget_page, pagination
+        ),
+        '/api/v1/management/categories?limit=1': _render_legacy(
+            CategorySchema,
+            [CategorySchema.from_entity(entity=obj) for obj in category_page.items],
+            category_page,
+            pagination
+        ),
+        f'/api/v1/management/budgets/{budget.id}/operations': _render_legacy(
+            BudgetOperationSchema,
+            [{'related_budget': budget_entity, 'related_operations': budget_operation_page.items}],
+            budget_operation_page,
+            PaginationIn(),
+            cursor=True
+        ),
+    }
+
+    for url, content in golden.items():
+        response = auth_client.get(url)
+
+        assert response.status_code == 200, f'{response.content=}'
+        assert response.content == content, url
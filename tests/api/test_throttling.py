@@ -0,0 +1,51 @@
+import pytest
+from django.conf import settings
+from django.test import Client, RequestFactory
+from prometheus_client import REGISTRY
+
+from core.api.throttling import PhoneThrottle, parse_rate
+
+
+@pytest.mark.django_db
+def test_auth_is_throttled_per_phone_before_queries(client: Client, django_assert_num_queries):
+    """
+    Test requesting codes for one phone beyond its bucket is rejected with 429 without queries.
+    :param client:
+    :param django_assert_num_queries:
+    :return:
+    """
+    url = '/api/v1/customers/auth'
+    payload = {'phone': '+380501234567', 'username': 'throttled'}
+    requests, _ = parse_rate(settings.API_THROTTLE_RATES['auth_phone'])
+    labels = {'scope': 'auth_phone'}
+    rejected = REGISTRY.get_sample_value('api_throttled_requests_total', labels) or 0
+
+    for _ in range(requests):
+        response = client.post(url, payload, content_type='application/json')
+        assert response.status_code == 200, f'{response.content=}'
+
+    with django_assert_num_queries(0):
+        response = client.post(url, payload, content_type='application/json')
+    assert response.status_code == 429, f'{response.status_code=}'
+    assert int(response['Retry-After']) > 0, f'{response.headers=}'
+    assert REGISTRY.get_sample_value('api_throttled_requests_total', labels) == rejected + 1
+
+    response = client.post(url, {**payload, 'phone': '+380507654321'}, content_type='application/json')
+    assert response.status_code == 200, f'{response.content=}'
+
+
+def test_throttle_returns_wait_of_each_request(rf: RequestFactory):
+    """
+    Test the wait of a rejected request is returned to it, not kept on the throttle shared by all requests.
+    :param rf:
+    :return:
+    """
+    throttle = PhoneThrottle('phone_wait', rate='1/h')
+
+    def take_token(phone: str):
+        return throttle.take_token(rf.post('/', {'phone': phone}, content_type='application/json'))
+
+    assert take_token('+380500000001') is None
+    assert 0 < take_token('+380500000001') <= 3600
+    assert take_token('+380500000002') is None
+    assert not hasattr(throttle, '_wait')
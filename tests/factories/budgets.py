@@ -1,7 +1,10 @@
+from decimal import Decimal
+
 from factory.django import DjangoModelFactory
 import factory
 
-from core.apps.budgets.models import Currency
+from core.apps.budgets.models import Currency, Budget
+from tests.factories.customers import CustomerModelFactory
 
 
 class CurrencyModelFactory(DjangoModelFactory):
@@ -12,3 +15,13 @@ class CurrencyModelFactory(DjangoModelFactory):
     class Meta:
         model = Currency
 
+
+class BudgetModelFactory(DjangoModelFactory):
+    title = factory.Faker('word')
+    initial_amount = Decimal('0')
+    current_balance = factory.SelfAttribute('initial_amount')
+    related_currency = factory.SubFactory(CurrencyModelFactory)
+    related_customer = factory.SubFactory(CustomerModelFactory)
+
+    class Meta:
+        model = Budget
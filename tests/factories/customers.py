@@ -0,0 +1,12 @@
+from factory.django import DjangoModelFactory
+import factory
+
+from core.apps.customers.models import Customer
+
+
+class CustomerModelFactory(DjangoModelFactory):
+    username = factory.Faker('user_name')
+    phone = factory.Sequence(lambda n: f'380{n:09d}')
+
+    class Meta:
+        model = Customer
@@ -0,0 +1,30 @@
+from decimal import Decimal
+
+from factory.django import DjangoModelFactory
+import factory
+
+from core.apps.budgets.models import Category, Operation
+from tests.factories.budgets import BudgetModelFactory
+from tests.factories.customers import CustomerModelFactory
+
+
+class CategoryModelFactory(DjangoModelFactory):
+    name = factory.Faker('word')
+    related_customer = factory.SubFactory(CustomerModelFactory)
+
+    class Meta:
+        model = Category
+
+
+class OperationModelFactory(DjangoModelFactory):
+    title = factory.Faker('sentence', nb_words=3)
+    operation_type = Operation.OperationType.ADD
+    amount = Decimal('10.00')
+    related_budget = factory.SubFactory(BudgetModelFactory)
+    related_category = factory.SubFactory(
+        CategoryModelFactory,
+        related_customer=factory.SelfAttribute('..related_budget.related_customer')
+    )
+
+    class Meta:
+        model = Operation
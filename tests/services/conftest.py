@@ -1,7 +1,21 @@
 import pytest
-from core.api.v1.budget_management.services.budgets import BaseCurrencyService, ORMCurrencyService
+from core.apps.budgets.services.budgets import BaseCurrencyService, CatalogCurrencyService
+from core.apps.budgets.services.catalogs import CurrencyCatalog
+from core.apps.budgets.services.operations import BaseOperationService, ORMOperationService
+from core.apps.budgets.services.reports import BaseReportService, ORMReportService
+from core.apps.customers.services.versions import DjangoCacheDataVersionService
 
 
 @pytest.fixture()
 def currency_service() -> BaseCurrencyService:
-    return ORMCurrencyService()
+    return CatalogCurrencyService(currency_catalog=CurrencyCatalog())
+
+
+@pytest.fixture()
+def operation_service() -> BaseOperationService:
+    return ORMOperationService(data_version_service=DjangoCacheDataVersionService())
+
+
+@pytest.fixture()
+def report_service() -> BaseReportService:
+    return ORMReportService()
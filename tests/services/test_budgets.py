@@ -1,8 +1,10 @@
 import pytest
+from django.core.cache import cache
 
 from core.api.filters import PaginationIn
 from core.api.v1.budget_management.filters import CurrencyFilters
-from core.api.v1.budget_management.services.budgets import BaseCurrencyService
+from core.apps.budgets.services.budgets import BaseCurrencyService, CatalogCurrencyService
+from core.apps.budgets.services.catalogs import CurrencyCatalog
 from tests.factories.budgets import CurrencyModelFactory
 
 
@@ -46,7 +48,7 @@ def test_get_currencies_all(currency_service: BaseCurrencyService):
     currency_short_names = {currency.short_name for currency in currencies}
     currency_symbols = {currency.symbol for currency in currencies}
 
-    fetched_currencies = currency_service.get_currency_list(CurrencyFilters(), PaginationIn())
+    fetched_currencies = currency_service.get_currency_list(CurrencyFilters(), PaginationIn()).items
     fetched_names = {currency.name for currency in fetched_currencies}
     fetched_short_names = {currency.short_name for currency in fetched_currencies}
     fetched_symbols = {currency.symbol for currency in fetched_currencies}
@@ -58,3 +60,52 @@ def test_get_currencies_all(currency_service: BaseCurrencyService):
     assert currency_names == fetched_names, f'Generated names: {currency_names=}\nFetched names: {fetched_names=}'
     assert currency_short_names == fetched_short_names, f'Generated short_names: {currency_short_names=}\nFetched short_names: {fetched_short_names=}'
     assert currency_symbols == fetched_symbols, f'Generated symbols: {currency_symbols=}\nFetched symbols: {fetched_symbols=}'
+
+
+@pytest.mark.django_db
+def test_currency_catalog_serves_from_memory(django_assert_num_queries):
+    """
+    Test currencies are queried once per catalog and reloaded by every catalog after invalidation.
+    :param django_assert_num_queries:
+    :return:
+    """
+
+    currency = CurrencyModelFactory.create(short_name='EUR', name='Euro')
+    currency_service = CatalogCurrencyService(currency_catalog=CurrencyCatalog(check_interval=0))
+    other_worker_catalog = CurrencyCatalog(check_interval=0)
+    currency_service.get_currency_by_short_name('eur')
+    other_worker_catalog.get_currencies()
+
+    with django_assert_num_queries(0):
+        assert currency_service.get_currency_by_short_name('EUR').id == currency.id
+        assert currency_service.get_currency_list(CurrencyFilters(search='eur'), PaginationIn()).total == 1
+
+    CurrencyModelFactory.create(short_name='GBP', name='Pound sterling')
+    currency_service.currency_catalog.invalidate()
+
+    with django_assert_num_queries(1):
+        assert currency_service.get_currency_count(CurrencyFilters()) == 2
+    assert len(other_worker_catalog.get_currencies()) == 2
+
+
+@pytest.mark.django_db
+def test_currency_catalog_reloads_when_version_expires():
+    """
+    Test a change that was never invalidated reaches every catalog once the shared version expires.
+    :return:
+    """
+    CurrencyModelFactory.create(short_name='EUR', name='Euro')
+    catalog, other_worker_catalog = CurrencyCatalog(check_interval=0), CurrencyCatalog(check_interval=0)
+    catalog.get_currencies()
+    other_worker_catalog.get_currencies()
+    version = catalog.version
+
+    CurrencyModelFactory.create(short_name='GBP', name='Pound sterling')
+    assert len(catalog.get_currencies()) == 1
+
+    # What the cache does once the version is older than max_age.
+    cache.delete(CurrencyCatalog.VERSION_CACHE_KEY)
+
+    assert len(catalog.get_currencies()) == 2
+    assert len(other_worker_catalog.get_currencies()) == 2
+    assert catalog.version == other_worker_catalog.version != version, f'{catalog.version=}'
@@ -0,0 +1,22 @@
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+
+from core.apps.common.caches import check_shared_cache
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+REDIS_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://redis'}}
+
+
+def test_process_local_cache_is_rejected_for_several_workers():
+    """
+    Test several workers are refused a local-memory default cache, a single worker or a shared cache are not.
+    :return:
+    """
+    with override_settings(CACHES=LOCMEM_CACHES):
+        check_shared_cache(processes=1)
+        with pytest.raises(ImproperlyConfigured):
+            check_shared_cache(processes=2)
+
+    with override_settings(CACHES=REDIS_CACHES):
+        check_shared_cache(processes=4)
@@ -0,0 +1,52 @@
+import pytest
+
+from core.apps.customers.exceptions.tokens import InvalidTokenException, TokenRevokedException
+from core.apps.customers.services.customers import ORMCustomerService
+from core.apps.customers.services.tokens import JWTTokenService
+from core.apps.customers.services.versions import DjangoCacheDataVersionService
+from tests.factories.customers import CustomerModelFactory
+
+
+@pytest.fixture()
+def customer_service() -> ORMCustomerService:
+    return ORMCustomerService(token_service=JWTTokenService(), data_version_service=DjangoCacheDataVersionService())
+
+
+@pytest.mark.django_db
+def test_access_token_verified_without_queries(customer_service: ORMCustomerService, django_assert_num_queries):
+    """
+    Test access token resolves to the issued customer entity in memory and is rejected as a refresh token.
+    :param customer_service:
+    :param django_assert_num_queries:
+    :return:
+    """
+
+    customer = CustomerModelFactory.create().to_entity()
+    tokens = customer_service.generate_token(customer=customer)
+
+    with django_assert_num_queries(0):
+        authenticated = customer_service.token_service.get_customer(access_token=tokens.access_token)
+
+    assert authenticated == customer, f'{authenticated=}'
+
+    with pytest.raises(InvalidTokenException):
+        customer_service.refresh_token(refresh_token=tokens.access_token)
+
+
+@pytest.mark.django_db
+def test_refresh_token_revoked(customer_service: ORMCustomerService):
+    """
+    Test refresh token rotates tokens until customer tokens are revoked.
+    :param customer_service:
+    :return:
+    """
+
+    customer = CustomerModelFactory.create().to_entity()
+    tokens = customer_service.generate_token(customer=customer)
+
+    refreshed = customer_service.refresh_token(refresh_token=tokens.refresh_token)
+    assert customer_service.token_service.get_customer(access_token=refreshed.access_token).id == customer.id
+
+    customer_service.revoke_tokens(customer=customer)
+    with pytest.raises(TokenRevokedException):
+        customer_service.refresh_token(refresh_token=refreshed.refresh_token)
@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+import pytest
+
+from core.apps.common import databases
+from core.apps.common.databases import ConnectionPoolStats, get_connection_pool_stats
+
+
+class FakePool:
+    def __init__(self, closed: bool):
+        self.closed = closed
+
+    def get_stats(self) -> dict:
+        return {'pool_min': 2, 'pool_max': 10, 'pool_size': 2, 'pool_available': 2}
+
+
+def test_connection_pool_stats_from_pool_stats():
+    """
+    Test psycopg pool stats are read into in-use, idle and wait time figures, missing counters as zero.
+    :return:
+    """
+    stats = ConnectionPoolStats.from_pool_stats('default', {
+        'pool_min': 2,
+        'pool_max': 10,
+        'pool_size': 4,
+        'pool_available': 1,
+        'requests_num': 8,
+        'requests_wait_ms': 20,
+    })
+
+    assert (stats.in_use, stats.idle, stats.waiting) == (3, 1, 0), f'{stats=}'
+    assert stats.average_wait_ms == 2.5, f'{stats=}'
+    assert stats.errors == 0, f'{stats=}'
+
+
+def test_connection_pool_stats_skip_unpooled_and_unopened(monkeypatch: pytest.MonkeyPatch):
+    """
+    Test only pools that were opened are reported, connections without a pool and pools not opened yet are skipped.
+    :param monkeypatch:
+    :return:
+    """
+    monkeypatch.setattr(databases, 'connections', {
+        'default': SimpleNamespace(pool=FakePool(closed=False)),
+        'replica': SimpleNamespace(pool=FakePool(closed=True)),
+        'sqlite': SimpleNamespace(),
+    })
+
+    assert [stats.alias for stats in get_connection_pool_stats()] == ['default']
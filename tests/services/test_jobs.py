@@ -0,0 +1,78 @@
+import pytest
+from django.utils import timezone
+
+from core.apps.customers.entities.customers import Customer as CustomerEntity
+from core.apps.customers.services.auth import BaseAuthService
+from core.apps.customers.services.senders import BaseSenderService
+from core.apps.jobs.models import Job
+from core.apps.jobs.services.jobs import ORMJobService
+from core.apps.jobs.services.workers import ORMJobWorker
+from core.project.ioc_containers import get_ioc_container
+
+
+class FakeSenderService(BaseSenderService):
+    def __init__(self):
+        self.sent: list[tuple[str, str]] = []
+
+    def send_code(self, customer: CustomerEntity, code: str) -> None:
+        self.sent.append((customer.phone, code))
+
+
+def fail_job(payload: dict) -> None:
+    raise ConnectionError(payload['reason'])
+
+
+@pytest.fixture()
+def fake_sender() -> FakeSenderService:
+    sender = FakeSenderService()
+    get_ioc_container().register(BaseSenderService, instance=sender)
+    yield sender
+    get_ioc_container.cache_clear()
+
+
+@pytest.mark.django_db
+def test_authorize_queues_code_for_worker(fake_sender: FakeSenderService):
+    """
+    Test authorization only queues the delivery and a worker sends the code from the code service.
+    :param fake_sender:
+    :return:
+    """
+    auth_service = get_ioc_container().resolve(BaseAuthService)
+
+    auth_service.authorize(phone='380501234567', username='john')
+    assert fake_sender.sent == [], f'{fake_sender.sent=}'
+    assert Job.objects.get().payload == {'phone': '380501234567'}, 'the code must not be stored with the job'
+
+    result = ORMJobWorker().run_batch()
+
+    assert (result.done, result.retried, result.failed) == (1, 0, 0), f'{result=}'
+    assert fake_sender.sent == [('380501234567', '000000')], f'{fake_sender.sent=}'
+    assert not Job.objects.exists()
+
+
+@pytest.mark.django_db
+def test_failed_jobs_are_retried_with_backoff(settings):
+    """
+    Test a failing job is postponed until it runs out of attempts and a job of unknown kind fails at once.
+    :param settings:
+    :return:
+    """
+    settings.JOB_HANDLERS = {'tests.fail': 'tests.services.test_jobs.fail_job'}
+    settings.JOB_MAX_ATTEMPTS = 2
+    ORMJobService().enqueue('tests.fail', {'reason': 'provider is down'})
+    ORMJobService().enqueue('tests.unknown', {})
+    worker = ORMJobWorker()
+
+    result = worker.run_batch()
+    job = Job.objects.get(kind='tests.fail')
+
+    assert (result.done, result.retried, result.failed) == (0, 1, 1), f'{result=}'
+    assert job.attempts == 1 and job.run_at > timezone.now(), f'{job.run_at=}'
+    assert job.last_error == 'ConnectionError: provider is down', f'{job.last_error=}'
+    assert worker.run_batch().total == 0
+
+    Job.objects.filter(id=job.id).update(run_at=timezone.now())
+    result = worker.run_batch()
+
+    assert result.failed == 1, f'{result=}'
+    assert set(Job.objects.values_list('status', flat=True)) == {Job.Status.FAILED}
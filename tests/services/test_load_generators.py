@@ -0,0 +1,32 @@
+from datetime import date
+
+from core.apps.budgets.loadtests.generators import (
+    generate_customer_rows, generate_operation_chunk, get_day_weights, init_operation_worker, parse_copy_rows,
+    plan_operation_chunks, split_count
+)
+
+
+def test_operation_chunks_are_deterministic_and_time_ordered():
+    """
+    Test seeded operations are split into chunks covering every day, and that a chunk is the same on every run,
+    with rows in creation order.
+    :return:
+    """
+    first_day = date(2025, 1, 1)
+    day_counts = split_count(1000, get_day_weights(first_day, 30))
+    chunks = plan_operation_chunks(day_counts, chunk_size=300)
+
+    assert sum(day_counts) == 1000, f'{day_counts=}'
+    assert [chunk.size for chunk in chunks] == [300, 300, 300, 100], f'{chunks=}'
+
+    rows = generate_customer_rows(
+        seed=1, customers=10, budgets=5, categories=8, currency_ids=[1], first_ids=(1, 1, 1), first_day=first_day
+    )
+    init_operation_worker(rows.plan)
+    buffer = generate_operation_chunk(chunks[1])
+
+    assert buffer == generate_operation_chunk(chunks[1]), 'chunks differ between runs'
+    operations = parse_copy_rows(buffer)
+    created_at = [operation[5] for operation in operations]
+    assert len(operations) == 300 and created_at == sorted(created_at), f'{created_at=}'
+    assert {operation[3] for operation in operations} <= {str(budget[0]) for budget in rows.budgets}
@@ -0,0 +1,191 @@
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from core.api.filters import PaginationIn, get_next_cursor
+from core.api.v1.budget_management.filters import OperationFilters
+from core.apps.budgets.entities.operations import NewOperation
+from core.apps.budgets.models import Budget, BudgetDailySummary
+from core.apps.budgets.services.operations import BaseOperationService
+from tests.factories.budgets import BudgetModelFactory
+from tests.factories.operations import CategoryModelFactory
+
+
+@pytest.mark.django_db
+def test_operation_writes_keep_budget_balance(operation_service: BaseOperationService):
+    """
+    Test materialized budget balance and counters follow operation create, update and delete.
+    :param operation_service:
+    :return:
+    """
+
+    budget = BudgetModelFactory.create(initial_amount=Decimal('100.00'))
+    customer = budget.related_customer.to_entity()
+
+    income = operation_service.create_operation(
+        title='Salary', operation_type='ADD', amount=Decimal('50.00'),
+        related_budget_id=budget.id, related_category_id=None, related_customer=customer
+    )
+    expense = operation_service.create_operation(
+        title='Food', operation_type='SUB', amount=Decimal('30.00'),
+        related_budget_id=budget.id, related_category_id=None, related_customer=customer
+    )
+    assert expense.related_budget.current_balance == Decimal('120.00'), f'{expense.related_budget=}'
+
+    operation_service.update_operation(
+        operation_id=income.id, title=None, operation_type='SUB', amount=Decimal('10.00'),
+        related_category_id=None, related_customer=customer
+    )
+    budget.refresh_from_db()
+    assert budget.current_balance == Decimal('60.00'), f'{budget.current_balance=}'
+    assert (budget.add_operations_count, budget.sub_operations_count) == (0, 2)
+
+    operation_service.delete_operation(operation_id=expense.id, related_customer=customer)
+    budget = Budget.objects.get(id=budget.id)
+    assert budget.current_balance == Decimal('90.00'), f'{budget.current_balance=}'
+    assert (budget.add_operations_count, budget.sub_operations_count) == (0, 1)
+
+
+@pytest.mark.django_db
+def test_operation_list_cursor_pagination(operation_service: BaseOperationService):
+    """
+    Test walking operations with a cursor returns every operation once, newest first, same as offset pages.
+    :param operation_service:
+    :return:
+    """
+
+    budget = BudgetModelFactory.create()
+    customer = budget.related_customer.to_entity()
+    for index in range(5):
+        operation_service.create_operation(
+            title=f'Operation {index}', operation_type='ADD', amount=Decimal('1.00'),
+            related_budget_id=budget.id, related_category_id=None, related_customer=customer
+        )
+
+    fetched_ids, cursor = [], None
+    while True:
+        page = operation_service.get_operation_list(
+            OperationFilters(), PaginationIn(limit=2, cursor=cursor), related_customer=customer
+        )
+        fetched_ids.extend(operation.id for operation in page.items)
+        cursor = get_next_cursor(page.items, limit=2)
+        if cursor is None:
+            break
+
+    offset_ids = [
+        operation.id for operation in
+        operation_service.get_operation_list(OperationFilters(), PaginationIn(limit=5), related_customer=customer).items
+    ]
+    assert fetched_ids == offset_ids, f'{fetched_ids=} {offset_ids=}'
+    assert len(set(fetched_ids)) == 5, f'{fetched_ids=}'
+
+
+@pytest.mark.django_db
+def test_operation_writes_keep_daily_summaries(operation_service: BaseOperationService):
+    """
+    Test daily summaries maintained by operation writes match a rebuild from operations.
+    :param operation_service:
+    :return:
+    """
+
+    budget = BudgetModelFactory.create()
+    customer = budget.related_customer.to_entity()
+    first_category, second_category = CategoryModelFactory.create_batch(2, related_customer=budget.related_customer)
+
+    operation = operation_service.create_operation(
+        title='Rent', operation_type='SUB', amount=Decimal('40.00'),
+        related_budget_id=budget.id, related_category_id=first_category.id, related_customer=customer
+    )
+    removed = operation_service.create_operation(
+        title='Gift', operation_type='ADD', amount=Decimal('15.00'),
+        related_budget_id=budget.id, related_category_id=None, related_customer=customer
+    )
+    operation_service.bulk_create_operations(
+        [
+            NewOperation(title=None, operation_type='ADD', amount=Decimal('5.00'),
+                         related_budget_id=budget.id, related_category_id=second_category.id)
+            for _ in range(3)
+        ],
+        related_customer=customer
+    )
+    operation_service.update_operation(
+        operation_id=operation.id, title=None, operation_type='ADD', amount=Decimal('25.00'),
+        related_category_id=second_category.id, related_customer=customer
+    )
+    operation_service.delete_operation(operation_id=removed.id, related_customer=customer)
+
+    def get_summaries() -> list[tuple]:
+        return list(BudgetDailySummary.objects.order_by('related_category_id', 'operation_type').values_list(
+            'related_category_id', 'operation_type', 'total_amount', 'operations_count'
+        ))
+
+    maintained = get_summaries()
+    assert maintained == [(second_category.id, 'ADD', Decimal('40.00'), 4)], f'{maintained=}'
+
+    call_command('rebuild_budget_daily_summaries', stdout=StringIO())
+    assert get_summaries() == maintained, f'{get_summaries()=}'
+
+
+@pytest.mark.django_db
+def test_operation_search_matches_related_names(operation_service: BaseOperationService):
+    """
+    Test operation search matches titles, operation types, budget titles and category names.
+    :param operation_service:
+    :return:
+    """
+
+    budget = BudgetModelFactory.create(title='Vacation fund')
+    customer = budget.related_customer.to_entity()
+    category = CategoryModelFactory.create(name='Groceries', related_customer=budget.related_customer)
+    income = operation_service.create_operation(
+        title='Salary', operation_type='ADD', amount=Decimal('10.00'),
+        related_budget_id=budget.id, related_category_id=None, related_customer=customer
+    )
+    expense = operation_service.create_operation(
+        title='Market', operation_type='SUB', amount=Decimal('5.00'),
+        related_budget_id=budget.id, related_category_id=category.id, related_customer=customer
+    )
+
+    def search(value: str) -> set[int]:
+        operations = operation_service.get_operation_list(
+            OperationFilters(search=value), PaginationIn(limit=10), related_customer=customer
+        )
+        return {operation.id for operation in operations.items}
+
+    assert search('salary') == {income.id}
+    assert search('sub') == {expense.id}
+    assert search('grocer') == {expense.id}
+    assert search('vacation') == {income.id, expense.id}
+
+
+@pytest.mark.django_db
+def test_operation_list_totals(operation_service: BaseOperationService):
+    """
+    Test operation pages report the same total from counters, window counts and fallback counts,
+    and report has_more instead of a total when asked to.
+    :param operation_service:
+    :return:
+    """
+
+    budget = BudgetModelFactory.create()
+    customer = budget.related_customer.to_entity()
+    for operation_type in ('ADD', 'ADD', 'SUB'):
+        operation_service.create_operation(
+            title='Operation', operation_type=operation_type, amount=Decimal('1.00'),
+            related_budget_id=budget.id, related_category_id=None, related_customer=customer
+        )
+
+    def get_page(search: str | None = None, **pagination):
+        return operation_service.get_operation_list(
+            OperationFilters(search=search), PaginationIn(**pagination), related_customer=customer
+        )
+
+    assert get_page(limit=2).total == 3
+    assert get_page(search='add', limit=1).total == 2
+    assert get_page(search='add', offset=5).total == 2
+
+    page = get_page(limit=2, has_more=True)
+    assert (len(page.items), page.total, page.has_more) == (2, None, True), f'{page=}'
+    assert get_page(offset=1, limit=2, has_more=True).has_more is False
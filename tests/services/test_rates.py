@@ -0,0 +1,82 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+
+from core.api.v1.budget_management.filters import ConsolidationFilters
+from core.apps.budgets.exceptions.rates import ExchangeRateNotFoundException
+from core.apps.budgets.models import Operation
+from core.apps.budgets.services.catalogs import CurrencyCatalog
+from core.apps.budgets.services.consolidation import ORMConsolidationService
+from core.apps.budgets.services.rates import (
+    CurrencyConverter, ExchangeRateCatalog, ExchangeRateSnapshot, RateHistory, to_scaled_rate
+)
+from tests.factories.budgets import BudgetModelFactory, CurrencyModelFactory
+from tests.factories.customers import CustomerModelFactory
+from tests.factories.operations import OperationModelFactory
+
+
+@pytest.mark.django_db
+def test_consolidated_totals_convert_at_rates_of_the_day(tmp_path: Path):
+    """
+    Test loaded rates convert balances at the latest rate and operations at the rate effective on their day.
+    :param tmp_path:
+    :return:
+    """
+    usd = CurrencyModelFactory.create(short_name='USD')
+    eur = CurrencyModelFactory.create(short_name='EUR')
+    uah = CurrencyModelFactory.create(short_name='UAH')
+    rates_file = tmp_path / 'rates.csv'
+    rates_file.write_text('day,currency,rate\n2024-01-01,EUR,1.10\n2024-02-01,eur,1.20\n2024-01-01,UAH,0.025\n')
+    call_command('load_exchange_rates', str(rates_file), stdout=StringIO())
+
+    customer = CustomerModelFactory.create()
+    eur_budget = BudgetModelFactory.create(related_customer=customer, related_currency=eur, current_balance=Decimal('100.00'))
+    uah_budget = BudgetModelFactory.create(related_customer=customer, related_currency=uah, current_balance=Decimal('400.00'))
+    for budget, amount, created_at in (
+            (eur_budget, '10.00', datetime(2024, 1, 15, tzinfo=timezone.utc)),
+            (eur_budget, '10.00', datetime(2024, 2, 15, tzinfo=timezone.utc)),
+            (uah_budget, '40.00', datetime(2024, 2, 15, tzinfo=timezone.utc)),
+    ):
+        operation = OperationModelFactory.create(related_budget=budget, related_category=None, amount=Decimal(amount))
+        Operation.objects.filter(id=operation.id).update(created_at=created_at)
+    call_command('rebuild_budget_daily_summaries', stdout=StringIO())
+
+    service = ORMConsolidationService(currency_catalog=CurrencyCatalog(), exchange_rate_catalog=ExchangeRateCatalog())
+    totals = service.get_consolidated_totals(ConsolidationFilters(currency='usd'), customer.to_entity())
+
+    assert totals.currency == usd.short_name
+    assert totals.balance == Decimal('130.00'), f'{totals=}'
+    assert totals.add_total == Decimal('24.00'), f'{totals=}'
+    assert totals.sub_total == Decimal('0.00'), f'{totals=}'
+    assert (totals.budgets_count, totals.operations_count) == (2, 3), f'{totals=}'
+
+    february = service.get_consolidated_totals(
+        ConsolidationFilters(currency='EUR', date_from=date(2024, 2, 1)), customer.to_entity()
+    )
+    assert february.add_total == Decimal('10.83'), f'{february=}'
+
+    BudgetModelFactory.create(related_customer=customer, related_currency=CurrencyModelFactory.create(short_name='PLN'))
+    with pytest.raises(ExchangeRateNotFoundException):
+        service.get_consolidated_totals(ConsolidationFilters(currency='USD'), customer.to_entity())
+
+
+def test_conversions_are_exact_and_round_half_to_even():
+    """
+    Test amounts are converted without binary floating point error and ties round to the even cent.
+    :return:
+    """
+    day = date(2024, 1, 1)
+    converter = CurrencyConverter(ExchangeRateSnapshot(
+        base_currency_id=1,
+        histories={2: RateHistory(days=[day.toordinal()], rates=[to_scaled_rate(Decimal('0.5'))])},
+    ))
+
+    assert converter.convert_sum([(2, day, Decimal('0.01'))], target_currency_id=1) == Decimal('0.00')
+    assert converter.convert_sum([(2, day, Decimal('0.03'))], target_currency_id=1) == Decimal('0.02')
+    assert converter.convert_sum([(1, day, Decimal('1.15'))], target_currency_id=2) == Decimal('2.30')
+    # Each amount is rounded before the sum: 0.035 three times is 0.04 each.
+    assert converter.convert_sum([(2, day, Decimal('0.07'))] * 3, target_currency_id=1) == Decimal('0.12')
@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from core.api.v1.budget_management.filters import OperationFilters, ReportFilters
+from core.apps.budgets.models import Operation
+from core.apps.budgets.services.reports import BaseReportService
+from tests.factories.budgets import BudgetModelFactory
+from tests.factories.operations import CategoryModelFactory, OperationModelFactory
+
+
+@pytest.mark.django_db
+def test_reports_group_in_database(report_service: BaseReportService):
+    """
+    Test reports aggregate totals per category and type and cut periods in the requested timezone.
+    :param report_service:
+    :return:
+    """
+
+    budget = BudgetModelFactory.create()
+    customer = budget.related_customer.to_entity()
+    category = CategoryModelFactory.create(related_customer=budget.related_customer)
+    for amount in ('10.00', '30.00'):
+        OperationModelFactory.create(related_budget=budget, related_category=category, amount=Decimal(amount))
+    late_operation = OperationModelFactory.create(
+        related_budget=budget, related_category=category, operation_type='SUB', amount=Decimal('5.00')
+    )
+    # 23:30 UTC on the last day of January is already February in Moscow.
+    Operation.objects.filter(id=late_operation.id).update(created_at=datetime(2024, 1, 31, 23, 30, tzinfo=timezone.utc))
+    OperationModelFactory.create(amount=Decimal('99.00'))
+    call_command('rebuild_budget_daily_summaries', stdout=StringIO())
+
+    type_report = report_service.get_operation_type_report(OperationFilters(), ReportFilters(), customer)
+    assert [(row.operation_type, row.total_amount, row.operations_count) for row in type_report] == [
+        ('ADD', Decimal('40.00'), 2), ('SUB', Decimal('5.00'), 1)
+    ], f'{type_report=}'
+
+    category_report = report_service.get_category_report(OperationFilters(), ReportFilters(), customer)
+    assert category_report[0].category_id == category.id, f'{category_report=}'
+    assert category_report[0].average_amount == Decimal('20.00'), f'{category_report=}'
+
+    period_report = report_service.get_period_report(
+        OperationFilters(), ReportFilters(timezone='Europe/Moscow', date_to=datetime(2024, 3, 1, tzinfo=timezone.utc)),
+        period='month', related_customer=customer
+    )
+    assert len(period_report) == 1, f'{period_report=}'
+    assert (period_report[0].period_start.year, period_report[0].period_start.month) == (2024, 2), f'{period_report=}'
+
+    summary_period_report = report_service.get_period_report(
+        OperationFilters(), ReportFilters(date_to=datetime(2024, 3, 1, tzinfo=timezone.utc)),
+        period='month', related_customer=customer
+    )
+    assert [(row.period_start.month, row.total_amount) for row in summary_period_report] == [
+        (1, Decimal('5.00'))
+    ], f'{summary_period_report=}'
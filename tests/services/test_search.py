@@ -0,0 +1,95 @@
+from importlib import import_module
+
+import pytest
+from django.db import connection
+from django.db.migrations.state import ProjectState
+
+from core.api.filters import PaginationIn
+from core.api.v1.budget_management.filters import BudgetFilters, CategoryFilters
+from core.apps.budgets.models import Budget, Category, Operation
+from core.apps.budgets.services.budgets import BaseBudgetService
+from core.apps.budgets.services.operations import BaseCategoryService
+from core.apps.customers.models import Customer
+from core.project.ioc_containers import get_ioc_container
+from tests.factories.budgets import BudgetModelFactory, CurrencyModelFactory
+from tests.factories.customers import CustomerModelFactory
+from tests.factories.operations import CategoryModelFactory
+
+requires_postgresql = pytest.mark.skipif(
+    connection.vendor != 'postgresql', reason='Trigram search and its indexes need PostgreSQL with pg_trgm.'
+)
+
+# Word similarity to 'rent': a whole word, a word it starts, and a word it only shares trigrams with.
+RANKED_NAMES = ['Rent', 'Rental', 'Parents']
+
+TRIGRAM_MIGRATION = '0011_search_trigram_indexes'
+
+
+@pytest.fixture()
+def trigram_migration(db):
+    """
+    Apply the trigram migration, which runs even when the test database is built without migrations.
+    Its statements are idempotent, so a migrated database is left as is.
+    """
+    module = import_module(f'core.apps.budgets.migrations.{TRIGRAM_MIGRATION}')
+
+    with connection.schema_editor() as schema_editor:
+        module.Migration(TRIGRAM_MIGRATION, 'budgets').apply(ProjectState(), schema_editor)
+
+    return module
+
+
+@requires_postgresql
+@pytest.mark.django_db
+@pytest.mark.usefixtures('trigram_migration')
+def test_budget_and_category_search_rank_best_match_first():
+    """
+    Test budget and category search lists an exact match before a partial one, and a fuzzy match last,
+    whatever the order the rows were created in.
+    :return:
+    """
+    customer: Customer = CustomerModelFactory.create()
+    currency = CurrencyModelFactory.create()
+
+    budgets = {
+        title: BudgetModelFactory.create(title=title, related_customer=customer, related_currency=currency)
+        for title in [*reversed(RANKED_NAMES), 'Savings']
+    }
+    categories = {
+        name: CategoryModelFactory.create(name=name, related_customer=customer)
+        for name in [*reversed(RANKED_NAMES), 'Savings']
+    }
+
+    ioc_container = get_ioc_container()
+    budget_page = ioc_container.resolve(BaseBudgetService).get_budget_list(
+        BudgetFilters(search='rent'), PaginationIn(limit=10), related_customer=customer.to_entity()
+    )
+    category_page = ioc_container.resolve(BaseCategoryService).get_category_list(
+        CategoryFilters(search='rent'), PaginationIn(limit=10), related_customer=customer.to_entity()
+    )
+
+    assert [budget.id for budget in budget_page.items] == [budgets[title].id for title in RANKED_NAMES]
+    assert [category.id for category in category_page.items] == [categories[name].id for name in RANKED_NAMES]
+
+
+@requires_postgresql
+@pytest.mark.django_db
+def test_trigram_migration_creates_gin_indexes_used_by_search(trigram_migration):
+    """
+    Test the trigram migration creates a GIN index per searched column, and the icontains lookups
+    of search are planned on them.
+    :param trigram_migration:
+    :return:
+    """
+    models = {model._meta.db_table: model for model in (Budget, Category, Operation)}
+
+    with connection.cursor() as cursor:
+        for table, column, name in trigram_migration.TRIGRAM_INDEXES:
+            constraints = connection.introspection.get_constraints(cursor, table)
+            assert name in constraints, f'{table=} {sorted(constraints)=}'
+            assert constraints[name]['type'] == 'gin', f'{constraints[name]=}'
+
+        cursor.execute('SET LOCAL enable_seqscan = off')
+        for table, column, name in trigram_migration.TRIGRAM_INDEXES:
+            plan = models[table].objects.filter(**{f'{column}__icontains': 'rent'}).explain()
+            assert name in plan, f'{plan=}'